@@ -0,0 +1,87 @@
+"""
+Benchmark comparing the cache backends using the CacheBackend interface on
+houses with many members
+
+Usage: python benchmarks/bench_cache_backends.py [-m MEMBERS] [-n LOOKUPS]
+"""
+import argparse
+import functools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from copy import deepcopy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import openhivenpy  # noqa: E402
+from openhivenpy.client import (ClientCache,  # noqa: E402
+                                SQLiteClientCache)
+
+TEST_DATA = os.path.join(
+    os.path.dirname(__file__), '..', 'pytest', 'test_data.json'
+)
+
+
+def create_house(members: int) -> dict:
+    """ Creates a HOUSE_JOIN payload with the passed amount of members """
+    with open(TEST_DATA, 'r', encoding='utf-8') as file:
+        house = json.load(file)['house_data']
+
+    template = house['members'][0]
+    for i in range(members):
+        member = deepcopy(template)
+        user_id = str(100000000000000000 + i)
+        member['user_id'] = member['id'] = member['user']['id'] = user_id
+        member['user']['username'] = member['user']['name'] = f'user{i}'
+        house['members'].append(member)
+    return house
+
+
+def run(name: str, backend, house: dict, lookups: int) -> None:
+    client = openhivenpy.HivenClient(cache_backend=backend)
+    cache = client.storage
+    cache.update_client_user(deepcopy(house['members'][0]['user']))
+
+    start = time.perf_counter()
+    cache.add_or_update_house(deepcopy(house))
+    cache.commit()
+    add = time.perf_counter() - start
+
+    ids = [m['user']['id'] for m in house['members']]
+    sample = [random.choice(ids) for _ in range(lookups)]
+
+    start = time.perf_counter()
+    for id_ in sample:
+        cache.lookup_user(id_)
+        cache.lookup_house_member(id_, house['id'])
+    lookup = time.perf_counter() - start
+
+    print(f"{name:<16} {add * 1000:>12,.1f} {lookups / lookup:>16,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-m', '--members', type=int, default=10000)
+    parser.add_argument('-n', '--lookups', type=int, default=20000)
+    args = parser.parse_args()
+
+    house = create_house(args.members)
+    print(f"{'backend':<16} {'add house ms':>12} {'lookups/s':>16}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            'memory': ClientCache,
+            'sqlite-memory': SQLiteClientCache,
+            'sqlite-file': functools.partial(
+                SQLiteClientCache, path=os.path.join(tmp, 'cache.db')
+            )
+        }
+        for name, backend in backends.items():
+            run(name, backend, house, args.lookups)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark measuring the time it takes to import openhivenpy and to initialise
+the first HivenClient in a new process, which loads the environment
+
+Usage: python benchmarks/bench_import.py [-n RUNS] [--cwd DIRECTORY]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import openhivenpy
+imported = time.perf_counter()
+openhivenpy.HivenClient()
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def run(cwd: str) -> tuple:
+    """ Imports openhivenpy in a new process and returns the timings """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT], cwd=cwd, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[-2]), float(output[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--runs', type=int, default=10)
+    parser.add_argument(
+        '--cwd', default=os.path.dirname(os.path.abspath(__file__)),
+        help="Working directory of the processes, which is searched for "
+             ".env files"
+    )
+    args = parser.parse_args()
+
+    timings = [run(args.cwd) for _ in range(args.runs)]
+    print(f"{'step':<14} {'median ms':>12} {'min ms':>12}")
+    for name, values in (('import', [t[0] for t in timings]),
+                         ('first client', [t[1] for t in timings])):
+        print(f"{name:<14} {statistics.median(values) * 1000:>12,.1f} "
+              f"{min(values) * 1000:>12,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark comparing the decode and encode throughput of the available JSON
+codecs on a HOUSE_JOIN and a MESSAGE_CREATE WebSocket message
+
+Usage: python benchmarks/bench_json_codec.py [-n ITERATIONS]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from openhivenpy.json_codec import (available_json_codecs,  # noqa: E402
+                                    get_json_codec)
+
+TEST_DATA = os.path.join(
+    os.path.dirname(__file__), '..', 'pytest', 'test_data.json'
+)
+
+
+def load_messages() -> dict:
+    """ Creates the raw WebSocket messages used for the benchmark """
+    with open(TEST_DATA, 'r', encoding='utf-8') as file:
+        test_data = json.load(file)
+
+    house = test_data['house_data']
+    message = {
+        "id": "184828177845489664",
+        "author_id": "175697072878514176",
+        "room_id": "178648219307229056",
+        "house_id": house['id'],
+        "content": "Hello there! :)",
+        "timestamp": 1618250574000,
+        "mentions": [],
+        "attachment": None,
+        "embed": None,
+        "bucket": 0,
+        "device_id": "178648219307229057",
+        "exploding": None,
+        "exploding_age": None
+    }
+    return {
+        'HOUSE_JOIN': json.dumps({"op": 0, "e": "HOUSE_JOIN", "d": house}),
+        'MESSAGE_CREATE': json.dumps(
+            {"op": 0, "e": "MESSAGE_CREATE", "d": message}
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    messages = load_messages()
+    print(f"{'codec':<8} {'message':<16} {'decode msg/s':>14} "
+          f"{'encode msg/s':>14}")
+
+    for name in available_json_codecs():
+        codec = get_json_codec(name)
+        for event, raw in messages.items():
+            raw_bytes = raw.encode('utf-8')
+            obj = codec.loads(raw_bytes)
+
+            decode = timeit.timeit(
+                lambda: codec.loads(raw_bytes), number=args.iterations
+            )
+            encode = timeit.timeit(
+                lambda: codec.dumps(obj), number=args.iterations
+            )
+            print(f"{name:<8} {event:<16} "
+                  f"{args.iterations / decode:>14,.0f} "
+                  f"{args.iterations / encode:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
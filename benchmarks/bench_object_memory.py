@@ -0,0 +1,97 @@
+"""
+Benchmark measuring the memory used per instance of the most common types
+and the time it takes to create them
+
+Usage: python benchmarks/bench_object_memory.py [-n INSTANCES]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import openhivenpy  # noqa: E402
+from openhivenpy import types  # noqa: E402
+
+TEST_DATA = os.path.join(
+    os.path.dirname(__file__), '..', 'pytest', 'test_data.json'
+)
+
+
+def create_client() -> openhivenpy.HivenClient:
+    """ Creates a client with a cached house of the test data """
+    with open(TEST_DATA, 'r', encoding='utf-8') as file:
+        house = json.load(file)['house_data']
+
+    client = openhivenpy.HivenClient()
+    client.storage.update_client_user(deepcopy(house['members'][0]['user']))
+    client.storage.add_or_update_house(house)
+    return client
+
+
+def measure(name: str, create, instances: int) -> None:
+    # Creating one instance first to exclude lazily initialised module data
+    create()
+
+    tracemalloc.start()
+    start_mem = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    objects = [create() for _ in range(instances)]
+    elapsed = time.perf_counter() - start
+    end_mem = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(
+        stat.size_diff for stat in end_mem.compare_to(start_mem, 'filename')
+    )
+    # The list holding the objects is not part of the instances
+    size -= sys.getsizeof(objects)
+    print(f"{name:<10} {size / instances:>12,.0f} "
+          f"{elapsed / instances * 1e6:>12,.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--instances', type=int, default=10000)
+    args = parser.parse_args()
+
+    client = create_client()
+    house_id = client.house_ids[0]
+    user_id = client.storage.get_client_user()['id']
+    room_id = client.storage.get_house_room_ids(house_id)[0]
+
+    user = client.find_user(user_id)
+    member = client.find_house_member(user_id, house_id)
+    room = client.find_room(room_id)
+    house = client.find_house(house_id)
+    message = types.Message.format_obj_data({
+        "id": "184828177845489664",
+        "author_id": user_id,
+        "room_id": room_id,
+        "house_id": house_id,
+        "content": "Hello there! :)",
+        "timestamp": 1618250574000,
+        "mentions": [],
+        "attachment": None,
+        "embed": None,
+        "bucket": 0,
+        "device_id": "178648219307229057",
+        "exploding": None,
+        "exploding_age": None,
+        "author": deepcopy(user)
+    })
+
+    print(f"{'type':<10} {'bytes/obj':>12} {'us/obj':>12}")
+    measure('User', lambda: types.User(user, client), args.instances)
+    measure('Member', lambda: types.Member(member, client), args.instances)
+    measure('TextRoom', lambda: types.TextRoom(room, client), args.instances)
+    measure('House', lambda: types.House(house, client), args.instances)
+    measure('Message', lambda: types.Message(message, client), args.instances)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark comparing the time it takes to load the houses of an INIT_STATE
+into the cache after a restart of the WebSocket using the full HOUSE_JOIN
+data and using the HouseReconciler
+
+Usage: python benchmarks/bench_reconnect.py [-H HOUSES] [-m MEMBERS]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from copy import deepcopy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import openhivenpy  # noqa: E402
+from openhivenpy.gateway import HouseReconciler  # noqa: E402
+
+TEST_DATA = os.path.join(
+    os.path.dirname(__file__), '..', 'pytest', 'test_data.json'
+)
+
+
+def create_houses(houses: int, members: int) -> list:
+    """ Creates HOUSE_JOIN payloads with the passed amount of members """
+    with open(TEST_DATA, 'r', encoding='utf-8') as file:
+        template = json.load(file)['house_data']
+
+    result = []
+    for h in range(houses):
+        house = deepcopy(template)
+        house['id'] = str(200000000000000000 + h)
+        house['rooms'][0]['id'] = str(300000000000000000 + h)
+        house['entities'][0]['id'] = str(400000000000000000 + h)
+        for i in range(members):
+            member = deepcopy(template['members'][0])
+            user_id = str(100000000000000000 + i)
+            member['user_id'] = member['user']['id'] = user_id
+            member['user']['username'] = member['user']['name'] = f'user{i}'
+            house['members'].append(member)
+        result.append(house)
+    return result
+
+
+async def load(client, houses: list, reconciler=None) -> float:
+    """ Loads the houses and returns the elapsed time """
+    payloads = deepcopy(houses)
+    start = time.perf_counter()
+    for house in payloads:
+        if reconciler is None:
+            client.storage.add_or_update_house(house)
+            client.storage.commit()
+        else:
+            await reconciler.load_house(house)
+    return time.perf_counter() - start
+
+
+async def run(houses: list, changed: list) -> None:
+    client = openhivenpy.HivenClient()
+    client.storage.update_client_user(
+        deepcopy(houses[0]['members'][0]['user'])
+    )
+    reconciler = HouseReconciler(client)
+    await load(client, houses, reconciler)
+
+    print(f"{'reload':<24} {'ms':>12}")
+    for name, payloads, used in (
+            ('full', houses, None),
+            ('reconciled unchanged', houses, reconciler),
+            ('reconciled room names', changed, reconciler)
+    ):
+        elapsed = await load(client, payloads, used)
+        print(f"{name:<24} {elapsed * 1000:>12,.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-H', '--houses', type=int, default=50)
+    parser.add_argument('-m', '--members', type=int, default=200)
+    args = parser.parse_args()
+
+    houses = create_houses(args.houses, args.members)
+    changed = deepcopy(houses)
+    for house in changed:
+        house['rooms'][0]['name'] = 'Renamed'
+    asyncio.run(run(houses, changed))
+
+
+if __name__ == '__main__':
+    main()
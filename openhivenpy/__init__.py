@@ -34,21 +34,72 @@ __license__ = "MIT"
 __version__ = "0.2.post1"
 __copyright__ = "Luna Klatzer"
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
-from . import events
+from . import base_types
 from . import exceptions
-from . import gateway
+from . import json_codec
 from . import utils
+from . import validation
 from .base_types import *
-from .client import *
-from .env_config import HivenENV
+from .env_config import HivenENV, env
 from .exceptions import *
-from .types import *
+from .json_codec import *
+from .validation import *
+
+if TYPE_CHECKING:
+    from . import client, events, gateway, types
+    from .client import *
+    from .types import *
+
+# Sub-packages that are only imported on their first access, since they
+# import aiohttp and the other heavy dependencies (PEP 562)
+_LAZY_SUBMODULES = ('client', 'events', 'gateway', 'types')
+
+# Names of the lazy sub-packages that are available in this module
+_LAZY_ATTRIBUTES = {
+    **dict.fromkeys((
+        'BotClient', 'CacheBackend', 'CachePolicy', 'ClientCache',
+        'HivenClient', 'IdentityMap', 'MessageSendQueue', 'SQLiteClientCache',
+        'UserClient'
+    ), 'client'),
+    **dict.fromkeys((
+        'TextRoom', 'LazyHouse', 'House', 'PrivateRoom', 'PrivateGroupRoom',
+        'LazyUser', 'User', 'Message', 'DeletedMessage', 'Context', 'Member',
+        'UserTyping', 'Attachment', 'Feed', 'Entity', 'Invite', 'Mention',
+        'Embed', 'Relationship'
+    ), 'types')
+}
+
+__all__ = [
+    *base_types.__all__, *exceptions.__all__, *json_codec.__all__,
+    *validation.__all__, 'HivenENV', 'env', 'utils', *_LAZY_SUBMODULES,
+    *_LAZY_ATTRIBUTES
+]
 
-logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-# Loading the environment variables which contain basic configuration
-# for the module
-env = HivenENV()
-env.load_env()
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(
+            f'.{_LAZY_ATTRIBUTES[name]}', __name__
+        )
+        value = getattr(module, name)
+        # Caching the value, so __getattr__ is only called once per name
+        globals()[name] = value
+        return value
+    else:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
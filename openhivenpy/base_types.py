@@ -2,9 +2,11 @@
 # Used for type hinting and not having to use annotations for the objects
 from __future__ import annotations
 
+import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, Union
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from .client import HivenClient
@@ -17,27 +19,176 @@ __all__ = [
     'BaseRoom'
 ]
 
+logger = logging.getLogger(__name__)
+
 
 class HivenObject(ABC):
     """
     Abstract Base Class for all Hiven Type Classes. Used to signalise it's a
     generic type without specification
     """
-    ...
+    __slots__ = ()
+
+
+def _validate_on_error(func: Callable) -> Callable:
+    """
+    Wraps the format_obj_data() classmethod of a type. If the current
+    ValidationPolicy only validates on errors and formatting the data failed,
+    the data is validated and formatted again
+    """
+    @wraps(func)
+    def _decorated(cls, data: dict, *args, **kwargs) -> dict:
+        from .validation import current_validation_policy
+        if not current_validation_policy().validate_on_error \
+                or type(data) is not dict:
+            return func(cls, data, *args, **kwargs)
+
+        # Shallow copy, since formatting replaces the nested data
+        original = dict(data)
+        try:
+            return func(cls, data, *args, **kwargs)
+        except Exception:
+            logger.debug(
+                f"[{cls.__name__.upper()}] Formatting the data failed. "
+                f"Retrying with validated data"
+            )
+        # Raises the validation error if the data is invalid
+        data = cls.validate_strict(original)
+        return func(cls, data, *args, **kwargs)
+
+    return _decorated
 
 
 class DataClassObject(HivenObject):
     """
-    Data-Class object for the types sub-module of openhivenpy
+    Data-Class object for the types sub-module of openhivenpy.
+
+    All subclasses define `__slots__` for the attributes they set, so the
+    instances do not have a `__dict__`
     """
-    _client: HivenClient = None
+    __slots__ = ('_client', '_raw_data', '_refresh_data', '__weakref__')
+
+    # Slots of the base class, which are not set by `__init__()` of the types
+    _internal_slots = ('_client', '_raw_data', '_refresh_data', '__weakref__')
+
+    # Slots of lazy instances that can be read directly from the raw payload
+    # without resolving the entire instance. Maps the slot to the key in the
+    # payload and an optional conversion function
+    _lazy_fields: Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]] = {}
+
+    @classmethod
+    def lazy(cls, data: dict, client: HivenClient) -> DataClassObject:
+        """
+        Creates a lazy instance backed by the passed raw payload. The payload
+        is only validated and formatted using `format_obj_data()` once an
+        attribute is accessed that is not listed in `_lazy_fields`.
+
+        Only usable for types where `format_obj_data()` only requires the
+        data.
+
+        :param data: The raw data of the object. Owned by the instance
+         afterwards
+        :param client: The HivenClient
+        :return: The lazy instance
+        """
+        instance = cls.__new__(cls)
+        instance._client = client
+        instance._raw_data = data
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if the attribute does not exist, which for instances
+        # created using lazy() means the slot was not resolved yet and for
+        # stale instances that the instance was not rebuilt yet
+        if name.startswith('__') or name in self._internal_slots:
+            raise AttributeError(name)
+        try:
+            refresh_data = object.__getattribute__(self, '_refresh_data')
+        except AttributeError:
+            refresh_data = None
+        if refresh_data is not None:
+            self._refresh_data = None
+            self.__init__(refresh_data, self._client)
+            return object.__getattribute__(self, name)
 
-    def __init__(self):
-        self._json_schema: Optional[dict] = None
+        try:
+            raw_data = object.__getattribute__(self, '_raw_data')
+        except AttributeError:
+            raw_data = None
+        if raw_data is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{name}'"
+            )
+
+        field = self._lazy_fields.get(name)
+        if field is not None:
+            key, convert = field
+            value = raw_data.get(key)
+            try:
+                if convert is not None and value is not None:
+                    value = convert(value)
+            except (TypeError, ValueError):
+                # Resolving the entire instance below, which raises the
+                # same error as the non-lazy creation would
+                pass
+            else:
+                setattr(self, name, value)
+                return value
+
+        self._resolve()
+        return object.__getattribute__(self, name)
+
+    def _resolve(self) -> None:
+        """ Validates and formats the raw data of a lazy instance """
+        from .validation import use_validation_policy
+        raw_data = self._raw_data
+        self._raw_data = None
+        # Resolved after the event was handled, so the policy of the client
+        # needs to be used again
+        with use_validation_policy(
+                getattr(self._client, 'validation_policy', None)
+        ):
+            data = self.format_obj_data(raw_data)
+        self.__init__(data, self._client)
+
+    @property
+    def resolved(self) -> bool:
+        """
+        Returns whether the instance was validated and formatted. Always True
+        for instances that were not created using lazy()
+        """
+        return getattr(self, '_raw_data', None) is None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        format_obj_data = cls.__dict__.get('format_obj_data')
+        if isinstance(format_obj_data, classmethod):
+            cls.format_obj_data = classmethod(
+                _validate_on_error(format_obj_data.__func__)
+            )
 
     @classmethod
     def validate(cls, data, *args, **kwargs) -> dict:
-        """ Validates the data using the local class json_validator """
+        """
+        Validates the data using the local class json_validator. If the
+        current ValidationPolicy skips the validation, only the defaults of
+        the json-schema are applied
+        """
+        from .validation import current_validation_policy
+        if not current_validation_policy().should_validate():
+            from .validation import apply_schema_defaults
+            return apply_schema_defaults(
+                getattr(cls, '_json_schema', None) or {}, data
+            )
+        return cls.validate_strict(data, *args, **kwargs)
+
+    @classmethod
+    def validate_strict(cls, data, *args, **kwargs) -> dict:
+        """
+        Validates the data using the local class json_validator regardless
+        of the current ValidationPolicy
+        """
         try:
             return getattr(cls, 'json_validator')(data, *args, **kwargs)
         except Exception as e:
@@ -48,25 +199,60 @@ class DataClassObject(HivenObject):
     def __str__(self) -> str:
         return repr(self)
 
+    @classmethod
+    def _get_slots(cls) -> Tuple[str, ...]:
+        """ Returns the names of the slots of the class and its bases """
+        slots = []
+        for klass in reversed(cls.__mro__):
+            for slot in klass.__dict__.get('__slots__', ()):
+                if slot not in slots:
+                    slots.append(slot)
+        return tuple(slots)
+
     def __repr__(self) -> str:
-        # Automatically creating a list of tuples for all values
+        # Automatically creating a list of tuples for all set values
         info = [
-            (attribute.replace('_', ''),
-             value) if attribute != '_client' else None
-            for attribute, value in self.__dict__.items()
+            (attribute.replace('_', ''), getattr(self, attribute))
+            for attribute in self._get_slots()
+            if attribute not in self._internal_slots
+            and hasattr(self, attribute)
         ]
 
         return '<{} {}>'.format(self.__class__.__name__, ' '.join(
-            '%s=%s' % t if t is not None else '' for t in info))
+            '%s=%s' % t for t in info))
+
+    def _refresh(self, data: dict) -> None:
+        """
+        Marks the instance as stale. The instance is rebuilt with the passed
+        data once one of its attributes is accessed again, so updates of
+        instances that are not read in between are not initialised multiple
+        times. Used by the IdentityMap of the client to keep shared instances
+        up-to-date
+
+        :param data: The data the instance should be updated with. Passed
+         the same way as on initialisation
+        """
+        if getattr(self, '_refresh_data', None) is None:
+            # Removing the set values, so accessing them rebuilds the
+            # instance using __getattr__()
+            for slot in self._get_slots():
+                if slot not in self._internal_slots:
+                    try:
+                        object.__delattr__(self, slot)
+                    except AttributeError:
+                        pass
+        self._raw_data = None
+        self._refresh_data = data
 
     @property
     def json_schema(self) -> dict:
         """ Schema to validate the Data Class using json-validation """
-        return getattr(self, '_json_schema')
+        return getattr(self, '_json_schema', None)
 
 
 class BaseUser(DataClassObject):
     """ Base User for Hiven """
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -152,6 +338,7 @@ class BaseUser(DataClassObject):
 
 class BaseRoom(DataClassObject):
     """ Base Room representing a Room where messages can be sent """
+    __slots__ = ()
 
     @property
     @abstractmethod
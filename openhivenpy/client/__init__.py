@@ -28,6 +28,10 @@ SOFTWARE.
 """
 
 from .botclient import BotClient
-from .cache import ClientCache
+from .cache import ClientCache, CachePolicy
+from .cache_backend import CacheBackend
 from .hivenclient import HivenClient
+from .identity_map import IdentityMap
+from .send_queue import MessageSendQueue
+from .sqlite_cache import SQLiteClientCache
 from .userclient import UserClient
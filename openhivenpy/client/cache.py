@@ -29,16 +29,15 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
+import os
 import sys
-# Using deepcopy instead of standard .copy() from python since regular dict()
-# or dict.copy() would not duplicate its iterable properties as well and the
-# keys for iterables would point to the same object, which results in that
-# changes to those iterables are applied to all copied dictionaries that were
-# created using dict() or copy().
-from copy import deepcopy
+import time
+import zlib
+from collections import OrderedDict
 # Only importing the Objects for the purpose of type hinting and not actual use
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from .cache_backend import CacheBackend
 from .. import types
 from .. import utils
 from ..base_types import HivenObject
@@ -47,10 +46,22 @@ from ..exceptions import InvalidPassedDataError
 if TYPE_CHECKING:
     from .. import HivenClient
 
-__all__ = ['ClientCache', 'create_default_cache']
+try:
+    import msgpack
+except ImportError:
+    # Optional dependency - snapshots will be stored as JSON instead
+    msgpack = None
+
+__all__ = ['ClientCache', 'CachePolicy', 'create_default_cache']
 
 logger = logging.getLogger(__name__)
 
+# Header of the cache snapshots: magic, version and the format of the payload
+SNAPSHOT_MAGIC = b'OHCS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FORMAT_MSGPACK = b'm'
+SNAPSHOT_FORMAT_JSON = b'j'
+
 
 def create_default_cache() -> dict:
     """ Creates the default dictionary format used inside the cache """
@@ -70,20 +81,128 @@ def create_default_cache() -> dict:
         'relationships': dict(),
         'house_ids': list(),
         'settings': dict(),
-        'init_read_state': dict()
+        'init_read_state': dict(),
+        # Secondary indexes, which store the ids of the objects as sets for
+        # O(1) lookups. Maintained by the add_or_update_* and remove_* methods
+        'indexes': {
+            'house_rooms': dict(),
+            'house_entities': dict(),
+            'user_houses': dict()
+        }
     }
 
 
-class ClientCache(dict, HivenObject):
+class CachePolicy(HivenObject):
+    """
+    Policy of the ClientCache, which limits the amount of cached users and
+    house members. The default policy caches everything without limits.
+
+    The client user, the owners of the cached houses and the users of
+    relationships are pinned and never evicted.
+    """
+    MEMBER_CACHE_MODES = ('all', 'online', 'none')
+
+    def __init__(
+            self,
+            *,
+            max_users: Optional[int] = None,
+            max_members: Optional[int] = None,
+            ttl: Optional[float] = None,
+            member_cache: str = 'all'
+    ):
+        """
+        :param max_users: Maximum amount of cached users. If exceeded the
+         least recently used users are evicted. None for no limit
+        :param max_members: Maximum amount of cached members per house. If
+         exceeded the least recently used members are evicted. None for no
+         limit
+        :param ttl: Seconds after users and members that were not updated or
+         accessed are evicted. None to never expire them
+        :param member_cache: Which members should be cached. 'all' caches all
+         members, 'online' only members that are online and 'none' no members
+         except the pinned ones
+        :raises ValueError: If one of the passed values is invalid
+        """
+        if member_cache not in self.MEMBER_CACHE_MODES:
+            raise ValueError(
+                f"Invalid member_cache mode '{member_cache}'! Expected one "
+                f"of: {', '.join(self.MEMBER_CACHE_MODES)}"
+            )
+        for name, value in (('max_users', max_users),
+                            ('max_members', max_members), ('ttl', ttl)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be greater than 0 or None")
+
+        self._max_users = max_users
+        self._max_members = max_members
+        self._ttl = ttl
+        self._member_cache = member_cache
+
+    def __repr__(self) -> str:
+        info = [
+            ('max_users', self.max_users),
+            ('max_members', self.max_members),
+            ('ttl', self.ttl),
+            ('member_cache', self.member_cache)
+        ]
+        return '<CachePolicy {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def max_users(self) -> Optional[int]:
+        """ Maximum amount of cached users """
+        return getattr(self, '_max_users', None)
+
+    @property
+    def max_members(self) -> Optional[int]:
+        """ Maximum amount of cached members per house """
+        return getattr(self, '_max_members', None)
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """ Seconds after not used users and members are evicted """
+        return getattr(self, '_ttl', None)
+
+    @property
+    def member_cache(self) -> Optional[str]:
+        """ Mode specifying which members should be cached """
+        return getattr(self, '_member_cache', None)
+
+    @property
+    def tracks_users(self) -> bool:
+        """ Returns whether the access of users needs to be tracked """
+        return self.max_users is not None or self.ttl is not None
+
+    @property
+    def tracks_members(self) -> bool:
+        """ Returns whether the access of members needs to be tracked """
+        return self.max_members is not None or self.ttl is not None
+
+
+class ClientCache(dict, CacheBackend):
     """
     Client Cache Class used for storing all data of the Client. Emulates a
     dictionary and contains additional functions to interact with the Client
     cache more easily and use functions for better readability.
+
+    Default in-memory implementation of the `CacheBackend` interface.
+
+    The data passed to the add_or_update_* and update_* methods is owned by
+    the cache afterwards and will be modified and stored without copying it.
+    If the caller still requires the original data, a copy needs to be passed
+    instead.
     """
 
-    def __init__(self, client: HivenClient, **kwargs):
+    def __init__(
+            self,
+            client: HivenClient,
+            *,
+            policy: Optional[CachePolicy] = None,
+            **kwargs
+    ):
         super(ClientCache, self).__init__(**kwargs)
         self.client = client
+        self.policy: CachePolicy = policy if policy is not None \
+            else CachePolicy()
         self.update(
             # Updating the passed dict as well to avoid data being overwritten
             # that were passed with args or kwargs
@@ -91,6 +210,7 @@ class ClientCache(dict, HivenObject):
                 create_default_cache(), **kwargs
             )
         )
+        self._reset_policy_state()
 
     def closing_cleanup(self) -> None:
         """
@@ -100,6 +220,470 @@ class ClientCache(dict, HivenObject):
         method!
         """
         self.update(create_default_cache())
+        self._reset_policy_state()
+        identity_map = getattr(self.client, 'identity_map', None)
+        if identity_map is not None:
+            identity_map.clear()
+
+    def _reset_policy_state(self) -> None:
+        """ Resets the access tracking and counters of the cache policy """
+        # Last access of the users and members (per house) in LRU order
+        self._user_access: OrderedDict = OrderedDict()
+        self._member_access: Dict[str, OrderedDict] = {}
+        self._owner_ids: set = set()
+        self._last_sweep: float = time.monotonic()
+        # Eviction is delayed while a house is added, since its members
+        # reference the users added before them
+        self._bulk_update: int = 0
+        self._stats: Dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._snapshot_loaded: bool = False
+
+    @property
+    def snapshot_loaded(self) -> bool:
+        """
+        Returns whether the current data was loaded from a snapshot and was
+        not reconciled with the INIT_STATE of Hiven yet
+        """
+        return getattr(self, '_snapshot_loaded', False)
+
+    def to_snapshot(self) -> bytes:
+        """
+        Serialises the cache to a compact snapshot, which can be loaded again
+        using `load_snapshot_data()`. The token is not stored in the snapshot.
+
+        The payload is encoded with msgpack if it is installed, else as JSON,
+        and compressed using zlib.
+
+        :return: The snapshot as bytes
+        """
+        data = {key: value for key, value in self.items() if key != 'token'}
+        data['users'] = dict(self['users'])
+        # Sets are not serialisable
+        data['indexes'] = {
+            name: {key: list(ids) for key, ids in index.items()}
+            for name, index in self['indexes'].items()
+        }
+        # The client member is only a reference to the member in 'members'
+        data['houses'] = {
+            id_: {
+                **{k: v for k, v in house.items() if k != 'client_member'},
+                'members': dict(house['members'])
+            }
+            for id_, house in self['houses'].items()
+        }
+
+        if msgpack is not None:
+            fmt = SNAPSHOT_FORMAT_MSGPACK
+            payload = msgpack.packb(data, use_bin_type=True)
+        else:
+            fmt = SNAPSHOT_FORMAT_JSON
+            payload = self.client.json_codec.dumps(data).encode('utf-8')
+
+        header = SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]) + fmt
+        return header + zlib.compress(payload)
+
+    def load_snapshot_data(self, snapshot: bytes) -> None:
+        """
+        Replaces the data of the cache with the data of the passed snapshot.
+        The token of the cache is kept.
+
+        :param snapshot: The snapshot created by `to_snapshot()`
+        :raises ValueError: If the snapshot is invalid or of an unsupported
+         version
+        :raises ImportError: If the snapshot was stored using msgpack, but it
+         is not installed
+        """
+        header_len = len(SNAPSHOT_MAGIC) + 2
+        if snapshot[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError("The passed data is not a cache snapshot")
+        elif snapshot[len(SNAPSHOT_MAGIC)] != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {snapshot[len(SNAPSHOT_MAGIC)]}"
+            )
+
+        fmt = snapshot[header_len - 1:header_len]
+        payload = zlib.decompress(snapshot[header_len:])
+        if fmt == SNAPSHOT_FORMAT_MSGPACK:
+            if msgpack is None:
+                raise ImportError(
+                    "The snapshot requires the module 'msgpack' to be installed"
+                )
+            data = msgpack.unpackb(payload, raw=False)
+        elif fmt == SNAPSHOT_FORMAT_JSON:
+            data = self.client.json_codec.loads(payload)
+        else:
+            raise ValueError(f"Unknown snapshot format {fmt}")
+
+        token = self.get('token')
+        self.update(create_default_cache())
+        self._reset_policy_state()
+        self.update(data)
+        self['token'] = token
+
+        self['indexes'] = {
+            name: {key: set(ids) for key, ids in index.items()}
+            for name, index in data.get('indexes', {}).items()
+        }
+        client_id = self['client_user'].get('id')
+        for house in self['houses'].values():
+            if house.get('owner_id'):
+                self._owner_ids.add(house['owner_id'])
+            house['client_member'] = house['members'].get(client_id)
+
+        self._snapshot_loaded = True
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Saves a snapshot of the cache to the passed file. The file is replaced
+        atomically, so a failed save does not corrupt an existing snapshot.
+
+        :param path: Path of the snapshot file
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(self.to_snapshot())
+        os.replace(tmp_path, path)
+        logger.debug(f"[CACHE] Saved cache snapshot to {path}")
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Loads the snapshot of the passed file if it exists. Invalid snapshots
+        are ignored
+
+        :param path: Path of the snapshot file
+        :return: True if the snapshot was loaded else False
+        """
+        if not os.path.isfile(path):
+            return False
+
+        try:
+            with open(path, 'rb') as file:
+                self.load_snapshot_data(file.read())
+        except Exception as e:
+            logger.warning(
+                f"[CACHE] Ignoring invalid cache snapshot {path}: {repr(e)}"
+            )
+            token = self.get('token')
+            self.closing_cleanup()
+            self['token'] = token
+            return False
+
+        logger.debug(f"[CACHE] Loaded cache snapshot {path}")
+        return True
+
+    def reconcile_houses(self, house_ids) -> None:
+        """
+        Removes all cached houses, which are not in the passed ids. Called
+        after the initialisation to remove houses of a loaded snapshot the
+        client is not a member of anymore.
+
+        :param house_ids: Ids of the houses the client is a member of
+        """
+        house_ids = set(house_ids)
+        for id_ in list(self['houses'].keys()):
+            if id_ not in house_ids:
+                self.remove_house(id_)
+        self._snapshot_loaded = False
+
+    def _create_member_storage(self, house_id: str, members: dict):
+        """
+        Returns the mapping the members of a house are stored in, which
+        replaces the members of a previously cached version of the house
+
+        :param house_id: id of the House
+        :param members: The validated members of the house
+        """
+        return members
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the user and member lookups (hits, misses)
+        and the evictions of the cache
+        """
+        return getattr(self, '_stats', None)
+
+    def is_pinned_user(self, user_id: str) -> bool:
+        """
+        Returns whether the user is pinned and will never be evicted. This
+        includes the client user, house owners and relationship users
+        """
+        return user_id == self['client_user'].get('id') \
+            or user_id in self._owner_ids \
+            or user_id in self['relationships']
+
+    def _touch_user(self, user_id: str) -> None:
+        """ Marks the user as recently used """
+        if self.policy.tracks_users:
+            self._user_access[user_id] = time.monotonic()
+            self._user_access.move_to_end(user_id)
+
+    def _touch_member(self, member_id: str, house_id: str) -> None:
+        """ Marks the member as recently used """
+        if self.policy.tracks_members:
+            access = self._member_access.get(house_id)
+            if access is None:
+                access = self._member_access[house_id] = OrderedDict()
+            access[member_id] = time.monotonic()
+            access.move_to_end(member_id)
+
+    def _drop_member(self, member_id: str, house_id: str) -> bool:
+        """
+        Removes a member from the cache without checking whether it is pinned
+
+        :return: True if the member existed
+        """
+        members = self['houses'].get(house_id, {}).get('members', {})
+        existed = members.pop(member_id, None) is not None
+        self._remove_from_index('user_houses', member_id, house_id)
+        self._member_access.get(house_id, {}).pop(member_id, None)
+        self._forget_instance('member', (house_id, member_id))
+        return existed
+
+    def _evict_member(self, member_id: str, house_id: str) -> None:
+        """ Evicts a member and counts the eviction """
+        if self._drop_member(member_id, house_id):
+            self._stats['evictions'] += 1
+
+    def _evict_user(self, user_id: str) -> None:
+        """ Evicts a user including its members in all houses """
+        for house_id in self.get_user_house_ids(user_id):
+            self._evict_member(user_id, house_id)
+
+        self._user_access.pop(user_id, None)
+        self._forget_instance('user', user_id)
+        if self['users'].pop(user_id, None) is not None:
+            self._stats['evictions'] += 1
+
+    def _evict_lru(
+            self, access: OrderedDict, limit: int, size: int, evict
+    ) -> None:
+        """ Evicts the least recently used entries until size <= limit """
+        skipped = 0
+        while size > limit and len(access) > skipped:
+            id_ = next(iter(access))
+            if self.is_pinned_user(id_):
+                # Moving pinned entries to the end to check the next one
+                access.move_to_end(id_)
+                skipped += 1
+                continue
+            evict(id_)
+            size -= 1
+
+    def _sweep_if_due(self) -> None:
+        """ Evicts the expired entries if half of the ttl passed """
+        ttl = self.policy.ttl
+        if ttl is not None and time.monotonic() - self._last_sweep >= ttl / 2:
+            self.evict_expired()
+
+    def _enforce_user_limit(self) -> None:
+        """ Evicts the least recently used users exceeding the limit """
+        if self.policy.max_users is not None:
+            self._evict_lru(
+                self._user_access,
+                self.policy.max_users,
+                len(self['users']),
+                self._evict_user
+            )
+
+    def _enforce_member_limit(self, house_id: str) -> None:
+        """ Evicts the least recently used members exceeding the limit """
+        access = self._member_access.get(house_id)
+        if self.policy.max_members is not None and access:
+            members = self['houses'].get(house_id, {}).get('members', {})
+            self._evict_lru(
+                access,
+                self.policy.max_members,
+                len(members),
+                lambda id_: self._evict_member(id_, house_id)
+            )
+
+    def enforce_policy(self) -> None:
+        """
+        Evicts the expired entries and the least recently used entries
+        exceeding the limits of the cache policy
+        """
+        if self._bulk_update:
+            return
+
+        self._sweep_if_due()
+        self._enforce_user_limit()
+        for house_id in list(self._member_access.keys()):
+            self._enforce_member_limit(house_id)
+
+    def evict_expired(self) -> None:
+        """ Evicts all users and members that exceeded the ttl """
+        ttl = self.policy.ttl
+        if ttl is None:
+            return
+
+        now = time.monotonic()
+        self._last_sweep = now
+        expired = now - ttl
+
+        for id_, last in list(self._user_access.items()):
+            if last > expired:
+                break
+            if self.is_pinned_user(id_):
+                self._user_access[id_] = now
+                self._user_access.move_to_end(id_)
+            else:
+                self._evict_user(id_)
+
+        for house_id, access in list(self._member_access.items()):
+            for id_, last in list(access.items()):
+                if last > expired:
+                    break
+                if self.is_pinned_user(id_):
+                    access[id_] = now
+                    access.move_to_end(id_)
+                else:
+                    self._evict_member(id_, house_id)
+
+    def _admit_member(self, member_id: str, member: dict) -> bool:
+        """ Returns whether the member should be cached by the policy """
+        mode = self.policy.member_cache
+        if mode == 'all' or self.is_pinned_user(member_id):
+            return True
+        elif mode == 'online':
+            presence = member.get('presence')
+            if presence is None:
+                presence = self['users'].get(member_id, {}).get('presence')
+            return presence is not None and presence != 'offline'
+        return False
+
+    def lookup_user(self, user_id: str) -> Optional[dict]:
+        """
+        Returns the cached data of the user and counts the hit or miss
+
+        :param user_id: id of the User
+        :return: The cached dict of the user if it exists else None
+        """
+        data = self['users'].get(user_id)
+        if data is None:
+            self._stats['misses'] += 1
+            return None
+
+        self._stats['hits'] += 1
+        self._touch_user(user_id)
+        return data
+
+    def lookup_house_member(
+            self, member_id: str, house_id: str
+    ) -> Optional[dict]:
+        """
+        Returns the cached data of the member and counts the hit or miss
+
+        :param member_id: id of the Member
+        :param house_id: id of the House the member is in
+        :return: The cached dict of the member if it exists else None
+        """
+        data = self['houses'].get(house_id, {}).get('members', {}).get(
+            member_id
+        )
+        if data is None:
+            self._stats['misses'] += 1
+            return None
+
+        self._stats['hits'] += 1
+        self._touch_member(member_id, house_id)
+        return data
+
+    def mark_house_member_offline(self, member_id: str, house_id: str) -> None:
+        """
+        Evicts the member if only online members should be cached and the
+        member is not pinned
+
+        :param member_id: id of the Member that went offline
+        :param house_id: id of the House the member is in
+        """
+        if self.policy.member_cache == 'online' \
+                and not self.is_pinned_user(member_id):
+            self._evict_member(member_id, house_id)
+
+    def _add_to_index(self, index: str, key: str, value: str) -> None:
+        """ Adds the value to the set of the key in the passed index """
+        if key is None:
+            return
+        values = self['indexes'][index].get(key)
+        if values is None:
+            values = self['indexes'][index][key] = set()
+        values.add(value)
+
+    def _remove_from_index(
+            self, index: str, key: str, value: Optional[str] = None
+    ) -> None:
+        """
+        Removes the value from the set of the key in the passed index. If the
+        value is None the entire key is removed
+        """
+        values = self['indexes'][index].get(key)
+        if values is None:
+            return
+        if value is not None:
+            values.discard(value)
+        if value is None or not values:
+            del self['indexes'][index][key]
+
+    def get_house_room_ids(self, house_id: str) -> List[str]:
+        """ Returns the ids of all cached rooms of the house """
+        return list(self['indexes']['house_rooms'].get(house_id, ()))
+
+    def get_house_entity_ids(self, house_id: str) -> List[str]:
+        """ Returns the ids of all cached entities of the house """
+        return list(self['indexes']['house_entities'].get(house_id, ()))
+
+    def get_user_house_ids(self, user_id: str) -> List[str]:
+        """ Returns the ids of all cached houses the user is a member of """
+        return list(self['indexes']['user_houses'].get(user_id, ()))
+
+    def get_token(self) -> Optional[str]:
+        """ Returns the cached token of the client """
+        return self.get('token')
+
+    def set_token(self, token: Optional[str]) -> None:
+        """ Sets the cached token of the client """
+        self['token'] = token
+
+    def get_client_user(self) -> dict:
+        """ Returns the data of the client user. Empty if not initialised """
+        return self['client_user']
+
+    def get_house_ids(self) -> List[str]:
+        """ Returns the ids of all houses the client is a member of """
+        return self['house_ids']
+
+    def get_room_ids(self) -> List[str]:
+        """ Returns the ids of all cached house and private rooms """
+        return [
+            *self['rooms']['house'].keys(),
+            *self['rooms']['private']['single'].keys(),
+            *self['rooms']['private']['group'].keys()
+        ]
+
+    def lookup_house(self, house_id: str) -> Optional[dict]:
+        """ Returns the cached data of the house """
+        return self['houses'].get(house_id)
+
+    def lookup_room(self, room_id: str) -> Optional[dict]:
+        """ Returns the cached data of the house room """
+        return self['rooms']['house'].get(room_id)
+
+    def lookup_private_room(self, room_id: str) -> Optional[dict]:
+        """ Returns the cached data of the private room """
+        return self['rooms']['private']['single'].get(room_id)
+
+    def lookup_private_group_room(self, room_id: str) -> Optional[dict]:
+        """ Returns the cached data of the private group room """
+        return self['rooms']['private']['group'].get(room_id)
+
+    def lookup_entity(self, entity_id: str) -> Optional[dict]:
+        """ Returns the cached data of the entity """
+        return self['entities'].get(entity_id)
+
+    def lookup_relationship(self, user_id: str) -> Optional[dict]:
+        """ Returns the cached data of the relationship with the user """
+        return self['relationships'].get(user_id)
 
     def init_client_user_obj(self) -> types.User:
         """ Initialises the client user based on the cached data """
@@ -126,16 +710,28 @@ class ClientCache(dict, HivenObject):
          - All open Private Rooms
          - All Relationships of the user
         """
-        data = deepcopy(item_data)
-        self['house_ids'] = data.get('house_ids', [])
-        self['settings'] = data.get('settings', {})
-        self['init_read_state'] = data.get('read_state', {})
-        self.update_client_user(data.get('user'))
-
-        for r in data.get('private_rooms', []):
+        user = item_data.get('user') or {}
+        if self.snapshot_loaded and \
+                user.get('id') != self['client_user'].get('id'):
+            # The snapshot belongs to another account
+            token = self.get('token')
+            self.closing_cleanup()
+            self['token'] = token
+
+        self['house_ids'] = item_data.get('house_ids', [])
+        self['settings'] = item_data.get('settings', {})
+        self['init_read_state'] = item_data.get('read_state', {})
+        self.update_client_user(item_data.get('user'))
+
+        # The INIT_STATE contains all private rooms and relationships, which
+        # replace the ones of a previous connection or snapshot
+        self['rooms']['private'] = {'single': dict(), 'group': dict()}
+        self['relationships'] = dict()
+
+        for r in item_data.get('private_rooms', []):
             self.add_or_update_private_room(r)
 
-        for key, data in data.get('relationships', []).items():
+        for key, data in item_data.get('relationships', {}).items():
             self.add_or_update_relationship(data)
 
     def update_client_user(self, item_data: dict) -> dict:
@@ -144,15 +740,16 @@ class ClientCache(dict, HivenObject):
 
         :return: The validated data using `format_obj_data` of the User class
         """
-        data = deepcopy(item_data)
-        client_user = types.User.format_obj_data(data)
+        client_user = types.User.format_obj_data(item_data)
         self['client_user'].update(client_user)
 
-        if self['users'].get(data['id']) is not None:
-            self['users'][data['id']].update(client_user)
+        id_ = client_user['id']
+        if self['users'].get(id_) is not None:
+            self['users'][id_].update(client_user)
         else:
-            self['users'][data['id']] = client_user
+            self['users'][id_] = client_user
 
+        self._refresh_instance('user', id_, self['users'][id_])
         return client_user
 
     def add_or_update_house_member(self, item_data: dict) -> dict:
@@ -167,7 +764,8 @@ class ClientCache(dict, HivenObject):
             # house.format_obj_data() replaced it with the ids of the
             # corresponding users
             if type(item_data['user']) is not dict:
-                item_data['user'] = self.client.find_user(item_data['user'])
+                user = self['users'].get(item_data['user'])
+                item_data['user'] = dict(user) if user else None
 
             member = types.Member.format_obj_data(item_data)
 
@@ -175,10 +773,24 @@ class ClientCache(dict, HivenObject):
                 else item_data.get('user', {}).get('id')
             house_id = item_data['house_id']
 
-            if mem_id in self['houses'][house_id]['members'].keys():
-                self['houses'][house_id]['members'][mem_id].update(member)
+            if not self._admit_member(mem_id, member):
+                self._drop_member(mem_id, house_id)
             else:
-                self['houses'][house_id]['members'][mem_id] = member
+                members = self['houses'][house_id]['members']
+                if mem_id in members:
+                    members[mem_id].update(member)
+                else:
+                    members[mem_id] = member
+                # Members of a newly added house are already stored, but
+                # not indexed yet
+                self._add_to_index('user_houses', mem_id, house_id)
+                self._touch_member(mem_id, house_id)
+                self._refresh_instance(
+                    'member', (house_id, mem_id), members[mem_id]
+                )
+
+            if not self._bulk_update:
+                self._enforce_member_limit(house_id)
 
             user = types.User.format_obj_data(item_data['user'])
             self.add_or_update_user(user)
@@ -199,6 +811,9 @@ class ClientCache(dict, HivenObject):
         """ Removes a house from the cache """
         self.check_if_initialised()
         del self['houses'][house_id]['members'][member_id]
+        self._remove_from_index('user_houses', member_id, house_id)
+        self._member_access.get(house_id, {}).pop(member_id, None)
+        self._forget_instance('member', (house_id, member_id))
 
     def add_or_update_house(self, item_data: dict) -> dict:
         """
@@ -208,9 +823,13 @@ class ClientCache(dict, HivenObject):
         :return: The validated data using `format_obj_data` of the House class
         """
         self.check_if_initialised()
+        self._bulk_update += 1
         try:
-            data = deepcopy(item_data)
+            data = item_data
             id_ = data['id']
+            if data.get('owner_id'):
+                self._owner_ids.add(data['owner_id'])
+
             for room in data['rooms']:
                 room['house_id'] = id_
                 self.add_or_update_room(room)
@@ -227,6 +846,7 @@ class ClientCache(dict, HivenObject):
                 self.add_or_update_entity(entity)
 
             data = types.House.format_obj_data(data)
+            data['members'] = self._create_member_storage(id_, data['members'])
             data['client_member'] = data['members'][self['client_user']['id']]
 
             if self['houses'].get(id_) is None:
@@ -241,9 +861,10 @@ class ClientCache(dict, HivenObject):
                 self['houses'][id_].update(data)
 
             # After the House was created altering the cached data
-            for member in data['members'].values():
+            for member in list(data['members'].values()):
                 self.add_or_update_house_member(member)
 
+            self._refresh_instance('house', id_, self['houses'][id_])
             return data
 
         except Exception as e:
@@ -255,6 +876,9 @@ class ClientCache(dict, HivenObject):
                 "Failed to update the cache due to faulty data being passed",
                 data=item_data
             ) from e
+        finally:
+            self._bulk_update -= 1
+            self.enforce_policy()
 
     def remove_house(self, _id: str) -> None:
         """ Removes a house from the cache """
@@ -268,9 +892,19 @@ class ClientCache(dict, HivenObject):
             entity: str
             self.remove_entity(entity)
 
+        for member_id in self['houses'][_id]['members'].keys():
+            self._remove_from_index('user_houses', member_id, _id)
+            self._forget_instance('member', (_id, member_id))
+        self._remove_from_index('house_rooms', _id)
+        self._remove_from_index('house_entities', _id)
+        self._member_access.pop(_id, None)
+
         del self['houses'][_id]
-        self['house_ids']: list
-        self['house_ids'].remove(_id)
+        self._forget_instance('house', _id)
+        # The house ids might already be replaced by the ones of a new
+        # INIT_STATE, which does not contain the house anymore
+        if _id in self['house_ids']:
+            self['house_ids'].remove(_id)
 
     def add_or_update_user(self, item_data: dict) -> dict:
         """
@@ -281,9 +915,8 @@ class ClientCache(dict, HivenObject):
         """
         self.check_if_initialised()
         try:
-            data = deepcopy(item_data)
-            id_ = data['id']
-            data = types.User.format_obj_data(data)
+            id_ = item_data['id']
+            data = types.User.format_obj_data(item_data)
 
             if id_ == self['client_user'].get('id'):
                 self.update_client_user(data)
@@ -292,6 +925,12 @@ class ClientCache(dict, HivenObject):
                 self['users'][id_] = data
             else:
                 self['users'][id_].update(data)
+
+            self._touch_user(id_)
+            self._refresh_instance('user', id_, self['users'][id_])
+            if not self._bulk_update:
+                self._sweep_if_due()
+                self._enforce_user_limit()
             return data
 
         except Exception as e:
@@ -308,6 +947,8 @@ class ClientCache(dict, HivenObject):
         """ Removes a user from the cache """
         self.check_if_initialised()
         del self['users'][_id]
+        self._user_access.pop(_id, None)
+        self._forget_instance('user', _id)
 
     def add_or_update_room(self, item_data: dict) -> dict:
         """
@@ -318,13 +959,14 @@ class ClientCache(dict, HivenObject):
         """
         self.check_if_initialised()
         try:
-            data = deepcopy(item_data)
-            id_ = data['id']
-            data = types.TextRoom.format_obj_data(data)
+            id_ = item_data['id']
+            data = types.TextRoom.format_obj_data(item_data)
             if self['rooms']['house'].get(id_) is None:
                 self['rooms']['house'][id_] = data
             else:
                 self['rooms']['house'][id_].update(data)
+            self._add_to_index('house_rooms', data.get('house_id'), id_)
+            self._refresh_instance('room', id_, self['rooms']['house'][id_])
             return data
 
         except Exception as e:
@@ -340,7 +982,9 @@ class ClientCache(dict, HivenObject):
     def remove_room(self, _id: str) -> None:
         """ Removes a room from the cache """
         self.check_if_initialised()
-        del self['rooms']['house'][_id]
+        room = self['rooms']['house'].pop(_id)
+        self._remove_from_index('house_rooms', room.get('house_id'), _id)
+        self._forget_instance('room', _id)
 
     def add_or_update_entity(self, item_data: dict) -> dict:
         """
@@ -351,13 +995,14 @@ class ClientCache(dict, HivenObject):
         """
         self.check_if_initialised()
         try:
-            data = deepcopy(item_data)
-            id_ = data['id']
-            data = types.Entity.format_obj_data(data)
+            id_ = item_data['id']
+            data = types.Entity.format_obj_data(item_data)
             if self['entities'].get(id_) is None:
                 self['entities'][id_] = data
             else:
                 self['entities'][id_].update(data)
+            self._add_to_index('house_entities', data.get('house_id'), id_)
+            self._refresh_instance('entity', id_, self['entities'][id_])
             return data
 
         except Exception as e:
@@ -373,7 +1018,9 @@ class ClientCache(dict, HivenObject):
     def remove_entity(self, _id: str) -> None:
         """ Removes an entity from the cache """
         self.check_if_initialised()
-        del self['entities'][_id]
+        entity = self['entities'].pop(_id)
+        self._remove_from_index('house_entities', entity.get('house_id'), _id)
+        self._forget_instance('entity', _id)
 
     def add_or_update_private_room(self, item_data: dict) -> dict:
         """
@@ -385,7 +1032,7 @@ class ClientCache(dict, HivenObject):
         """
         self.check_if_initialised()
         try:
-            data = deepcopy(item_data)
+            data = item_data
             id_ = data['id']
             if int(data['type']) == 1:
                 types.PrivateRoom.format_obj_data(data)
@@ -393,6 +1040,10 @@ class ClientCache(dict, HivenObject):
                     self['rooms']['private']['single'][id_] = data
                 else:
                     self['rooms']['private']['single'][id_].update(data)
+                self._refresh_instance(
+                    'private_room', id_,
+                    self['rooms']['private']['single'][id_]
+                )
 
             elif int(data['type']) == 2:
                 types.PrivateGroupRoom.format_obj_data(data)
@@ -400,6 +1051,10 @@ class ClientCache(dict, HivenObject):
                     self['rooms']['private']['group'][id_] = data
                 else:
                     self['rooms']['private']['group'][id_].update(data)
+                self._refresh_instance(
+                    'private_group_room', id_,
+                    self['rooms']['private']['group'][id_]
+                )
             else:
                 raise ValueError("Data does not contain correct type-id")
             return data
@@ -418,14 +1073,10 @@ class ClientCache(dict, HivenObject):
         """ Removes a private-room from the cache """
         self.check_if_initialised()
 
-        for i in self['rooms']['private']['group']:
-            if i.get('id') == _id:
-                del self['rooms']['private']['group'][_id]
-                return
-
-        for i in self['rooms']['private']['single']:
-            if i.get('id') == _id:
-                del self['rooms']['private']['single'][_id]
+        if self['rooms']['private']['group'].pop(_id, None) is not None:
+            self._forget_instance('private_group_room', _id)
+        elif self['rooms']['private']['single'].pop(_id, None) is not None:
+            self._forget_instance('private_room', _id)
 
     def add_or_update_relationship(self, item_data: dict) -> dict:
         """
@@ -437,7 +1088,7 @@ class ClientCache(dict, HivenObject):
         """
         self.check_if_initialised()
         try:
-            data = deepcopy(item_data)
+            data = item_data
 
             if 'user_id' in data.keys():
                 id_ = data['user_id']
@@ -460,6 +1111,9 @@ class ClientCache(dict, HivenObject):
                 self['relationships'][id_] = data
             else:
                 self['relationships'][id_].update(data)
+            self._refresh_instance(
+                'relationship', id_, self['relationships'][id_]
+            )
             return data
 
         except Exception as e:
@@ -476,3 +1130,4 @@ class ClientCache(dict, HivenObject):
         """ Removes a relationship from the cache """
         self.check_if_initialised()
         del self['relationships'][_id]
+        self._forget_instance('relationship', _id)
@@ -0,0 +1,280 @@
+"""
+Interface of the storage backends used by the HivenClient to cache the data
+received from Hiven
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from ..base_types import HivenObject
+
+if TYPE_CHECKING:
+    from .. import types
+
+__all__ = ['CacheBackend']
+
+
+class CacheBackend(HivenObject):
+    """
+    Interface of a storage backend of the HivenClient. The HivenClient, the
+    HivenParsers and the types only access the cache using these methods, so
+    any implementation can be passed to the client using the `cache_backend`
+    parameter.
+
+    The lookup_* methods return the cached dict of the object or None if it
+    does not exist. The returned dicts must not be modified by the caller.
+    The add_or_update_* methods validate the passed data, store it and return
+    the validated data. The passed data is owned by the backend afterwards.
+
+    All methods except the lifecycle hooks with a default and the snapshot
+    methods are abstract and need to be implemented by the backend. The
+    default implementation is the in-memory `ClientCache`.
+    """
+
+    # Lifecycle
+
+    @abstractmethod
+    def closing_cleanup(self) -> None:
+        """ Removes all cached data after the client exited """
+
+    def commit(self) -> None:
+        """
+        Writes the pending changes to the storage backend. Called after every
+        parsed event. Backends applying all changes directly do not need to
+        implement this
+        """
+        pass
+
+    @abstractmethod
+    def check_if_initialised(self) -> bool:
+        """
+        Checks whether the client has initialised
+
+        :raises ValueError: If the client_user is not initialised
+        """
+
+    @abstractmethod
+    def init_client_user_obj(self) -> types.User:
+        """ Initialises the client user based on the cached data """
+
+    @property
+    def snapshot_loaded(self) -> bool:
+        """
+        Returns whether the cached data was restored from a previous session
+        and was not reconciled with the INIT_STATE of Hiven yet
+        """
+        return False
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """ Returns the counters of the backend """
+        return {}
+
+    def _refresh_instance(self, kind: str, key, data: dict) -> None:
+        """
+        Updates the shared instance of the object in the IdentityMap of the
+        client. Needs to be called after an object was updated
+        """
+        identity_map = getattr(getattr(self, 'client', None), 'identity_map',
+                               None)
+        if identity_map is not None:
+            identity_map.refresh(kind, key, data)
+
+    def _forget_instance(self, kind: str, key) -> None:
+        """
+        Removes the shared instance of the object from the IdentityMap of the
+        client. Needs to be called after an object was removed
+        """
+        identity_map = getattr(getattr(self, 'client', None), 'identity_map',
+                               None)
+        if identity_map is not None:
+            identity_map.forget(kind, key)
+
+    # Lookups
+
+    @abstractmethod
+    def get_token(self) -> Optional[str]:
+        """ Returns the cached token of the client """
+
+    @abstractmethod
+    def set_token(self, token: Optional[str]) -> None:
+        """ Sets the cached token of the client """
+
+    @abstractmethod
+    def get_client_user(self) -> dict:
+        """ Returns the data of the client user. Empty if not initialised """
+
+    @abstractmethod
+    def get_house_ids(self) -> List[str]:
+        """ Returns the ids of all houses the client is a member of """
+
+    @abstractmethod
+    def get_room_ids(self) -> List[str]:
+        """ Returns the ids of all cached house and private rooms """
+
+    @abstractmethod
+    def lookup_user(self, user_id: str) -> Optional[dict]:
+        """ Returns the cached data of the user """
+
+    @abstractmethod
+    def lookup_house(self, house_id: str) -> Optional[dict]:
+        """ Returns the cached data of the house """
+
+    @abstractmethod
+    def lookup_house_member(
+            self, member_id: str, house_id: str
+    ) -> Optional[dict]:
+        """ Returns the cached data of the member of the house """
+
+    @abstractmethod
+    def lookup_room(self, room_id: str) -> Optional[dict]:
+        """ Returns the cached data of the house room """
+
+    @abstractmethod
+    def lookup_private_room(self, room_id: str) -> Optional[dict]:
+        """ Returns the cached data of the private room """
+
+    @abstractmethod
+    def lookup_private_group_room(self, room_id: str) -> Optional[dict]:
+        """ Returns the cached data of the private group room """
+
+    @abstractmethod
+    def lookup_entity(self, entity_id: str) -> Optional[dict]:
+        """ Returns the cached data of the entity """
+
+    @abstractmethod
+    def lookup_relationship(self, user_id: str) -> Optional[dict]:
+        """ Returns the cached data of the relationship with the user """
+
+    @abstractmethod
+    def get_house_room_ids(self, house_id: str) -> List[str]:
+        """ Returns the ids of all cached rooms of the house """
+
+    @abstractmethod
+    def get_house_entity_ids(self, house_id: str) -> List[str]:
+        """ Returns the ids of all cached entities of the house """
+
+    @abstractmethod
+    def get_user_house_ids(self, user_id: str) -> List[str]:
+        """ Returns the ids of all cached houses the user is a member of """
+
+    # Updates
+
+    @abstractmethod
+    def update_primary_data(self, item_data: dict) -> None:
+        """ Updates the cache with the data of the INIT_STATE """
+
+    @abstractmethod
+    def update_client_user(self, item_data: dict) -> dict:
+        """ Updates the data of the client user """
+
+    @abstractmethod
+    def add_or_update_user(self, item_data: dict) -> dict:
+        """ Adds or updates a user """
+
+    @abstractmethod
+    def remove_user(self, _id: str) -> None:
+        """ Removes a user """
+
+    @abstractmethod
+    def add_or_update_house(self, item_data: dict) -> dict:
+        """ Adds or updates a house including its rooms and members """
+
+    @abstractmethod
+    def remove_house(self, _id: str) -> None:
+        """ Removes a house including its rooms and members """
+
+    @abstractmethod
+    def add_or_update_house_member(self, item_data: dict) -> dict:
+        """ Adds or updates a member of a house """
+
+    @abstractmethod
+    def remove_house_member(self, member_id: str, house_id: str) -> None:
+        """ Removes a member of a house """
+
+    def mark_house_member_offline(self, member_id: str, house_id: str) -> None:
+        """ Called when a member went offline """
+        pass
+
+    @abstractmethod
+    def add_or_update_room(self, item_data: dict) -> dict:
+        """ Adds or updates a house room """
+
+    @abstractmethod
+    def remove_room(self, _id: str) -> None:
+        """ Removes a house room """
+
+    @abstractmethod
+    def add_or_update_entity(self, item_data: dict) -> dict:
+        """ Adds or updates an entity """
+
+    @abstractmethod
+    def remove_entity(self, _id: str) -> None:
+        """ Removes an entity """
+
+    @abstractmethod
+    def add_or_update_private_room(self, item_data: dict) -> dict:
+        """ Adds or updates a private room or private group room """
+
+    @abstractmethod
+    def remove_private_room(self, _id: str) -> None:
+        """ Removes a private room or private group room """
+
+    @abstractmethod
+    def add_or_update_relationship(self, item_data: dict) -> dict:
+        """ Adds or updates a relationship """
+
+    @abstractmethod
+    def remove_relationship(self, _id: str) -> None:
+        """ Removes a relationship """
+
+    def reconcile_houses(self, house_ids: Iterable[str]) -> None:
+        """
+        Removes all cached houses that are not in the passed ids. Only called
+        if `snapshot_loaded` is True
+        """
+        pass
+
+    # Snapshots
+
+    def save_snapshot(self, path: str) -> None:
+        """ Saves the cached data to the passed file """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support snapshots"
+        )
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Loads the cached data from the passed file
+
+        :return: True if the snapshot was loaded else False
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support snapshots"
+        )
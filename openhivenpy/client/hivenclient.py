@@ -26,20 +26,30 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 import asyncio
+import functools
 import logging
 import os
 import sys
 from asyncio import AbstractEventLoop
-from typing import Optional, Union, List
+from typing import Callable, Dict, Optional, Union, List
 
-from .cache import ClientCache
+from .cache import ClientCache, CachePolicy
+from .cache_backend import CacheBackend
+from .identity_map import IdentityMap
+from .sqlite_cache import SQLiteClientCache
+from .send_queue import MessageSendQueue
 from .. import types
 from .. import utils
-from ..base_types import HivenObject
+from ..base_types import DataClassObject, HivenObject
+from ..env_config import env
 from ..events import HivenParsers, HivenEventHandler
 from ..exceptions import (InvalidTokenError,
                           HivenConnectionError)
-from ..gateway import Connection, HTTP, MessageBroker
+from ..gateway import (Connection, HTTP, MessageBroker, ReconnectPolicy,
+                       get_transport_compression)
+from ..json_codec import JSONCodec, get_json_codec
+from ..validation import (ValidationPolicy, get_validation_policy,
+                          current_validation_policy)
 
 __all__ = ['HivenClient']
 
@@ -59,7 +69,20 @@ class HivenClient(HivenEventHandler, HivenObject):
             host: Optional[str] = None,
             api_version: Optional[str] = None,
             heartbeat: Optional[int] = None,
-            close_timeout: Optional[int] = None
+            close_timeout: Optional[int] = None,
+            json_codec: Optional[Union[str, JSONCodec]] = None,
+            send_concurrency: int = 5,
+            cache_policy: Optional[CachePolicy] = None,
+            cache_snapshot: Optional[str] = None,
+            cache_database: Optional[str] = None,
+            cache_backend: Optional[Callable[..., CacheBackend]] = None,
+            lazy_objects: bool = False,
+            validation_policy: Optional[Union[str, ValidationPolicy]] = None,
+            early_ready: bool = False,
+            reconnect_policy: Optional[ReconnectPolicy] = None,
+            max_latency: Optional[float] = None,
+            max_missed_heartbeats: Optional[int] = 3,
+            compression: Optional[str] = None
     ):
         """
         :param token: Token that can be passed pre-runtime. If not set, the
@@ -82,18 +105,95 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param close_timeout: Seconds after the websocket will timeout after
          the end handshake didn't complete successfully. Defaults to the pre-set
          environment variable close_timeout (default at 40)
+        :param json_codec: The JSON codec used for decoding and encoding the
+         data of the WebSocket and HTTP. Either 'json', 'orjson', 'ujson',
+         'auto' (fastest installed codec) or a JSONCodec instance. Defaults to
+         the pre-set environment variable json_codec (default 'json')
+        :param send_concurrency: The amount of rooms the outbound message queue
+         sends messages to in parallel. Defaults to 5
+        :param cache_policy: Policy limiting the amount of users and members
+         stored in the cache. Defaults to caching all users and members
+        :param cache_snapshot: Path of a file the cache is saved to when the
+         client closes. If the file exists, the cache is loaded from it on
+         initialisation, so cached data is available before the client is
+         ready. The data is reconciled with Hiven once the client connects
+        :param cache_database: Path of a SQLite database the users and house
+         members are stored in instead of memory, which is recommended for
+         clients in many large houses. ':memory:' uses a database stored in
+         memory. Defaults to storing everything in the in-memory cache
+        :param cache_backend: Class or factory of the CacheBackend used as
+         the storage of the client. Called with the keyword arguments
+         `client`, `policy` and `token`. Further arguments can be bound
+         using `functools.partial()`. Overrides `cache_database`
+        :param lazy_objects: If set to True the messages passed to the
+         message_create and message_update listeners are backed by the raw
+         payload and only validated and formatted once an attribute is
+         accessed that can not be read directly from the payload
+        :param validation_policy: Whether the data received from Hiven is
+         validated using the json-schemas of the types. Either 'always',
+         'never', 'on_error', 'sample:<rate>' or a ValidationPolicy. Only
+         applies to the data of this client. Defaults to the default policy
+         of the process, which is set using the pre-set environment variable
+         validation_policy (default 'always')
+        :param early_ready: If set to True the ready event is called directly
+         after the INIT_STATE was received and the houses are loaded in the
+         background afterwards. The ready listeners run in a separate task,
+         so they can use `wait_house()` to wait until a house was loaded.
+         Events of a house that was not loaded yet are delayed until it was
+         loaded
+        :param reconnect_policy: Policy deciding how long to wait before the
+         WebSocket is restarted after it failed or was closed. Defaults to an
+         exponential backoff with jitter, which opens a circuit breaker after
+         10 consecutive failed attempts
+        :param max_latency: Seconds after which an acknowledged heartbeat
+         counts as missed. Defaults to None, meaning only heartbeats that were
+         not acknowledged at all are missed
+        :param max_missed_heartbeats: Amount of heartbeats in a row that were
+         missed after which the WebSocket is restarted. None to never restart
+         it. Defaults to 3
+        :param compression: The transport compression of the WebSocket.
+         Either 'text_json' (uncompressed), 'zlib_json' or 'zstd_json', which
+         requires the module zstandard. Defaults to the compression of the
+         pre-set environment variable WS_ENDPOINT (default 'text_json')
         """
+        # Loading the environment, which contains the defaults of the module
+        env.ensure_loaded()
+
         self._token: str = token
         self._loop: asyncio.AbstractEventLoop = loop
         self._client_user: Optional[types.User] = None
         self._connection: Optional[Connection] = None
-        self._storage: ClientCache = ClientCache(
+        self._json_codec: JSONCodec = get_json_codec(
+            json_codec if json_codec is not None
+            else os.getenv("HIVEN_JSON_CODEC")
+        )
+        self._validation_policy: Optional[ValidationPolicy] = (
+            get_validation_policy(validation_policy)
+            if validation_policy is not None else None
+        )
+        self._identity_map: IdentityMap = IdentityMap()
+        if cache_backend is None:
+            cache_backend = ClientCache if cache_database is None \
+                else functools.partial(SQLiteClientCache, path=cache_database)
+        self._storage: CacheBackend = cache_backend(
             client=self,
+            policy=cache_policy,
             token=self._token
         )
 
         self._log_websocket: bool = log_websocket
         self._queue_events: bool = queue_events
+        self._lazy_objects: bool = lazy_objects
+        self._early_ready: bool = early_ready
+        self._reconnect_policy: ReconnectPolicy = reconnect_policy \
+            if reconnect_policy is not None else ReconnectPolicy()
+        self._max_latency: Optional[float] = max_latency
+        self._max_missed_heartbeats: Optional[int] = max_missed_heartbeats
+        if compression is not None:
+            # Raising errors of unknown or not installed compressions directly
+            get_transport_compression(compression)
+        self._compression: Optional[str] = compression
+        self._house_waiters: Dict[str, asyncio.Event] = {}
         self._host: Optional[str] = host \
             if host is not None \
             else os.getenv("HIVEN_HOST")
@@ -106,6 +206,12 @@ class HivenClient(HivenEventHandler, HivenObject):
         self._close_timeout: Optional[int] = close_timeout \
             if close_timeout is not None \
             else int(os.getenv("WS_CLOSE_TIMEOUT"))
+        self._send_queue: MessageSendQueue = MessageSendQueue(
+            self, concurrency=send_concurrency
+        )
+        self._cache_snapshot: Optional[str] = cache_snapshot
+        if cache_snapshot is not None:
+            self.storage.load_snapshot(cache_snapshot)
 
         # Inheriting the HivenEventHandler class that will call and trigger
         # the parsers for events
@@ -125,14 +231,92 @@ class HivenClient(HivenEventHandler, HivenObject):
         return '<{} {}>'.format(self.__class__.__name__, ' '.join('%s=%s' % t for t in info))
 
     @property
-    def storage(self) -> Optional[ClientCache]:
+    def storage(self) -> Optional[CacheBackend]:
         """ Returns the Storage/Cache of the Client """
         return getattr(self, '_storage', None)
 
+    @property
+    def identity_map(self) -> Optional[IdentityMap]:
+        """
+        Returns the Identity Map storing the shared instances returned by the
+        get_* methods
+        """
+        return getattr(self, '_identity_map', None)
+
+    @property
+    def lazy_objects(self) -> bool:
+        """
+        Returns whether the objects passed to the message listeners are
+        resolved lazily
+        """
+        return getattr(self, '_lazy_objects', False)
+
+    @property
+    def early_ready(self) -> bool:
+        """
+        Returns whether the ready event is called before the houses were
+        loaded
+        """
+        return getattr(self, '_early_ready', False)
+
+    @property
+    def pending_house_ids(self) -> List[str]:
+        """
+        Returns the ids of the houses of the INIT_STATE that were not loaded
+        yet. Always empty if `early_ready` is False
+        """
+        return getattr(self.connection, 'pending_house_ids', [])
+
+    @property
+    def reconnect_policy(self) -> Optional[ReconnectPolicy]:
+        """
+        Returns the policy deciding how long to wait before the WebSocket is
+        restarted
+        """
+        return getattr(self, '_reconnect_policy', None)
+
+    @property
+    def compression(self) -> Optional[str]:
+        """
+        Returns the transport compression of the WebSocket that was passed
+        on initialisation. None if the compression of the endpoint is used
+        """
+        return getattr(self, '_compression', None)
+
+    @property
+    def max_latency(self) -> Optional[float]:
+        """ Seconds after an acknowledged heartbeat counts as missed """
+        return getattr(self, '_max_latency', None)
+
+    @property
+    def max_missed_heartbeats(self) -> Optional[int]:
+        """
+        Amount of heartbeats in a row that were missed after which the
+        WebSocket is restarted
+        """
+        return getattr(self, '_max_missed_heartbeats', None)
+
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        The round-trip time of the last acknowledged heartbeat in seconds.
+        None if the client is not connected or nothing was measured yet
+        """
+        return getattr(self.connection, 'latency', None)
+
+    @property
+    def validation_policy(self) -> ValidationPolicy:
+        """
+        Returns the ValidationPolicy used for the data of the client. The
+        default policy of the process if no policy was passed
+        """
+        policy = getattr(self, '_validation_policy', None)
+        return policy if policy is not None else current_validation_policy()
+
     @property
     def token(self) -> Optional[str]:
         """ Returns the token of the Client """
-        return self.storage.get('token')
+        return self.storage.get_token()
 
     @property
     def client_type(self) -> Optional[str]:
@@ -148,7 +332,22 @@ class HivenClient(HivenEventHandler, HivenObject):
         """
         Returns whether the run configuration property log_websocket is enabled
         """
-        return self.storage.get('log_websocket', None)
+        return getattr(self, '_log_websocket', None)
+
+    @property
+    def json_codec(self) -> Optional[JSONCodec]:
+        """ Returns the JSON codec used for the WebSocket and HTTP """
+        return getattr(self, '_json_codec', None)
+
+    @property
+    def cache_snapshot(self) -> Optional[str]:
+        """ Returns the path of the cache snapshot file """
+        return getattr(self, '_cache_snapshot', None)
+
+    @property
+    def send_queue(self) -> Optional[MessageSendQueue]:
+        """ Returns the queue for outbound messages """
+        return getattr(self, '_send_queue', None)
 
     @property
     def http(self) -> Optional[HTTP]:
@@ -204,7 +403,7 @@ class HivenClient(HivenEventHandler, HivenObject):
     def client_user(self) -> Optional[types.User]:
         """ The User Object of this client """
         # Always prefers to fetch the most recent data
-        if self.storage['client_user']:
+        if self.storage.get_client_user():
             self._client_user = self.storage.init_client_user_obj()
             return self._client_user
         elif getattr(self, '_client_user', None) is not None:
@@ -309,19 +508,14 @@ class HivenClient(HivenEventHandler, HivenObject):
 
         This includes both house rooms and private rooms
         """
-        rooms = {
-            **self.storage['rooms']['house'],
-            **self.storage['rooms']['private']['single'],
-            **self.storage['rooms']['private']['group']
-        }
-        return list(rooms.keys())
+        return self.storage.get_room_ids()
 
     @property
     def house_ids(self) -> Optional[List[str]]:
         """
         Returns the list of all the ids for all houses available from the cache
         """
-        return self.storage.get('house_ids')
+        return self.storage.get_house_ids()
 
     @property
     def host(self) -> Optional[str]:
@@ -411,7 +605,7 @@ class HivenClient(HivenEventHandler, HivenObject):
             if self._token is None and token is not None:
                 self._token = token
 
-            self.storage['token'] = self._token
+            self.storage.set_token(self._token)
 
             user_token_len: int = utils.safe_convert(
                 int, os.getenv("USER_TOKEN_LEN")
@@ -473,9 +667,69 @@ class HivenClient(HivenEventHandler, HivenObject):
          including the ones created using @client.event(), add_multi_listener()
          and add_single_listener()
         """
+        # Sending or cancelling the queued messages while the HTTP session is
+        # still open
+        await self.send_queue.close(force)
+        if self._cache_snapshot is not None \
+                and self.storage.get_client_user():
+            try:
+                self.storage.save_snapshot(self._cache_snapshot)
+            except Exception:
+                utils.log_traceback(
+                    level='warning',
+                    brief="Failed to save the cache snapshot:",
+                    exc_info=sys.exc_info()
+                )
         await self.connection.close(force, remove_listeners)
         logger.debug(f"[HIVENCLIENT] Client {repr(self)} was closed")
 
+    async def wait_house(
+            self, house_id: str, timeout: Optional[float] = None
+    ) -> Optional[types.House]:
+        """
+        Waits until the house was loaded into the cache. Returns directly if
+        the house is already loaded. Needed if `early_ready` is True, where
+        the houses are loaded after the ready event
+
+        :param house_id: Id of the house
+        :param timeout: Seconds after the waiting is cancelled. None to wait
+         without a timeout
+        :return: The House instance
+        :raises asyncio.TimeoutError: If the timeout was exceeded
+        """
+        if house_id not in self.pending_house_ids \
+                and self.storage.lookup_house(house_id) is not None:
+            return self.get_house(house_id)
+
+        event = self._house_waiters.get(house_id)
+        if event is None:
+            event = self._house_waiters[house_id] = asyncio.Event()
+        await asyncio.wait_for(event.wait(), timeout)
+        return self.get_house(house_id)
+
+    def _house_loaded(self, house_id: str) -> None:
+        """ Wakes up the tasks waiting for the house using wait_house() """
+        event = self._house_waiters.pop(house_id, None)
+        if event is not None:
+            event.set()
+
+    def queue_message(
+            self,
+            room: Union[types.TextRoom, types.PrivateRoom, str],
+            content: str
+    ) -> asyncio.Future:
+        """
+        Queues a message in the outbound message queue. Messages to the same
+        room are sent in order, while multiple rooms are sent to in parallel.
+
+        :param room: The room or the id of the room the message should be
+         sent to
+        :param content: Content of the message
+        :return: A Future that will be set to the resulting Message instance
+         once it was sent
+        """
+        return self.send_queue.put(room, content)
+
     async def edit(self, **kwargs) -> None:
         """
         Edits the Clients data on Hiven
@@ -505,23 +759,40 @@ class HivenClient(HivenEventHandler, HivenObject):
             )
             raise e
 
+    def _get_shared_instance(
+            self, kind: str, key, cls: type, raw_data: Optional[dict]
+    ) -> Optional[DataClassObject]:
+        """
+        Returns the shared instance of the object from the identity map and
+        creates it using the cached data if it does not exist yet
+
+        :param kind: The kind of the object in the identity map
+        :param key: The key of the object, which is usually its id
+        :param cls: The type class of the object
+        :param raw_data: The cached data of the object. If None the object is
+         not cached and None is returned
+        """
+        if not raw_data:
+            return None
+        return self.identity_map.get_or_create(
+            kind, key, lambda: cls(dict(raw_data), self)
+        )
+
     def get_user(self, user_id: str) -> Optional[types.User]:
         """
         Fetches a User instance from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if
-        changes are made while
-        the instance exists the data will not be updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param user_id: id of the User
         :return: The User instance if it was found else None
         """
-        raw_data = self.find_user(user_id)
-        if raw_data:
-            return types.User(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_user(user_id)
+        return self._get_shared_instance(
+            'user', user_id, types.User, raw_data
+        )
 
     def find_user(self, user_id: str) -> Optional[dict]:
         """
@@ -533,7 +804,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param user_id: id of the User
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['users'].get(user_id)
+        raw_data = self.storage.lookup_user(user_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -544,17 +815,16 @@ class HivenClient(HivenEventHandler, HivenObject):
         Fetches a House from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if
-        changes are made while the instance exists the data will not be updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param house_id: id of the House
         :return: The house instance if it was found else None
         """
-        raw_data = self.find_house(house_id)
-        if raw_data:
-            return types.House(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_house(house_id)
+        return self._get_shared_instance(
+            'house', house_id, types.House, raw_data
+        )
 
     def find_house(self, house_id: str) -> Optional[dict]:
         """
@@ -566,7 +836,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param house_id: id of the House
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['houses'].get(house_id)
+        raw_data = self.storage.lookup_house(house_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -577,18 +847,16 @@ class HivenClient(HivenEventHandler, HivenObject):
         Fetches a Entity instance from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if
-        changes are made while the instance exists the data will not be
-        updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param entity_id: id of the Entity
         :return: The Entity instance if it was found else None
         """
-        raw_data = self.find_entity(entity_id)
-        if raw_data:
-            return types.Entity(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_entity(entity_id)
+        return self._get_shared_instance(
+            'entity', entity_id, types.Entity, raw_data
+        )
 
     def find_entity(self, entity_id: str) -> Optional[dict]:
         """
@@ -600,7 +868,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param entity_id: id of the Entity
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['entities'].get(entity_id)
+        raw_data = self.storage.lookup_entity(entity_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -611,17 +879,16 @@ class HivenClient(HivenEventHandler, HivenObject):
         Fetches a Room from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if
-        changes are made while the instance exists the data will not be updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param room_id: id of the Room
         :return: The Room instance if it was found else None
         """
-        raw_data = self.find_room(room_id)
-        if raw_data:
-            return types.TextRoom(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_room(room_id)
+        return self._get_shared_instance(
+            'room', room_id, types.TextRoom, raw_data
+        )
 
     def find_room(self, room_id: str) -> Optional[dict]:
         """
@@ -633,7 +900,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param room_id: id of the Room
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['rooms']['house'].get(room_id)
+        raw_data = self.storage.lookup_room(room_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -644,18 +911,16 @@ class HivenClient(HivenEventHandler, HivenObject):
         Fetches a single PrivateRoom from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if 
-        changes are made while the instance exists the data will not be
-        updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param room_id: id of the PrivateRoom
         :return: The PrivateRoom instance if it was found else None
         """
-        raw_data = self.find_private_room(room_id)
-        if raw_data:
-            return types.PrivateRoom(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_private_room(room_id)
+        return self._get_shared_instance(
+            'private_room', room_id, types.PrivateRoom, raw_data
+        )
 
     def find_private_room(self, room_id: str) -> Optional[dict]:
         """
@@ -667,7 +932,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param room_id: id of the PrivateRoom
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['rooms']['private']['single'].get(room_id)
+        raw_data = self.storage.lookup_private_room(room_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -678,17 +943,16 @@ class HivenClient(HivenEventHandler, HivenObject):
         Fetches a multi PrivateGroupRoom from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if
-        changes are made while the instance exists the data will not be updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param room_id: id of the PrivateGroupRoom
         :return: The PrivateGroupRoom instance if it was found else None
         """
-        raw_data = self.find_private_group_room(room_id)
-        if raw_data:
-            return types.PrivateGroupRoom(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_private_group_room(room_id)
+        return self._get_shared_instance(
+            'private_group_room', room_id, types.PrivateGroupRoom, raw_data
+        )
 
     def find_private_group_room(self, room_id: str) -> Optional[dict]:
         """
@@ -700,7 +964,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param room_id: id of the PrivateGroupRoom
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['rooms']['private']['group'].get(room_id)
+        raw_data = self.storage.lookup_private_group_room(room_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -711,17 +975,16 @@ class HivenClient(HivenEventHandler, HivenObject):
         Fetches a Relationship instance from the cache based on the passed id
 
 
-        The returned data of the instance is only a copy from the cache and if
-        changes are made while the instance exists the data will not be updated!
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
 
         :param user_id: user-id of the Relationship
         :return: The Relationship instance if it was found else None
         """
-        raw_data = self.find_relationship(user_id)
-        if raw_data:
-            return types.Relationship(raw_data, self)
-        else:
-            return None
+        raw_data = self.storage.lookup_relationship(user_id)
+        return self._get_shared_instance(
+            'relationship', user_id, types.Relationship, raw_data
+        )
 
     def find_relationship(self, user_id: str) -> Optional[dict]:
         """
@@ -733,7 +996,7 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param user_id: user-id of the Relationship
         :return: The cached dict if it exists in the cache else None
         """
-        raw_data = self.storage['relationships'].get(user_id)
+        raw_data = self.storage.lookup_relationship(user_id)
         if raw_data:
             return dict(raw_data)
         else:
@@ -745,15 +1008,17 @@ class HivenClient(HivenEventHandler, HivenObject):
         """
         Fetches a member from the cache based on the id
 
+        The returned instance is shared by all lookups of the object and
+        is updated in-place when the cached data changes
+
         :param member_id: The id of the Member which should be fetched
         :param house_id: The id of the House the Member is in
         :return: The Member Instance if it exists else returns None
         """
         cached_member = self.find_house_member(member_id, house_id)
-        if cached_member:
-            return types.Member(cached_member, self._client)
-
-        return None
+        return self._get_shared_instance(
+            'member', (house_id, member_id), types.Member, cached_member
+        )
 
     def find_house_member(
             self, member_id: str, house_id: str
@@ -765,7 +1030,111 @@ class HivenClient(HivenEventHandler, HivenObject):
         :param house_id: The id of the House the Member is in
         :return: The dictionary of the member if it was found
         """
-        return self.storage['houses']\
-            .get(house_id, {})\
-            .get('members', {})\
-            .get(member_id)
+        return self.storage.lookup_house_member(member_id, house_id)
+
+    def get_house_rooms(self, house_id: str) -> List[types.TextRoom]:
+        """
+        Fetches all rooms of a house from the cache using the house index
+
+        :param house_id: id of the House
+        :return: A list of Room instances. Empty if the house is not cached
+        """
+        return [
+            self.get_room(id_)
+            for id_ in self.storage.get_house_room_ids(house_id)
+        ]
+
+    def find_house_rooms(self, house_id: str) -> List[dict]:
+        """
+        Fetches the dictionaries of all rooms of a house from the cache using
+        the house index
+
+        The returned dicts are only copies from the cache
+
+        :param house_id: id of the House
+        :return: A list of the cached dicts. Empty if the house is not cached
+        """
+        return [
+            dict(self.storage.lookup_room(id_))
+            for id_ in self.storage.get_house_room_ids(house_id)
+        ]
+
+    def get_house_entities(self, house_id: str) -> List[types.Entity]:
+        """
+        Fetches all entities of a house from the cache using the house index
+
+        :param house_id: id of the House
+        :return: A list of Entity instances. Empty if the house is not cached
+        """
+        return [
+            self.get_entity(id_)
+            for id_ in self.storage.get_house_entity_ids(house_id)
+        ]
+
+    def find_house_entities(self, house_id: str) -> List[dict]:
+        """
+        Fetches the dictionaries of all entities of a house from the cache
+        using the house index
+
+        The returned dicts are only copies from the cache
+
+        :param house_id: id of the House
+        :return: A list of the cached dicts. Empty if the house is not cached
+        """
+        return [
+            dict(self.storage.lookup_entity(id_))
+            for id_ in self.storage.get_house_entity_ids(house_id)
+        ]
+
+    def get_user_houses(self, user_id: str) -> List[types.House]:
+        """
+        Fetches all houses the user is a member of from the cache using the
+        user index
+
+        :param user_id: id of the User
+        :return: A list of House instances
+        """
+        return [
+            self.get_house(id_)
+            for id_ in self.storage.get_user_house_ids(user_id)
+        ]
+
+    def find_user_houses(self, user_id: str) -> List[dict]:
+        """
+        Fetches the dictionaries of all houses the user is a member of from
+        the cache using the user index
+
+        The returned dicts are only copies from the cache
+
+        :param user_id: id of the User
+        :return: A list of the cached dicts
+        """
+        return [
+            dict(self.storage.lookup_house(id_))
+            for id_ in self.storage.get_user_house_ids(user_id)
+        ]
+
+    def get_user_house_members(self, user_id: str) -> List[types.Member]:
+        """
+        Fetches the members of the user in all houses the user is a member of
+
+        :param user_id: id of the User
+        :return: A list of Member instances
+        """
+        return [
+            self.get_house_member(user_id, id_)
+            for id_ in self.storage.get_user_house_ids(user_id)
+        ]
+
+    def find_user_house_members(self, user_id: str) -> List[dict]:
+        """
+        Fetches the raw data of the members of the user in all houses the user
+        is a member of
+
+        :param user_id: id of the User
+        :return: A list of the dictionaries of the members
+        """
+        return [
+            self.storage.lookup_house_member(user_id, id_)
+            for id_ in self.storage.get_user_house_ids(user_id)
+        ]
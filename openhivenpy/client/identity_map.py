@@ -0,0 +1,132 @@
+"""
+Identity Map of the HivenClient, which stores the created type instances per
+id, so the same instance is returned for every lookup of an object
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import logging
+import weakref
+from typing import Callable, Dict, Hashable, Optional
+
+from ..base_types import DataClassObject, HivenObject
+
+__all__ = ['IdentityMap']
+
+logger = logging.getLogger(__name__)
+
+
+class IdentityMap(HivenObject):
+    """
+    Identity Map storing the instances created by the HivenClient get_*
+    methods per kind ('user', 'house', 'member', ...) and key.
+
+    The instances are only referenced weakly and are removed once they are
+    not used anymore. While an instance exists, it is marked as stale when
+    the cache entry of the object is updated and rebuilt in-place once it is
+    accessed again.
+    """
+    def __init__(self):
+        self._instances: Dict[str, weakref.WeakValueDictionary] = {}
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        info = [
+            ('kinds', len(self._instances)),
+            ('instances', len(self))
+        ]
+        return '<IdentityMap {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    def __len__(self) -> int:
+        return sum(len(i) for i in self._instances.values())
+
+    def get(self, kind: str, key: Hashable) -> Optional[DataClassObject]:
+        """
+        Returns the existing instance of the object
+
+        :param kind: The kind of the object, for example 'user'
+        :param key: The key of the object, which is usually its id
+        :return: The instance if it exists else None
+        """
+        instances = self._instances.get(kind)
+        return instances.get(key) if instances is not None else None
+
+    def get_or_create(
+            self,
+            kind: str,
+            key: Hashable,
+            factory: Callable[[], DataClassObject]
+    ) -> DataClassObject:
+        """
+        Returns the existing instance of the object or creates it using the
+        passed factory
+
+        :param kind: The kind of the object, for example 'user'
+        :param key: The key of the object, which is usually its id
+        :param factory: Callable returning a new instance of the object
+        :return: The shared instance of the object
+        """
+        instances = self._instances.get(kind)
+        if instances is None:
+            instances = self._instances[kind] = weakref.WeakValueDictionary()
+
+        instance = instances.get(key)
+        if instance is None:
+            instance = instances[key] = factory()
+        return instance
+
+    def refresh(self, kind: str, key: Hashable, data: dict) -> None:
+        """
+        Marks the existing instance of the object as stale, so it is rebuilt
+        with the passed data on the next access. Called by the cache after the
+        object was updated
+
+        :param kind: The kind of the object, for example 'user'
+        :param key: The key of the object, which is usually its id
+        :param data: The updated cached data of the object
+        """
+        instance = self.get(kind, key)
+        if instance is not None:
+            instance._refresh(dict(data))
+
+    def forget(self, kind: str, key: Hashable) -> None:
+        """
+        Removes the instance from the map. Existing references are not
+        updated anymore. Called by the cache after the object was removed
+
+        :param kind: The kind of the object, for example 'user'
+        :param key: The key of the object, which is usually its id
+        """
+        instances = self._instances.get(kind)
+        if instances is not None:
+            instances.pop(key, None)
+
+    def clear(self) -> None:
+        """ Removes all instances """
+        self._instances.clear()
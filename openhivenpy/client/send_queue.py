@@ -0,0 +1,201 @@
+"""
+Outbound message queue for sending large amounts of messages to multiple rooms
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple, Union, TYPE_CHECKING
+
+from .. import types
+from ..base_types import HivenObject
+
+if TYPE_CHECKING:
+    from .. import HivenClient
+
+__all__ = ['MessageSendQueue']
+
+logger = logging.getLogger(__name__)
+
+
+class MessageSendQueue(HivenObject):
+    """
+    Queue for outbound messages. Messages to the same room are sent one after
+    another in the order they were queued, while different rooms are processed
+    in parallel up to the set concurrency. The requests are throttled by the
+    rate-limit buckets of the HTTP client.
+    """
+    def __init__(self, client: HivenClient, *, concurrency: int = 5):
+        """
+        :param client: The HivenClient used to send the messages
+        :param concurrency: The amount of messages to different rooms that
+         are sent in parallel
+        """
+        if concurrency < 1:
+            raise ValueError("The concurrency must be at least 1")
+
+        self.client = client
+        self._concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queues: Dict[str, Deque[Tuple[str, asyncio.Future]]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        info = [
+            ('concurrency', self.concurrency),
+            ('rooms', len(self._tasks)),
+            ('pending', self.pending)
+        ]
+        return '<MessageSendQueue {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    @property
+    def concurrency(self) -> Optional[int]:
+        """ Returns the amount of rooms that are sent to in parallel """
+        return getattr(self, '_concurrency', None)
+
+    @property
+    def pending(self) -> int:
+        """ Returns the amount of messages that were not sent yet """
+        return sum(len(queue) for queue in self._queues.values())
+
+    def put(
+            self,
+            room: Union[types.TextRoom, types.PrivateRoom, str],
+            content: str
+    ) -> asyncio.Future:
+        """
+        Queues a new message. Must be called inside a running event loop.
+
+        :param room: The room or the id of the room the message should be
+         sent to
+        :param content: Content of the message
+        :return: A Future that will be set to the resulting Message instance
+         once it was sent, or to the exception raised while sending it
+        """
+        room_id = room if isinstance(room, str) else getattr(room, 'id')
+        future = asyncio.get_running_loop().create_future()
+
+        queue = self._queues.get(room_id)
+        if queue is None:
+            queue = self._queues[room_id] = deque()
+        queue.append((content, future))
+
+        task = self._tasks.get(room_id)
+        if task is None or task.done():
+            self._tasks[room_id] = asyncio.create_task(
+                self._process_room(room_id)
+            )
+        return future
+
+    async def _send(self, room_id: str, content: str) -> types.Message:
+        """
+        Sends a single message to the room
+
+        :return: The Message instance of the sent message
+        """
+        resp = await self.client.http.post(
+            f"/rooms/{room_id}/messages",
+            json={"content": content}
+        )
+        data = types.Message.format_obj_data(resp.data)
+        return types.Message(data, self.client)
+
+    async def _process_room(self, room_id: str) -> None:
+        """ Sends all queued messages of the room one after another """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        queue = self._queues[room_id]
+        try:
+            while queue:
+                # Acquired per message, so a room with many queued messages
+                # does not block the other rooms until it is empty. The
+                # message is only taken out of the queue afterwards, so it is
+                # still cancelled below if the task is cancelled while waiting
+                async with self._semaphore:
+                    content, future = queue.popleft()
+                    if future.done():
+                        # Cancelled by the caller
+                        continue
+
+                    try:
+                        msg = await self._send(room_id, content)
+                    except asyncio.CancelledError:
+                        future.cancel()
+                        raise
+                    except Exception as e:
+                        # The exception is passed on to the caller awaiting
+                        # the future, which is responsible for handling it
+                        logger.debug(
+                            f"[SEND-QUEUE] Failed to send queued message in "
+                            f"room {room_id}: {repr(e)}"
+                        )
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(msg)
+        finally:
+            # Cancelling the messages left if the task was cancelled
+            for _, future in queue:
+                future.cancel()
+            queue.clear()
+
+            if self._tasks.get(room_id) is asyncio.current_task():
+                del self._tasks[room_id]
+            if self._queues.get(room_id) is queue:
+                del self._queues[room_id]
+
+    async def join(self) -> None:
+        """ Waits until all queued messages were sent """
+        while self._tasks:
+            await asyncio.gather(
+                *list(self._tasks.values()), return_exceptions=True
+            )
+
+    async def close(self, force: bool = False) -> None:
+        """
+        Closes the queue
+
+        :param force: If set to True all queued messages that were not sent
+         yet will be cancelled. If False the queue will wait until all
+         messages were sent
+        """
+        if force:
+            tasks = list(self._tasks.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            await self.join()
@@ -0,0 +1,378 @@
+"""
+SQLite backend of the ClientCache, which stores users and house members on
+disk and only keeps the recently used ones in memory
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .cache import CachePolicy, ClientCache
+from ..base_types import HivenObject
+
+if TYPE_CHECKING:
+    from .. import HivenClient
+    from ..json_codec import JSONCodec
+
+__all__ = ['SQLiteClientCache', 'SQLiteStore', 'SQLiteTable']
+
+logger = logging.getLogger(__name__)
+
+# The statements are constant, so sqlite3 prepares them once and reuses them
+# from its statement cache
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "scope TEXT NOT NULL, id TEXT NOT NULL, data TEXT NOT NULL, "
+    "PRIMARY KEY (scope, id)) WITHOUT ROWID"
+)
+_SELECT = "SELECT data FROM entries WHERE scope = ? AND id = ?"
+_SELECT_IDS = "SELECT id FROM entries WHERE scope = ?"
+_COUNT = "SELECT COUNT(*) FROM entries WHERE scope = ?"
+_UPSERT = "INSERT OR REPLACE INTO entries (scope, id, data) VALUES (?, ?, ?)"
+_DELETE = "DELETE FROM entries WHERE scope = ? AND id = ?"
+_DELETE_SCOPE = "DELETE FROM entries WHERE scope = ?"
+_DELETE_ALL = "DELETE FROM entries"
+
+
+class SQLiteStore(HivenObject):
+    """
+    SQLite database storing the entries of all SQLiteTables. Changes are
+    written inside of a transaction, which is committed once per event using
+    `commit()`
+    """
+    def __init__(self, path: str, json_codec: JSONCodec):
+        """
+        :param path: Path of the database file. ':memory:' for a database
+         that is only stored in memory
+        :param json_codec: The codec used to encode the stored entries
+        """
+        self._path = path
+        self._json_codec = json_codec
+        self._tables: Dict[str, SQLiteTable] = {}
+        self._conn = sqlite3.connect(path)
+        # WAL allows reading while writing and avoids a sync per commit
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_CREATE_TABLE)
+        self._conn.commit()
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        info = [
+            ('path', self.path),
+            ('tables', len(self._tables))
+        ]
+        return '<SQLiteStore {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def path(self) -> Optional[str]:
+        """ Returns the path of the database file """
+        return getattr(self, '_path', None)
+
+    def table(self, scope: str, front_size: int) -> SQLiteTable:
+        """
+        Returns the table of the passed scope and creates it if it does not
+        exist yet
+
+        :param scope: The scope of the entries, for example 'users'
+        :param front_size: Amount of entries kept in memory
+        :return: The SQLiteTable of the scope
+        """
+        table = self._tables.get(scope)
+        if table is None:
+            table = self._tables[scope] = SQLiteTable(self, scope, front_size)
+        return table
+
+    def drop(self, scope: str) -> None:
+        """ Removes the table of the scope including all of its entries """
+        self._tables.pop(scope, None)
+        self._conn.execute(_DELETE_SCOPE, (scope,))
+
+    def clear(self) -> None:
+        """ Removes all tables and entries """
+        self._tables.clear()
+        self._conn.execute(_DELETE_ALL)
+        self._conn.commit()
+
+    def read(self, scope: str, id_: str) -> Optional[dict]:
+        """ Returns the stored entry or None if it does not exist """
+        row = self._conn.execute(_SELECT, (scope, id_)).fetchone()
+        return self._json_codec.loads(row[0]) if row else None
+
+    def read_ids(self, scope: str) -> List[str]:
+        """ Returns the ids of all stored entries of the scope """
+        return [row[0] for row in self._conn.execute(_SELECT_IDS, (scope,))]
+
+    def count(self, scope: str) -> int:
+        """ Returns the amount of stored entries of the scope """
+        return self._conn.execute(_COUNT, (scope,)).fetchone()[0]
+
+    def contains(self, scope: str, id_: str) -> bool:
+        """ Returns whether the entry is stored """
+        return self._conn.execute(_SELECT, (scope, id_)).fetchone() is not None
+
+    def write(self, scope: str, entries: List[Tuple[str, dict]]) -> None:
+        """ Inserts or replaces the passed entries in a single batch """
+        dumps = self._json_codec.dumps
+        self._conn.executemany(
+            _UPSERT, [(scope, id_, dumps(data)) for id_, data in entries]
+        )
+
+    def delete(self, scope: str, id_: str) -> bool:
+        """
+        Deletes the stored entry
+
+        :return: True if the entry existed
+        """
+        return self._conn.execute(_DELETE, (scope, id_)).rowcount > 0
+
+    def commit(self) -> None:
+        """ Writes the changed entries of all tables and commits them """
+        for table in self._tables.values():
+            table.flush()
+        self._conn.commit()
+
+    def close(self) -> None:
+        """ Commits all changes and closes the database """
+        self.commit()
+        self._conn.close()
+
+
+class SQLiteTable(MutableMapping):
+    """
+    Dictionary-like view on the entries of a scope inside the SQLiteStore.
+    The recently used entries are kept in an in-memory front cache and are
+    written back to the database when they are evicted from it or the store
+    is committed.
+
+    Returned entries are the same dict instances until they are evicted from
+    the front cache, so they can be updated in-place like the entries of the
+    in-memory cache.
+    """
+    def __init__(self, store: SQLiteStore, scope: str, front_size: int):
+        """
+        :param store: The store the entries are saved in
+        :param scope: The scope of the entries
+        :param front_size: Amount of entries kept in memory
+        """
+        self._store = store
+        self._scope = scope
+        self._front_size = front_size
+        self._front: OrderedDict = OrderedDict()
+        # Entries that might have been modified since they were written
+        self._dirty: set = set()
+        # Entries that are never evicted from memory
+        self._pinned: Dict[str, Optional[dict]] = {}
+
+    def __repr__(self) -> str:
+        info = [
+            ('scope', self.scope),
+            ('front', len(self._front)),
+            ('dirty', len(self._dirty))
+        ]
+        return '<SQLiteTable {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def scope(self) -> Optional[str]:
+        """ Returns the scope of the table """
+        return getattr(self, '_scope', None)
+
+    def pin(self, key: str) -> None:
+        """ Keeps the entry in memory until it is removed """
+        value = self._front.pop(key, None)
+        if value is not None:
+            self._pinned[key] = value
+        elif key is not None:
+            self._pinned.setdefault(key, None)
+
+    def _get_cached(self, key: str) -> Optional[dict]:
+        """ Returns the entry if it is kept in memory """
+        value = self._pinned.get(key)
+        return value if value is not None else self._front.get(key)
+
+    def _cache(self, key: str, value: dict) -> None:
+        """ Adds the entry to the front cache and evicts the oldest ones """
+        self._dirty.add(key)
+        if key in self._pinned:
+            self._pinned[key] = value
+            return
+
+        self._front[key] = value
+        self._front.move_to_end(key)
+
+        evicted = []
+        while len(self._front) > self._front_size:
+            k, data = self._front.popitem(last=False)
+            if k in self._dirty:
+                self._dirty.discard(k)
+                evicted.append((k, data))
+        if evicted:
+            self._store.write(self._scope, evicted)
+
+    def __getitem__(self, key: str) -> dict:
+        value = self._get_cached(key)
+        if value is None:
+            value = self._store.read(self._scope, key)
+            if value is None:
+                raise KeyError(key)
+        # The entry is returned to the caller and might be modified
+        self._cache(key, value)
+        return value
+
+    def __setitem__(self, key: str, value: dict) -> None:
+        self._cache(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        in_memory = self._get_cached(key) is not None
+        self._front.pop(key, None)
+        self._pinned.pop(key, None)
+        self._dirty.discard(key)
+        if not self._store.delete(self._scope, key) and not in_memory:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return self._get_cached(key) is not None \
+            or self._store.contains(self._scope, key)
+
+    def __iter__(self) -> Iterator[str]:
+        self.flush()
+        return iter(self._store.read_ids(self._scope))
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._store.count(self._scope)
+
+    def flush(self) -> None:
+        """ Writes all changed entries of the front cache to the database """
+        if self._dirty:
+            self._store.write(
+                self._scope, [(k, self._get_cached(k)) for k in self._dirty]
+            )
+            self._dirty.clear()
+
+
+class SQLiteClientCache(ClientCache):
+    """
+    ClientCache storing the users and house members in a SQLite database
+    instead of memory, which are the largest part of the cache for clients
+    in many or big houses. Houses, rooms, entities and all other data are
+    still kept in memory.
+
+    The changes of an event are written in a single transaction, which is
+    committed using `commit()` after the event was parsed. The database is
+    cleared on initialisation, since the cache is filled again on connect.
+    """
+    def __init__(
+            self,
+            client: HivenClient,
+            path: str = ':memory:',
+            *,
+            front_size: int = 1000,
+            policy: Optional[CachePolicy] = None,
+            **kwargs
+    ):
+        """
+        :param client: The HivenClient of the cache
+        :param path: Path of the database file. Defaults to a database only
+         stored in memory
+        :param front_size: Amount of users and members per house kept in
+         memory
+        :param policy: Policy limiting the amount of users and members
+        """
+        if front_size < 1:
+            raise ValueError("The front_size must be at least 1")
+
+        self._front_size = front_size
+        self._store = SQLiteStore(path, client.json_codec)
+        self._store.clear()
+        super().__init__(client, policy=policy, **kwargs)
+        self['users'] = self._store.table('users', front_size)
+
+    def __repr__(self) -> str:
+        info = [
+            ('path', self.store.path),
+            ('front_size', self.front_size)
+        ]
+        return '<SQLiteClientCache {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    @property
+    def store(self) -> Optional[SQLiteStore]:
+        """ Returns the SQLiteStore of the cache """
+        return getattr(self, '_store', None)
+
+    @property
+    def front_size(self) -> Optional[int]:
+        """ Returns the amount of entries per table kept in memory """
+        return getattr(self, '_front_size', None)
+
+    def commit(self) -> None:
+        """ Writes all pending changes of the event to the database """
+        self._store.commit()
+
+    def closing_cleanup(self) -> None:
+        super().closing_cleanup()
+        self._store.clear()
+        self['users'] = self._store.table('users', self._front_size)
+
+    def _create_member_storage(self, house_id: str, members: dict):
+        scope = f'members:{house_id}'
+        self._store.drop(scope)
+        table = self._store.table(scope, self._front_size)
+        # The client member is referenced by the house and needs to stay the
+        # same instance
+        table.pin(self['client_user'].get('id'))
+        for id_, member in members.items():
+            table[id_] = member
+        return table
+
+    def remove_house(self, _id: str) -> None:
+        super().remove_house(_id)
+        self._store.drop(f'members:{_id}')
+
+    def load_snapshot_data(self, snapshot: bytes) -> None:
+        super().load_snapshot_data(snapshot)
+        self._store.clear()
+
+        users = self['users']
+        self['users'] = self._store.table('users', self._front_size)
+        self['users'].update(users)
+
+        client_id = self['client_user'].get('id')
+        for id_, house in self['houses'].items():
+            house['members'] = self._create_member_storage(
+                id_, house['members']
+            )
+            house['client_member'] = house['members'].get(client_id)
+        self.commit()
@@ -89,7 +89,7 @@ class UserClient(HivenClient):
         """
         try:
             resp = await self.http.get(f"/relationships/@me/friend-requests")
-            resp = await resp.json()
+            resp = resp.json_data
 
             data = resp.get('data')
 
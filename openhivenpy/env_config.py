@@ -2,15 +2,16 @@ import logging
 import os
 from typing import Optional, Dict, List, Any, Tuple
 
-import pkg_resources
-from dotenv import load_dotenv
-
 from openhivenpy.exceptions import HivenENVError
 
-__all__ = ['HivenENV']
+__all__ = ['HivenENV', 'env']
 
 logger = logging.getLogger(__name__)
 
+# Default amount of directory levels below the working directory that are
+# searched for a .env file when the environment is loaded lazily
+DEFAULT_SEARCH_DEPTH = 2
+
 
 class HivenENV:
     """
@@ -19,7 +20,8 @@ class HivenENV:
     """
     ENV_VAR_KEYS: List[str] = [
         'HIVEN_HOST', 'HIVEN_API_VERSION', 'USER_TOKEN_LEN', 'BOT_TOKEN_LEN',
-        'WS_HEARTBEAT', 'WS_CLOSE_TIMEOUT', 'WS_ENDPOINT'
+        'WS_HEARTBEAT', 'WS_CLOSE_TIMEOUT', 'WS_ENDPOINT', 'HIVEN_JSON_CODEC',
+        'HIVEN_VALIDATION_POLICY'
     ]
     _env_vars: Optional[Dict[str, Any]] = None
 
@@ -27,6 +29,36 @@ class HivenENV:
     def env_vars(self) -> Dict[str, Any]:
         return self._env_vars
 
+    @property
+    def loaded(self) -> bool:
+        """ Returns whether the environment was already loaded """
+        return self._env_vars is not None
+
+    def ensure_loaded(self) -> Dict[str, Any]:
+        """
+        Loads the environment if it was not loaded yet. Called on the
+        initialisation of a HivenClient, so importing the module does not
+        search for .env files.
+
+        If set, the file of the env variable HIVEN_ENV_FILE is loaded.
+        Otherwise the working directory is searched for a .env file up to
+        HIVEN_ENV_SEARCH_DEPTH directory levels deep (default 2, 0 disables
+        the search). Calling `load_env()` before initialising a client
+        overrides both.
+
+        :returns: The loaded environment dictionary
+        """
+        if not self.loaded:
+            max_depth = int(
+                os.getenv('HIVEN_ENV_SEARCH_DEPTH', DEFAULT_SEARCH_DEPTH)
+            )
+            self.load_env(
+                path=os.getenv('HIVEN_ENV_FILE'),
+                search_other=max_depth > 0,
+                max_depth=max_depth
+            )
+        return self._env_vars
+
     def unload_env(self) -> None:
         """ Unloads all openhiven.py environment variables. """
         for elem in self.ENV_VAR_KEYS:
@@ -42,6 +74,8 @@ class HivenENV:
         :returns: The loaded env_vars in a dictionary format and bool if it was
          successful
         """
+        from dotenv import load_dotenv
+
         self.unload_env()
         try:
             if load_dotenv(path, verbose=True, override=True):
@@ -56,8 +90,20 @@ class HivenENV:
         logger.debug(f"Ignoring failed load of {path} as .env file")
         return dict((item, None) for item in self.ENV_VAR_KEYS), False
 
+    def _update_env_vars(self, env_vars: Dict[str, Any]) -> None:
+        """
+        Updates the loaded defaults with the env_vars of another file. The
+        defaults of the variables missing in the file are set again
+        """
+        self._env_vars.update(env_vars)
+        for key, value in self._env_vars.items():
+            if value is not None and os.getenv(key) is None:
+                os.environ[key] = value
+
     def load_default_env(self):
         """ Loads the default library environment file """
+        import pkg_resources
+
         name = 'openhivenpy.env'
         env_path = pkg_resources.resource_filename(__name__, name)
 
@@ -73,7 +119,10 @@ class HivenENV:
             )
 
     def load_env(
-            self, path: Optional[str] = None, search_other: bool = True
+            self,
+            path: Optional[str] = None,
+            search_other: bool = True,
+            max_depth: Optional[int] = None
     ) -> dict:
         """
         Unloads pre-existing openhiven.py-related variables and attempts to
@@ -97,6 +146,9 @@ class HivenENV:
          contain them, it will default to the standard library .env file. To
          avoid this set search_other to False which will automatically default
          to the base file and not load any file.
+        :param max_depth: Maximum amount of directory levels below the
+         working directory that are searched if search_other is True. None
+         searches all directories
         :raises HivenENVError: If the function failed to default back to the
          openhiven.env file and all loading attempts were unsuccessful
         :returns: The loaded environment dictionary
@@ -105,13 +157,21 @@ class HivenENV:
         if path is not None:
             env_vars, success = self.load_env_file(path)
             if success:
-                self._env_vars.update(env_vars)
+                self._update_env_vars(env_vars)
                 return env_vars
 
         if search_other:
             path = os.getcwd()
 
             for root, dirs, files in os.walk(path):
+                if max_depth is not None:
+                    rel_path = os.path.relpath(root, path)
+                    depth = 0 if rel_path == os.curdir \
+                        else rel_path.count(os.sep) + 1
+                    if depth >= max_depth:
+                        # Not descending any further
+                        dirs.clear()
+
                 for file in files:
                     if file.endswith('.env'):
                         env_path = os.path.join(root, file)
@@ -122,10 +182,14 @@ class HivenENV:
                         )
                         env_vars, success = self.load_env_file(env_path)
                         if success:
-                            self._env_vars.update(env_vars)
+                            self._update_env_vars(env_vars)
                             return env_vars
                         else:
                             # Unloading the environment variables since the
                             # file is not in the right format
                             self.unload_env()
                             self.load_default_env()
+
+# Environment of the module, which is loaded on the initialisation of the
+# first HivenClient
+env = HivenENV()
@@ -309,6 +309,10 @@ class HivenEventHandler(HivenObject):
         """
         self._validate_existence_of_event(event_name)
 
+        # Without listeners there is no worker that would execute the event
+        if not self.active_listeners.get(event_name):
+            return
+
         _: MessageBroker = getattr(self, 'message_broker')
         buffer = _.get_buffer(event_name)
         buffer.add_new_event(
@@ -333,6 +337,14 @@ class HivenEventHandler(HivenObject):
         else:
             self.active_listeners[listener.event_name] = [listener]
 
+            # First listener of the event => a worker is required to execute
+            # the incoming events
+            message_broker = self._get_running_message_broker()
+            if message_broker is not None:
+                message_broker.event_consumer.start_worker(
+                    listener.event_name
+                )
+
     def remove_listener(self, listener: DispatchEventListener) -> None:
         """
         Removes the listener from the client cache
@@ -345,6 +357,22 @@ class HivenEventHandler(HivenObject):
         else:
             raise KeyError("The listener does not exist in the cache")
 
+        # Last listener of the event => the worker is not needed anymore
+        if not self.active_listeners[listener.event_name]:
+            message_broker = self._get_running_message_broker()
+            if message_broker is not None:
+                message_broker.event_consumer.stop_worker(listener.event_name)
+
+    def _get_running_message_broker(self) -> Optional[MessageBroker]:
+        """
+        Returns the message_broker if it exists and is currently running its
+        workers, else None
+        """
+        message_broker = getattr(self, 'message_broker', None)
+        if getattr(message_broker, 'running', False):
+            return message_broker
+        return None
+
     async def call_listeners(
             self, event_name: str, args: tuple, kwargs: dict
     ) -> None:
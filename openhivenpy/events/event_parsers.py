@@ -31,7 +31,6 @@ from __future__ import annotations
 import datetime
 import logging
 import time
-from copy import deepcopy
 from functools import wraps
 from typing import Optional, Tuple, TYPE_CHECKING, Dict, Coroutine, List, \
     Union, Awaitable, Callable
@@ -41,10 +40,11 @@ from ..base_types import HivenObject, BaseRoom
 from ..exceptions import InvalidPassedDataError
 from ..gateway import DynamicEventBuffer
 from ..utils import safe_convert
+from ..validation import use_validation_policy
 
 if TYPE_CHECKING:
     from ..client import HivenClient
-    from ..client import ClientCache
+    from ..client import CacheBackend
 
 __all__ = [
     'HivenParsers',
@@ -93,7 +93,7 @@ class HivenParsers(HivenObject):
         self.client: HivenClient = client
 
     @property
-    def storage(self) -> Optional[ClientCache]:
+    def storage(self) -> Optional[CacheBackend]:
         """ 
         Returns the cached storage """
         return getattr(self.client, 'storage', None)
@@ -110,6 +110,31 @@ class HivenParsers(HivenObject):
             kwargs
         )
 
+    def _add_to_buffer(
+            self,
+            buffer: DynamicEventBuffer,
+            data: dict,
+            args: tuple,
+            kwargs: dict
+    ) -> None:
+        """
+        Adds the event to the passed buffer if listeners are assigned to it.
+        Events without listeners are discarded, since no worker would be
+        running that could execute them
+        """
+        if self.client.active_listeners.get(buffer.event):
+            buffer.add_new_event(data, args, kwargs)
+
+    def _has_listeners(self, *events: str) -> bool:
+        """
+        Returns whether listeners are assigned to one of the passed events.
+        Parsers will only apply the cache changes and skip the creation of the
+        listener objects if no listeners exist
+
+        :param events: The listener event names that should be checked
+        """
+        return any(self.client.active_listeners.get(e) for e in events)
+
     async def dispatch(self, event: str, data: dict) -> Tuple[list, dict]:
         """
         Dispatches the parser and returns the args and kwargs. Note that this
@@ -124,8 +149,15 @@ class HivenParsers(HivenObject):
         coro = getattr(self, format_event_as_listener(event), None)
 
         if callable(coro):
-            new_data: dict = deepcopy(data)
-            return await coro(new_data)
+            # The data is owned by the parser and is passed to the cache
+            # without copying it. Parsers that still require the original
+            # data after updating the cache need to copy it themselves
+            try:
+                with use_validation_policy(self.client.validation_policy):
+                    return await coro(data)
+            finally:
+                # Writing the changes of the event in a single batch
+                self.storage.commit()
         else:
             logger.warning(f"[EVENTS] Parser for event {event} was not found!")
 
@@ -143,11 +175,15 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
-        old_user_data = self.storage['users'][data['id']]  # cached data
+        if not self._has_listeners('user_update'):
+            self.storage.add_or_update_user(data)
+            return (), {}
+
+        old_user_data = self.storage.lookup_user(data['id'])  # cached data
         old_user = types.User(old_user_data, self.client)
 
-        user_data = self.storage.add_or_update_user(data)
-        new_user = types.User(user_data, self.client)
+        self.storage.add_or_update_user(data)
+        new_user = self.client.get_user(old_user.id)
 
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.User, types.User] = (old_user, new_user)
@@ -156,7 +192,7 @@ class HivenParsers(HivenObject):
         buffer: DynamicEventBuffer = self._get_from_client_buffer(
             'user_update'
         )
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -170,10 +206,13 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
-        self.storage.add_or_update_house(data)
+        if not self._has_listeners('house_join'):
+            self.storage.add_or_update_house(data)
+            return (), {}
 
-        new_house_data = types.House.format_obj_data(data)
-        new_house = types.House(new_house_data, self.client)
+        house_id = data['id']
+        self.storage.add_or_update_house(data)
+        new_house = self.client.get_house(house_id)
 
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.House] = \
@@ -181,7 +220,7 @@ class HivenParsers(HivenObject):
         kwargs: Dict = {}
 
         buffer = self._get_from_client_buffer('house_join')
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -195,18 +234,22 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
-        old_house_data = self.storage['houses'][data['id']]
+        if not self._has_listeners('house_update'):
+            self.storage.add_or_update_house(data)
+            return (), {}
+
+        old_house_data = self.storage.lookup_house(data['id'])
         old_house = types.House(old_house_data, self.client)
 
-        new_house_data = self.storage.add_or_update_house(data)
-        new_house = types.House(new_house_data, self.client)
+        self.storage.add_or_update_house(data)
+        new_house = self.client.get_house(old_house.id)
 
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.House, types.House] = (old_house, new_house)
         kwargs: Dict = {}
 
         buffer = self._get_from_client_buffer('house_update')
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -235,7 +278,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple = tuple([data['house_id']])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -250,13 +293,15 @@ class HivenParsers(HivenObject):
         :returns: Args and Kwargs generated by the Parser
         """
         self.storage.remove_house(data['house_id'])
+        if not self._has_listeners('house_leave'):
+            return (), {}
 
         # Parameter that will be passed to the assigned listener
         args: Tuple = tuple([data['house_id']])
         kwargs: Dict = {}
 
         buffer = self._get_from_client_buffer('house_leave')
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -271,6 +316,9 @@ class HivenParsers(HivenObject):
         :returns: Args and Kwargs generated by the Parser
         """
         self.client.storage.add_or_update_room(data)
+        if not self._has_listeners('room_create'):
+            return (), {}
+
         room: types.TextRoom = self.client.get_room(data['id'])
 
         buffer = self._get_from_client_buffer('room_create')
@@ -278,7 +326,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.TextRoom] = tuple([room])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -295,6 +343,9 @@ class HivenParsers(HivenObject):
         :returns: Args and Kwargs generated by the Parser
         """
         self.client.storage.add_or_update_room(data)
+        if not self._has_listeners('room_update'):
+            return (), {}
+
         room: types.TextRoom = self.client.get_room(data['id'])
 
         buffer = self._get_from_client_buffer('room_update')
@@ -302,7 +353,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.TextRoom] = tuple([room])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -316,6 +367,10 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        if not self._has_listeners('room_delete'):
+            self.client.storage.remove_room(data['id'])
+            return (), {}
+
         room: types.TextRoom = self.client.get_room(data['id'])
         self.client.storage.remove_room(data['id'])
 
@@ -324,7 +379,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.TextRoom] = tuple([room])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -339,6 +394,9 @@ class HivenParsers(HivenObject):
         :returns: Args and Kwargs generated by the Parser
         """
         self.client.storage.add_or_update_house_member(data)
+        if not self._has_listeners('house_member_join'):
+            return (), {}
+
         mem: types.Member = self.client.get_house_member(
             data['user']['id'], data['house_id']
         )
@@ -348,7 +406,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Member] = tuple([mem])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -364,6 +422,10 @@ class HivenParsers(HivenObject):
         """
         mem_id: str = data['user']['id']
         house_id: str = data['house_id']
+        if not self._has_listeners('house_member_leave'):
+            self.client.storage.remove_house_member(mem_id, house_id)
+            return (), {}
+
         mem: types.Member = self.client.get_house_member(mem_id, house_id)
         self.client.storage.remove_house_member(mem_id, house_id)
 
@@ -372,7 +434,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Member] = tuple([mem])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -406,6 +468,9 @@ class HivenParsers(HivenObject):
             else data.get('user', {}).get('id')
 
         self.client.storage.add_or_update_house_member(data)
+        if not self._has_listeners('house_member_online'):
+            return (), {}
+
         mem: types.Member = self.client.get_house_member(
             user_id, data['house_id']
         )
@@ -415,7 +480,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Member] = tuple([mem])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -448,16 +513,25 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        if not self._has_listeners('house_member_offline'):
+            self.client.storage.mark_house_member_offline(
+                data['id'], data['house_id']
+            )
+            return (), {}
+
         mem: types.Member = self.client.get_house_member(
             data['id'], data['house_id']
         )
+        self.client.storage.mark_house_member_offline(
+            data['id'], data['house_id']
+        )
 
         buffer = self._get_from_client_buffer('house_member_offline')
 
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Member] = tuple([mem])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -473,6 +547,9 @@ class HivenParsers(HivenObject):
             else data.get('user', {}).get('id')
 
         self.client.storage.add_or_update_house_member(data)
+        if not self._has_listeners('house_member_update'):
+            return (), {}
+
         mem: types.Member = self.client.get_house_member(
             user_id, data['house_id']
         )
@@ -482,7 +559,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Member] = tuple([mem])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -496,13 +573,18 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        members_data: Dict = data.get('members')
+        if not self._has_listeners('house_members_chunk'):
+            for _, mem_data in members_data.items():
+                self.client.storage.add_or_update_house_member(mem_data)
+            return (), {}
+
         user_id = data['user_id'] if data.get('user_id') \
             else data.get('user', {}).get('id')
 
         house: types.House = self.client.get_house('house_id')
 
         members: List[types.Member] = []
-        members_data: Dict = data.get('members')
         # Updating for every entry and appending the item
         for _, mem_data in members_data.items():
             self.client.storage.add_or_update_house_member(mem_data)
@@ -515,7 +597,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.House, List[types.Member]] = (house, members)
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -531,10 +613,15 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        members_data: Dict = data.get('data')
+        if not self._has_listeners('batch_house_member_update'):
+            for _, mem_data in members_data.items():
+                self.client.storage.add_or_update_house_member(mem_data)
+            return (), {}
+
         house: types.House = self.client.get_house('house_id')
 
         members: List[types.Member] = []
-        members_data: Dict = data.get('data')
         # Updating for every entry and appending the item
         for _, mem_data in members_data.items():
             self.client.storage.add_or_update_house_member(mem_data)
@@ -547,7 +634,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.House, List[types.Member]] = (house, members)
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -561,9 +648,16 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        if not self._has_listeners('house_entity_update'):
+            for i in data.get('entities'):
+                i['house_id'] = data.get('house_id')
+                self.client.storage.add_or_update_entity(i)
+            return (), {}
+
         entities: List[types.Entity] = []
         for i in data.get('entities'):
-            self.client.storage.add_or_update_entity(data)
+            i['house_id'] = data.get('house_id')
+            self.client.storage.add_or_update_entity(i)
             entities.append(self.client.get_entity(i['id']))
 
         buffer = self._get_from_client_buffer('house_entity_update')
@@ -571,7 +665,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[List[types.Entity]] = tuple([entities])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -586,6 +680,9 @@ class HivenParsers(HivenObject):
         :returns: Args and Kwargs generated by the Parser
         """
         self.client.storage.add_or_update_relationship(data)
+        if not self._has_listeners('relationship_update'):
+            return (), {}
+
         relationship: types.Relationship = self.client.get_relationship(
             data['id']
         )
@@ -595,7 +692,7 @@ class HivenParsers(HivenObject):
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Relationship] = tuple([relationship])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -610,13 +707,16 @@ class HivenParsers(HivenObject):
         :returns: Args and Kwargs generated by the Parser
         """
         self.client.storage.add_or_update_user(data)
+        if not self._has_listeners('presence_update'):
+            return (), {}
+
         user: types.User = self.client.get_user(data['id'])
 
         buffer = self._get_from_client_buffer('presence_update')
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.User] = tuple([user])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -630,15 +730,21 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
-        msg_data = types.Message.format_obj_data(data)
-        msg = types.Message(msg_data, self.client)
+        if not self._has_listeners('message_create'):
+            return (), {}
+
+        if self.client.lazy_objects:
+            msg = types.Message.lazy(data, self.client)
+        else:
+            msg_data = types.Message.format_obj_data(data)
+            msg = types.Message(msg_data, self.client)
 
         buffer = self._get_from_client_buffer('message_create')
 
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Message] = tuple([msg])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -652,15 +758,21 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
-        msg_data = types.Message.format_obj_data(data)
-        msg = types.Message(msg_data, self.client)
+        if not self._has_listeners('message_update'):
+            return (), {}
+
+        if self.client.lazy_objects:
+            msg = types.Message.lazy(data, self.client)
+        else:
+            msg_data = types.Message.format_obj_data(data)
+            msg = types.Message(msg_data, self.client)
 
         buffer = self._get_from_client_buffer('message_update')
 
         # Parameter that will be passed to the assigned listener
         args: Tuple[types.Message] = tuple([msg])
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -674,6 +786,9 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        if not self._has_listeners('message_delete'):
+            return (), {}
+
         buffer = self._get_from_client_buffer('message_delete')
 
         # Parameter that will be passed to the assigned listener
@@ -683,7 +798,7 @@ class HivenParsers(HivenObject):
             data.get('house_id')
         )
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     @log_parser_error()
@@ -699,6 +814,9 @@ class HivenParsers(HivenObject):
 
         :returns: Args and Kwargs generated by the Parser
         """
+        if not self._has_listeners('typing_start'):
+            return (), {}
+
         room_id: str = data['room_id']
         if 'recipient_ids' not in data.keys():
             room = self.client.get_room(room_id)
@@ -722,7 +840,7 @@ class HivenParsers(HivenObject):
             user, room, timestamp
         )
         kwargs: Dict = {}
-        buffer.add_new_event(data, args, kwargs)
+        self._add_to_buffer(buffer, data, args, kwargs)
         return args, kwargs
 
     # TODO! Add role_update
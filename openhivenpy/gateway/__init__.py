@@ -32,12 +32,19 @@ import asyncio
 import logging
 import os
 import sys
-from typing import Optional, TYPE_CHECKING
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, TYPE_CHECKING
 
 from yarl import URL
 
+from .compression import *
 from .http import *
+from .latency import *
 from .messagebroker import *
+from .ratelimit import *
+from .reconciler import *
+from .reconnect import *
 from .websocket import *
 from .. import utils
 from ..base_types import HivenObject
@@ -57,6 +64,8 @@ class Connection(HivenObject):
     Connection Class used for interaction with the Hiven API and WebSocket
     Swarm
     """
+    # Amount of attempts the time until the client was ready is stored for
+    READY_TIMES_SIZE = 50
 
     def __init__(
             self,
@@ -64,6 +73,10 @@ class Connection(HivenObject):
     ):
         # Connection Configuration
         self._endpoint = URL(os.getenv("WS_ENDPOINT"))
+        if client.compression is not None:
+            self._endpoint = self._endpoint.update_query(
+                compression=client.compression
+            )
 
         # Values set by the Connection class
         self._connection_status = "CLOSED"
@@ -74,6 +87,17 @@ class Connection(HivenObject):
         self._ws = None
 
         self._client: HivenClient = client
+        # Kept for the entire lifetime of the connection, so the houses can be
+        # reconciled after the WebSocket was restarted
+        self._house_reconciler = HouseReconciler(client)
+
+        # Statistics of the connection attempts of the WebSocket
+        self._attempts = 0
+        self._failures = 0
+        self._attempt_start: Optional[float] = None
+        self._ready_since: Optional[float] = None
+        self._ready_times: Deque[float] = deque(maxlen=self.READY_TIMES_SIZE)
+        self._last_close_code: Optional[int] = None
         self._http: HTTP = HTTP(
             self.client,
             host=self.host,
@@ -141,6 +165,11 @@ class Connection(HivenObject):
         """ Returns the endpoint as an URL object """
         return getattr(self, '_endpoint', None)
 
+    @property
+    def compression(self) -> str:
+        """ Returns the transport compression of the WebSocket endpoint """
+        return self.endpoint.query.get('compression', TEXT_JSON)
+
     @property
     def host(self) -> Optional[str]:
         """ Returns the Hiven host url """
@@ -174,6 +203,62 @@ class Connection(HivenObject):
         """ Returns the WebSocket instance if it exists """
         return getattr(self, '_ws', None)
 
+    @property
+    def house_reconciler(self) -> Optional[HouseReconciler]:
+        """
+        Returns the HouseReconciler, which updates the cached houses after the
+        WebSocket was restarted
+        """
+        return getattr(self, '_house_reconciler', None)
+
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        The round-trip time of the last acknowledged heartbeat in seconds
+        """
+        return getattr(self.keep_alive, 'latency', None)
+
+    @property
+    def reconnect_policy(self) -> Optional[ReconnectPolicy]:
+        """ Returns the ReconnectPolicy of the client """
+        return getattr(self.client, 'reconnect_policy', None)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the statistics of the connection:
+
+        - 'attempts': Started attempts to connect the WebSocket
+        - 'reconnects': Restarts of the WebSocket after the first attempt
+        - 'failures': Consecutive attempts that ended without being ready
+        - 'circuit_open': Whether the circuit breaker is open
+        - 'ready_times': Seconds until the client was ready per attempt, for
+          the last `READY_TIMES_SIZE` attempts that became ready
+        - 'last_close_code': The last close code of the WebSocket if it was
+          closed by Hiven
+        - 'uptime': Seconds since the current WebSocket is ready. 0 if it is
+          not ready
+        - 'latency': The round-trip time of the last heartbeat in seconds
+        """
+        ready_since = getattr(self, '_ready_since', None)
+        failures = getattr(self, '_failures', 0)
+        policy = self.reconnect_policy
+        return {
+            'attempts': getattr(self, '_attempts', 0),
+            'reconnects': max(getattr(self, '_attempts', 0) - 1, 0),
+            'failures': failures,
+            'circuit_open': bool(policy and policy.circuit_open(failures)),
+            'ready_times': list(getattr(self, '_ready_times', ())),
+            'last_close_code': getattr(self, '_last_close_code', None),
+            'uptime': time.time() - ready_since if ready_since else 0.0,
+            'latency': self.latency
+        }
+
+    @property
+    def pending_house_ids(self) -> List[str]:
+        """ Returns the ids of the houses that were not loaded yet """
+        return getattr(self.ws, 'pending_house_ids', [])
+
     @property
     def closed(self) -> Optional[bool]:
         """ Returns True if the connection is closed """
@@ -205,6 +290,7 @@ class Connection(HivenObject):
             await self.http.connect()
 
             while self.connection_status == "OPENING":
+                self._start_attempt()
                 try:
                     coro = HivenWebSocket.create_from_client(
                         self.client,
@@ -267,6 +353,9 @@ class Connection(HivenObject):
 
                 # Resetting the status
                 self._reset_status("OPENING")
+                self._end_attempt()
+                if self.connection_status == "OPENING":
+                    await self._wait_before_reconnect()
 
         except KeyboardInterrupt:
             ...
@@ -305,6 +394,62 @@ class Connection(HivenObject):
             self.set_default_properties()
             self._closing = False
 
+    def _start_attempt(self) -> None:
+        """ Called before a new WebSocket is created """
+        self._attempts += 1
+        self._attempt_start = time.time()
+
+    def _on_ready(self) -> None:
+        """ Called by the WebSocket once the client is ready """
+        now = time.time()
+        if self._attempt_start is not None:
+            self._ready_times.append(now - self._attempt_start)
+        self._ready_since = now
+        self._failures = 0
+
+    def _end_attempt(self) -> None:
+        """ Called after the WebSocket failed or was closed """
+        close_code = getattr(self.ws, 'close_code', None)
+        if close_code is not None:
+            self._last_close_code = close_code
+        # Sessions that were ready do not count as failed, since only the
+        # consecutive attempts that never became ready open the breaker
+        if self._ready_since is None:
+            self._failures += 1
+        self._attempt_start = None
+        self._ready_since = None
+
+    async def _wait_before_reconnect(self) -> None:
+        """
+        Waits for the delay of the ReconnectPolicy before the next attempt
+
+        :raises SessionCreateError: If the circuit breaker opened and the
+         policy has no cooldown
+        """
+        delay = self.reconnect_policy.get_delay(self._failures)
+        if delay is None:
+            raise SessionCreateError(
+                f"Giving up after {self._failures} failed attempts to "
+                f"connect to Hiven"
+            )
+
+        if self.reconnect_policy.circuit_open(self._failures):
+            logger.error(
+                f"[CONNECTION] Circuit breaker is open after {self._failures}"
+                f" failed attempts! Retrying in {delay:.2f}s"
+            )
+        else:
+            logger.info(f"[CONNECTION] Restarting the WebSocket in "
+                        f"{delay:.2f}s")
+
+        # Sleeping in steps, so closing the connection is not delayed
+        deadline = time.time() + delay
+        while self.connection_status == "OPENING":
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, .05))
+
     def _reset_status(self, connection_status: str):
         """
         Resets the status to being currently opening and not being active
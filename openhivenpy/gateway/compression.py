@@ -0,0 +1,272 @@
+"""
+Transport compressions of the Hiven Swarm, which decompress the binary frames
+received over the WebSocket
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import importlib
+import re
+import zlib
+from abc import abstractmethod
+from typing import Dict, List, Optional
+
+from ..base_types import HivenObject
+
+__all__ = [
+    'TransportCompression', 'ZlibStreamCompression', 'ZstdStreamCompression',
+    'get_transport_compression', 'TEXT_JSON'
+]
+
+# Name of the default transport, which sends uncompressed text frames
+TEXT_JSON = 'text_json'
+
+
+class TransportCompression(HivenObject):
+    """
+    Base class of a transport compression. The name is the value of the
+    `compression` query parameter of the WebSocket endpoint.
+
+    A new instance is created for every WebSocket, since the compressed
+    stream spans the entire connection and the context of the decompressor
+    is kept between the frames.
+    """
+    name: str = None
+    module_name: str = None
+
+    def __repr__(self) -> str:
+        info = [
+            ('name', self.name)
+        ]
+        return '<{} {}>'.format(
+            self.__class__.__name__, ' '.join('%s=%s' % t for t in info)
+        )
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Returns whether the module required by the compression is installed
+        """
+        try:
+            importlib.import_module(cls.module_name)
+            return True
+        except ImportError:
+            return False
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> Optional[bytes]:
+        """
+        Decompresses the data of a received binary frame
+
+        :param data: The compressed data of the frame
+        :return: The decompressed message or None if the message is not
+         complete yet and continues in the next frame
+        :raises ValueError: If the data is not valid compressed data
+        """
+
+
+class ZlibStreamCompression(TransportCompression):
+    """
+    zlib compressed stream, where every message ends with a Z_SYNC_FLUSH
+    marker. Messages split over multiple frames are buffered until the
+    marker was received
+    """
+    name = 'zlib_json'
+    module_name = 'zlib'
+
+    # Suffix of the data written by a Z_SYNC_FLUSH
+    ZLIB_SUFFIX = b'\x00\x00\xff\xff'
+
+    def __init__(self):
+        self._decompressor = zlib.decompressobj()
+        self._buffer = bytearray()
+
+    def decompress(self, data: bytes) -> Optional[bytes]:
+        if not self._buffer and data.endswith(self.ZLIB_SUFFIX):
+            # Avoiding copying the data if the message was not split
+            buffer = data
+        else:
+            self._buffer.extend(data)
+            if not self._buffer.endswith(self.ZLIB_SUFFIX):
+                return None
+            buffer = bytes(self._buffer)
+            self._buffer.clear()
+
+        try:
+            return self._decompressor.decompress(buffer)
+        except zlib.error as e:
+            raise ValueError("Received invalid zlib compressed data") from e
+
+
+class _JSONMessageScanner:
+    """
+    Incremental scanner finding the end of a JSON object or array, which is
+    split over multiple chunks. Only the newly passed chunks are scanned,
+    since the state of the scan is kept between the calls
+    """
+    # Characters changing the state of the scan outside and inside strings
+    _STRUCTURE = re.compile(rb'["{}\[\]]')
+    _STRING = re.compile(rb'["\\]')
+
+    __slots__ = ('_depth', '_in_string', '_escaped')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """ Resets the state to the start of a new message """
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Scans the passed chunk, which continues the previously passed ones
+
+        :param data: The next chunk of the message
+        :return: True if the chunk completed the message. The state is reset
+         afterwards
+        """
+        depth = self._depth
+        in_string = self._in_string
+        pos = 0
+        end = len(data)
+        if self._escaped and end:
+            # The previous chunk ended with the backslash of an escape
+            self._escaped = False
+            pos = 1
+
+        while pos < end:
+            if in_string:
+                match = self._STRING.search(data, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if data[match.start()] == 0x5C:  # backslash
+                    if pos >= end:
+                        self._escaped = True
+                        break
+                    pos += 1
+                else:
+                    in_string = False
+            else:
+                match = self._STRUCTURE.search(data, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                char = data[match.start()]
+                if char == 0x22:  # quote
+                    in_string = True
+                elif char in (0x7B, 0x5B):  # opening brackets
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth <= 0:
+                        self.reset()
+                        return True
+
+        self._depth = depth
+        self._in_string = in_string
+        return False
+
+
+class ZstdStreamCompression(TransportCompression):
+    """
+    Zstandard compressed stream (https://pypi.org/project/zstandard/), where
+    every message is flushed. Requires the `zstandard` module.
+
+    The flushed blocks do not contain a marker like the zlib stream, so the
+    decompressed output of messages split over multiple frames is buffered
+    until it contains a complete JSON document. The output is scanned
+    incrementally and only joined once the message is complete
+    """
+    name = 'zstd_json'
+    module_name = 'zstandard'
+
+    def __init__(self):
+        import zstandard
+        self._error = zstandard.ZstdError
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        self._scanner = _JSONMessageScanner()
+        self._chunks: List[bytes] = []
+
+    def decompress(self, data: bytes) -> Optional[bytes]:
+        try:
+            output = self._decompressor.decompress(data)
+        except self._error as e:
+            raise ValueError("Received invalid zstd compressed data") from e
+
+        if not output:
+            return None
+        elif not self._scanner.feed(output):
+            self._chunks.append(output)
+            return None
+        elif not self._chunks:
+            # Avoiding copying the output if the message was not split
+            return output
+
+        self._chunks.append(output)
+        message = b''.join(self._chunks)
+        self._chunks.clear()
+        return message
+
+
+_COMPRESSIONS: Dict[str, type] = {
+    ZlibStreamCompression.name: ZlibStreamCompression,
+    ZstdStreamCompression.name: ZstdStreamCompression
+}
+
+
+def get_transport_compression(
+        name: Optional[str] = None
+) -> Optional[TransportCompression]:
+    """
+    Returns a new instance of the transport compression
+
+    :param name: The name of the compression ('text_json', 'zlib_json' or
+     'zstd_json'). None for 'text_json'
+    :return: The TransportCompression instance or None for 'text_json',
+     which is not compressed
+    :raises ValueError: If the name of the compression is unknown
+    :raises ImportError: If the module required by the compression is not
+     installed
+    """
+    if name is None or name == TEXT_JSON:
+        return None
+
+    compression_cls = _COMPRESSIONS.get(name)
+    if compression_cls is None:
+        raise ValueError(
+            f"Unknown transport compression '{name}'! Expected one of: "
+            f"{', '.join([TEXT_JSON, *_COMPRESSIONS.keys()])}"
+        )
+    elif not compression_cls.available():
+        raise ImportError(
+            f"The transport compression '{name}' requires the module "
+            f"'{compression_cls.module_name}' to be installed"
+        )
+    return compression_cls()
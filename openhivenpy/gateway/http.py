@@ -29,7 +29,6 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json as json_decoder
 import logging
 import sys
 import time
@@ -38,10 +37,12 @@ from typing import Optional, Union
 import aiohttp
 from yarl import URL
 
-__all__ = ['HTTP']
+__all__ = ['HTTP', 'HTTPResponse']
 
 from ..base_types import HivenObject
+from .ratelimit import RateLimitManager
 from .. import utils
+from ..json_codec import JSONCodec, get_json_codec
 from ..exceptions import (SessionCreateError,
                           HTTPFailedRequestError, HTTPRequestTimeoutError,
                           HTTPReceivedNoDataError, HTTPSessionNotReadyError,
@@ -94,6 +95,105 @@ class HTTPTraceback(HivenObject):
         logger.debug(f"[HTTP] >> HTTP {params.method} with {params.url} queued!")
 
 
+class HTTPResponse(HivenObject):
+    """
+    Response of a finished HTTP request. Stores the response body, which was
+    already decoded while validating the request, so callers do not need to
+    read and decode it again.
+    """
+    def __init__(
+            self,
+            response: aiohttp.ClientResponse,
+            *,
+            raw: bytes,
+            json_data: Optional[dict],
+            elapsed: float
+    ):
+        """
+        :param response: The aiohttp response of the request
+        :param raw: The raw response body
+        :param json_data: The decoded JSON response body. None if the response
+         body was empty
+        :param elapsed: Seconds it took to complete the request, including
+         the time waited on rate-limits
+        """
+        self._response = response
+        self._status = response.status
+        self._raw = raw
+        self._json_data = json_data
+        self._elapsed = elapsed
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        info = [
+            ('status', self.status),
+            ('method', getattr(self.response, 'method', None)),
+            ('url', getattr(self.response, 'url', None)),
+            ('elapsed', self.elapsed)
+        ]
+        return '<HTTPResponse {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def response(self) -> Optional[aiohttp.ClientResponse]:
+        """ Returns the underlying aiohttp.ClientResponse """
+        return getattr(self, '_response', None)
+
+    @property
+    def status(self) -> Optional[int]:
+        """ Returns the HTTP status code of the response """
+        return getattr(self, '_status', None)
+
+    @property
+    def headers(self) -> Optional[dict]:
+        """ Returns the headers of the response """
+        return getattr(self.response, 'headers', None)
+
+    @property
+    def raw(self) -> Optional[bytes]:
+        """ Returns the raw response body """
+        return getattr(self, '_raw', None)
+
+    @property
+    def json_data(self) -> Optional[dict]:
+        """
+        Returns the decoded JSON response body. None if the response was empty
+        """
+        return getattr(self, '_json_data', None)
+
+    @property
+    def data(self) -> Optional[Union[dict, list]]:
+        """ Returns the 'data' field of the decoded response body """
+        if self.json_data:
+            return self.json_data.get('data')
+        return None
+
+    @property
+    def success(self) -> Optional[bool]:
+        """ Returns the 'success' field of the decoded response body """
+        if self.json_data:
+            return self.json_data.get('success')
+        return None
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """ Returns the seconds it took to complete the request """
+        return getattr(self, '_elapsed', None)
+
+    async def read(self) -> Optional[bytes]:
+        """ Returns the raw response body """
+        return self.raw
+
+    async def json(self, **kwargs) -> Optional[dict]:
+        """
+        Returns the already decoded JSON response body. Exists for
+        compatibility with `aiohttp.ClientResponse.json()`, passed arguments
+        are therefore ignored
+        """
+        return self.json_data
+
+
 class HTTP:
     """ HTTP-Client for requests and interaction with the Hiven API """
 
@@ -117,6 +217,7 @@ class HTTP:
         }
         self._ready = False
         self._session = None  # Will be created during start of connection
+        self._rate_limits = RateLimitManager()
 
         # Current request/Latest request
         self._request = None
@@ -153,6 +254,20 @@ class HTTP:
         """ Returns the Asyncio Event-loop """
         return getattr(self.client, '_loop', None)
 
+    @property
+    def rate_limits(self) -> Optional[RateLimitManager]:
+        """ Returns the manager of the per-route Rate-Limit buckets """
+        return getattr(self, '_rate_limits', None)
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """
+        Returns the JSON codec of the client used to decode and encode the
+        request data. Defaults to the stdlib codec if none was set
+        """
+        codec = getattr(self.client, 'json_codec', None)
+        return codec if codec is not None else get_json_codec(None)
+
     async def connect(self) -> Optional[aiohttp.ClientSession]:
         """
         Establishes for the HTTP a connection to Hiven
@@ -168,14 +283,16 @@ class HTTP:
             trace_config.on_connection_queued_start.append(HTTPTraceback.on_connection_queued_start)
             trace_config.on_response_chunk_received.append(HTTPTraceback.on_response_chunk_received)
 
-            self._session = aiohttp.ClientSession(trace_configs=[trace_config])
+            self._session = aiohttp.ClientSession(
+                trace_configs=[trace_config],
+                json_serialize=self.json_codec.dumps
+            )
             self._ready = True
 
             resp = await self.get("/users/@me", timeout=30)
-            resp_json: dict = await resp.json()
 
             logger.info("[HTTP] Session was successfully created!")
-            self.client.storage.update_client_user(resp_json['data'])
+            self.client.storage.update_client_user(resp.data)
             return self.session
 
         except Exception as e:
@@ -214,7 +331,7 @@ class HTTP:
             headers: dict,
             retry_on_rate_limit: bool,
             **kwargs
-    ) -> Union[aiohttp.ClientResponse, None]:
+    ) -> Union[HTTPResponse, None]:
         """
         The Function that stores the request and the handling of
         exceptions! Will be used as a variable so the status of the request
@@ -228,7 +345,7 @@ class HTTP:
         :param kwargs: Additional Parameter for the aiohttp HTTP Request
         :param retry_on_rate_limit: Should the request retry after a
          rate_limit was received.
-        :return: Returns the aiohttp.ClientResponse object
+        :return: Returns the HTTPResponse with the decoded response body
         :raises HTTPNotFoundError: If 404 is returned
         :raises HTTPRateLimitError: If a rate-limit is received (429) and
          retry_on_rate_limit is False
@@ -248,8 +365,15 @@ class HTTP:
 
         headers = self.headers if headers is None else headers
         url: False = f"{self.api_url.human_repr()}{endpoint}"
+        json_codec = self.json_codec
+        bucket = self.rate_limits.get_bucket(endpoint)
+        start = time.perf_counter()
 
         while True:
+            # Waiting until the route has budget left to avoid sending
+            # requests that would only receive a rate-limit
+            await bucket.acquire()
+
             async with self.session.request(
                     method=method,
                     url=url,
@@ -260,6 +384,7 @@ class HTTP:
             ) as _resp:
                 http_resp_code = _resp.status
                 data = await _resp.read()  # Raw response data
+                bucket.update(_resp.headers)
 
                 if http_resp_code == 401 or http_resp_code == 403:
                     raise HTTPForbiddenError(
@@ -275,24 +400,25 @@ class HTTP:
                         f"{retry_on_rate_limit}"
                     )
 
-                    if retry_on_rate_limit is False:
-                        raise HTTPRateLimitError()
-
+                    expires_at = None
                     if data:
                         # "rate_limit", { "expires_at": "<unix-timestamp>"}
-                        _json_data = json_decoder.loads(data)
-
-                        unix_ts = time.time()
-                        retry_after: int = utils.safe_convert(
-                            dtype=int,
+                        _json_data = json_codec.loads(data)
+                        expires_at = utils.safe_convert(
+                            dtype=float,
                             value=_json_data.get("expires_at"),
-                            default=5
-                        ) - unix_ts
-                    else:
-                        retry_after: int = 5
+                            default=None
+                        )
+                    if expires_at is None:
+                        expires_at = time.time() + 5
 
-                    # min additional 0.1s
-                    await asyncio.sleep(retry_after + 0.1)
+                    # Exhausting the bucket, so all requests to the route are
+                    # delayed until the rate-limit expired (min additional
+                    # 0.1s)
+                    bucket.limit_until(expires_at + 0.1)
+
+                    if retry_on_rate_limit is False:
+                        raise HTTPRateLimitError()
                     continue
                 elif 400 <= http_resp_code <= 451:
                     raise HTTPInvalidRequest(
@@ -311,13 +437,20 @@ class HTTP:
                             "Received empty response from the Hiven "
                             "Servers"
                         )
+                    # No content => nothing to decode
+                    return HTTPResponse(
+                        _resp,
+                        raw=data,
+                        json_data=None,
+                        elapsed=time.perf_counter() - start
+                    )
 
                 try:
                     # Loading the data in json => will fail if not json
-                    _json_data = json_decoder.loads(data)
+                    _json_data = json_codec.loads(data)
 
-                # empty data
-                except json_decoder.decoder.JSONDecodeError as e:
+                # empty data - all codecs raise a subclass of ValueError
+                except ValueError as e:
                     # Success but no data
                     if http_resp_code == 200:
                         logger.debug(
@@ -325,7 +458,12 @@ class HTTP:
                             "Request was successful "
                             "(Received no response though success-code)"
                         )
-                        return _resp
+                        return HTTPResponse(
+                            _resp,
+                            raw=data,
+                            json_data=None,
+                            elapsed=time.perf_counter() - start
+                        )
                     else:
                         raise e
 
@@ -338,7 +476,12 @@ class HTTP:
                         f"Request was successful and received expected "
                         f"data"
                     )
-                    return _resp
+                    return HTTPResponse(
+                        _resp,
+                        raw=data,
+                        json_data=_json_data,
+                        elapsed=time.perf_counter() - start
+                    )
                 else:
                     # If an error occurred the response body will contain
                     # an error field
@@ -367,7 +510,7 @@ class HTTP:
             headers: Optional[dict] = None,  # Defaults to an empty header,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> Union[aiohttp.ClientResponse, None]:
+    ) -> Union[HTTPResponse, None]:
         """
         Wrapped HTTP request for a specified endpoint.
         
@@ -384,12 +527,12 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the aiohttp.ClientResponse object
+        :return: Returns the HTTPResponse with the decoded response body
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
         """
         try:
-            http_client_response = await asyncio.wait_for(
+            http_response = await asyncio.wait_for(
                 self.http_request(
                     endpoint, method, json, headers, retry_on_rate_limit,
                     **kwargs
@@ -415,7 +558,7 @@ class HTTP:
             raise e
 
         # Returning the response instance
-        return http_client_response
+        return http_response
 
     async def get(
             self,
@@ -426,7 +569,7 @@ class HTTP:
             headers: Optional[dict] = None,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Wrapped HTTP 'GET' request for a specified endpoint
 
@@ -442,7 +585,7 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the ClientResponse object if successful and else
+        :return: Returns the HTTPResponse object if successful and else
          returns `None`
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
@@ -466,7 +609,7 @@ class HTTP:
             headers: Optional[dict] = None,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Wrapped HTTP 'POST' for a specified endpoint.
         
@@ -482,7 +625,7 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the ClientResponse object if successful and else
+        :return: Returns the HTTPResponse object if successful and else
          returns `None`
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
@@ -515,7 +658,7 @@ class HTTP:
             headers: Optional[dict] = None,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Wrapped HTTP 'DELETE' for a specified endpoint.
         
@@ -531,7 +674,7 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the ClientResponse object if successful and else
+        :return: Returns the HTTPResponse object if successful and else
          returns `None`
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
@@ -555,7 +698,7 @@ class HTTP:
             headers: Optional[dict] = None,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Wrapped HTTP 'PUT' for a specified endpoint.
         
@@ -573,7 +716,7 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the ClientResponse object if successful and else
+        :return: Returns the HTTPResponse object if successful and else
          returns `None`
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
@@ -606,7 +749,7 @@ class HTTP:
             headers: Optional[dict] = None,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Wrapped HTTP 'PATCH' for a specified endpoint.
         
@@ -622,7 +765,7 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the ClientResponse object if successful and else
+        :return: Returns the HTTPResponse object if successful and else
          returns `None`
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
@@ -655,7 +798,7 @@ class HTTP:
             headers: Optional[dict] = None,
             retry_on_rate_limit: bool = True,
             **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Wrapped HTTP 'OPTIONS' for a specified endpoint.
         
@@ -673,7 +816,7 @@ class HTTP:
          for more info
         :param retry_on_rate_limit: Should the request retry after a rate_limit
          was received. Defaults to True
-        :return: Returns the ClientResponse object if successful and else
+        :return: Returns the HTTPResponse object if successful and else
          returns `None`
         :raises HTTPRequestTimeoutError: If the set timeout is hit
         :raises HTTPError: If any HTTP Error is hit during processing
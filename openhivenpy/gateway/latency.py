@@ -0,0 +1,120 @@
+"""
+Rolling histogram of the heartbeat round-trip times of the WebSocket
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import bisect
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from ..base_types import HivenObject
+
+__all__ = ['LatencyHistogram']
+
+
+class LatencyHistogram(HivenObject):
+    """
+    Rolling histogram storing the last round-trip times of the heartbeats in
+    seconds. The buckets and percentiles are calculated over the stored
+    samples, so older samples do not influence them anymore
+    """
+    # Upper bounds of the buckets in seconds. The last bucket contains all
+    # samples greater than the last bound
+    BUCKETS: Tuple[float, ...] = (
+        0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+    )
+
+    def __init__(self, size: int = 100):
+        """
+        :param size: The amount of samples stored
+        :raises ValueError: If the size is not greater than 0
+        """
+        if size <= 0:
+            raise ValueError("size must be greater than 0")
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def __repr__(self) -> str:
+        info = [
+            ('samples', len(self)),
+            ('latest', self.latest),
+            ('average', self.average)
+        ]
+        return '<LatencyHistogram {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def latest(self) -> Optional[float]:
+        """ The last measured round-trip time. None if nothing was measured """
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def average(self) -> Optional[float]:
+        """ The average of the stored round-trip times """
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    def add(self, rtt: float) -> None:
+        """ Adds a measured round-trip time in seconds """
+        self._samples.append(rtt)
+
+    def clear(self) -> None:
+        """ Removes all samples """
+        self._samples.clear()
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Returns the percentile of the stored round-trip times
+
+        :param percent: The percentile between 0 and 100, for example 99
+        :return: The round-trip time in seconds or None if nothing was
+         measured
+        """
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        index = round(percent / 100 * (len(samples) - 1))
+        return samples[min(max(index, 0), len(samples) - 1)]
+
+    def buckets(self) -> Dict[str, int]:
+        """
+        Returns the amount of stored round-trip times per bucket. The keys are
+        the upper bounds in milliseconds, for example '<=100', and '>5000'
+        for the samples greater than the last bound
+        """
+        counts = [0] * (len(self.BUCKETS) + 1)
+        for rtt in self._samples:
+            counts[bisect.bisect_left(self.BUCKETS, rtt)] += 1
+
+        keys = [f'<={bound * 1000:g}' for bound in self.BUCKETS]
+        keys.append(f'>{self.BUCKETS[-1] * 1000:g}')
+        return dict(zip(keys, counts))
@@ -34,6 +34,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from typing import Optional, List, Coroutine, Tuple, Dict
 # Only importing the Objects for the purpose of type hinting and not actual use
 from typing import TYPE_CHECKING
@@ -57,17 +58,21 @@ async def _wait_until_done(task: asyncio.Task) -> None:
         await asyncio.sleep(.05)
 
 
-class DynamicEventBuffer(list, HivenObject):
+class DynamicEventBuffer(deque, HivenObject):
     """
-    The DynamicEventBuffer is a list containing all not-executed events that
+    The DynamicEventBuffer is a queue containing all not-executed events that
     were received over the websocket.
 
-    Workers will fetch from the Buffer events and then execute them if
-    event_listeners are assigned to them.
+    Workers will wait on the Buffer until events are added and then execute
+    them if event_listeners are assigned to them. Fetching the oldest event
+    is done in constant time since the buffer is backed by a deque.
     """
 
     def __init__(self, event: str, *args, **kwargs):
         self.event = event
+        # Created lazily, since the asyncio.Event needs to be created inside
+        # the running event loop of the worker that is waiting
+        self._new_event: Optional[asyncio.Event] = None
         super().__init__(*args, **kwargs)
 
     def __repr__(self):
@@ -106,12 +111,35 @@ class DynamicEventBuffer(list, HivenObject):
             }
         )
 
+        # Waking up the worker that is waiting for new events
+        if self._new_event is not None:
+            self._new_event.set()
+
     def get_next_event(self) -> dict:
         """
         Fetches the oldest event at index 0. Raises an exception if the buffer
         is empty!
         """
-        return self.pop(0)
+        return self.popleft()
+
+    async def wait_for_event(self) -> None:
+        """
+        Waits until the buffer contains at least one event. Returns
+        immediately if the buffer is not empty
+        """
+        while not self:
+            if self._new_event is None:
+                self._new_event = asyncio.Event()
+            self._new_event.clear()
+            await self._new_event.wait()
+
+    async def fetch_next_event(self) -> dict:
+        """
+        Waits until an event is available and then fetches the oldest event
+        from the buffer
+        """
+        await self.wait_for_event()
+        return self.get_next_event()
 
 
 class MessageBroker(HivenObject):
@@ -229,6 +257,7 @@ class Worker(HivenObject):
         self._sequence_loop: Optional[asyncio.Task] = None
         self._listener_tasks: List[asyncio.Task] = []
         self._cancel_called = False
+        self._stop_called = False
 
     def __repr__(self):
         info = [
@@ -254,6 +283,14 @@ class Worker(HivenObject):
         """ Returns whether force_closing is enabled in the message_broker """
         return getattr(self.message_broker, '_force_closing', False)
 
+    @property
+    def stopping(self) -> bool:
+        """
+        Returns whether the worker was requested to stop, since no listeners
+        are assigned to its event anymore
+        """
+        return getattr(self, '_stop_called', False)
+
     @staticmethod
     async def _gather_tasks(tasks: List[Coroutine]) -> None:
         """ Executes all passed event_listener tasks parallel """
@@ -282,13 +319,20 @@ class Worker(HivenObject):
             task.cancel()
             await _wait_until_done(task)
 
-        if not self._sequence_loop.cancelled():
+        if self._sequence_loop and not self._sequence_loop.cancelled():
             self._sequence_loop.cancel()
             await _wait_until_done(self._sequence_loop)
 
         self._cancel_called = True
         logger.debug(f"{repr(self)} cancelled")
 
+    def stop(self) -> None:
+        """
+        Requests the worker to stop after the currently running listeners
+        finished. Unlike cancel() this will not interrupt running listeners
+        """
+        self._stop_called = True
+
     def _tasks_done(self) -> bool:
         return all(t.done() for t in self._listener_tasks)
 
@@ -303,12 +347,20 @@ class Worker(HivenObject):
     async def _loop_sequence(self) -> None:
         """
         Worker Loop sequence. Only stops when connection.close() was called
+        or the worker was stopped using stop()
         """
-        while not self.closing:
-            # If the event_buffer is not empty
-            if self.assigned_event_buffer:
-                await self.run_one_sequence()
-            await asyncio.sleep(.50)
+        buffer = self.message_broker.get_buffer(self.assigned_event)
+        while not self.closing and not self.stopping:
+            try:
+                # Waiting for a new event, but still checking periodically
+                # whether the connection is closing
+                await asyncio.wait_for(buffer.wait_for_event(), .50)
+            except asyncio.TimeoutError:
+                continue
+
+            if self.stopping:
+                break
+            await self.run_one_sequence()
 
         if self.force_closing:
             await self.cancel()  # destroys itself
@@ -391,16 +443,70 @@ class EventConsumer(HivenObject):
         self.client = message_broker.client
         self._tasks: Optional[Dict[Worker, asyncio.Task]] = {}
 
+    @property
+    def closing(self) -> bool:
+        """ Returns whether the client connection is currently closing """
+        return getattr(self.client.connection, '_closing', False)
+
     def get_worker(self, event) -> Worker:
         """ Creates a new worker that can execute event_listeners """
         worker = self.workers.get(event)
 
-        # Avoids cancelled workers that cannot be reused
-        if not worker or getattr(worker, '_cancel_called', False) is True:
+        # Avoids cancelled or stopped workers that cannot be reused
+        if not worker or getattr(worker, '_cancel_called', False) is True \
+                or worker.stopping:
             worker = Worker(event, self.message_broker)
             self.workers[event] = worker
         return worker
 
+    def start_worker(self, event: str) -> Optional[asyncio.Task]:
+        """
+        Starts a new worker for the passed event if none is running yet.
+        Non-buffer events and a closing connection will be ignored.
+
+        :param event: The event name the worker should be assigned to
+        :return: The task of the running worker or None if none was started
+        """
+        if event in self.client.non_buffer_events or self.closing:
+            return None
+
+        worker = self.workers.get(event)
+        task = self._tasks.get(worker) if worker else None
+        if task and not task.done() and not worker.stopping:
+            return task
+
+        worker = self.get_worker(event)
+        task = asyncio.create_task(worker.run_forever())
+        task.add_done_callback(
+            lambda _: self._remove_finished_worker(worker)
+        )
+        self._tasks[worker] = task
+        logger.debug(f"{repr(worker)} started")
+        return task
+
+    def stop_worker(self, event: str) -> None:
+        """
+        Stops the worker assigned to the passed event after it finished its
+        running listeners. All not yet executed events of the event will be
+        discarded, since no listeners are left to handle them
+
+        :param event: The event name of the worker that should be stopped
+        """
+        worker = self.workers.get(event)
+        if worker is not None:
+            worker.stop()
+            logger.debug(f"{repr(worker)} stopping")
+
+        buffer = self.message_broker.event_buffers.get(event)
+        if buffer is not None:
+            buffer.clear()
+
+    def _remove_finished_worker(self, worker: Worker) -> None:
+        """ Removes a finished worker and its task from the consumer """
+        self._tasks.pop(worker, None)
+        if self.workers.get(worker.assigned_event) is worker:
+            del self.workers[worker.assigned_event]
+
     def tasks_done(self) -> bool:
         """
         Returns whether all workers and tasks are done
@@ -416,14 +522,14 @@ class EventConsumer(HivenObject):
         Closes all worker tasks that are currently running. Waits until
         everything was cleaned up and finished
         """
-        for w in self.workers.values():
+        for w in list(self.workers.values()):
             w: Worker
             if w.done():
                 continue
 
             await w.cancel()
 
-        for t in self._tasks.values():
+        for t in list(self._tasks.values()):
             t: asyncio.Task
             if t.done():
                 continue
@@ -449,17 +555,22 @@ class EventConsumer(HivenObject):
 
     async def run_all_workers(self) -> tuple:
         """
-        Creates workers for all available events and runs them parallel
+        Creates workers for all events that have listeners assigned and runs
+        them parallel until the connection is closing. Workers for other
+        events are started and stopped on runtime when listeners are added or
+        removed (see start_worker() and stop_worker())
+
         *non_buffer_events* in this case are ignored since they are
         non-websocket events and need to be called using call_listeners. Those
         tasks will not be running parallel but will be called in the websocket
         task and delay the websocket receiving process, so that startup can be
          easier managed (on_init, on_ready)
         """
-        workers = [
-            self.get_worker(_) for _ in self.client.available_events if _ not in self.client.non_buffer_events
-        ]
-        self._tasks: Optional[Dict[Worker, asyncio.Task]] = {
-            worker: asyncio.create_task(worker.run_forever()) for worker in workers
-        }
-        return await asyncio.gather(*self._tasks.values())
+        for event, listeners in self.client.active_listeners.items():
+            if listeners:
+                self.start_worker(event)
+
+        while not self.closing:
+            await asyncio.sleep(.50)
+
+        return await asyncio.gather(*list(self._tasks.values()))
@@ -0,0 +1,234 @@
+"""
+Rate-Limit buckets used by the HTTP client to throttle requests per route
+before they are sent to Hiven
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Mapping, Optional
+
+from .. import utils
+from ..base_types import HivenObject
+
+__all__ = ['RateLimitBucket', 'RateLimitManager', 'get_route_template']
+
+logger = logging.getLogger(__name__)
+
+# Numeric path segments are ids, which are replaced with '{id}' so that all
+# requests to the same route share one bucket
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def get_route_template(endpoint: str) -> str:
+    """
+    Returns the route template of the passed endpoint, where all ids are
+    replaced with '{id}'
+
+    :param endpoint: The endpoint, for example '/rooms/1234/messages'
+    :return: The route template, for example '/rooms/{id}/messages'
+    """
+    return _ID_SEGMENT.sub('/{id}', endpoint.split('?', 1)[0])
+
+
+class RateLimitBucket(HivenObject):
+    """
+    Rate-Limit bucket of a single route, which tracks the remaining request
+    budget and queues requests locally until the budget resets
+    """
+    def __init__(self, route: str):
+        """
+        :param route: The route template of the bucket
+        """
+        self._route = route
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        info = [
+            ('route', self.route),
+            ('limit', self.limit),
+            ('remaining', self.remaining),
+            ('reset_at', self.reset_at)
+        ]
+        return '<RateLimitBucket {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    @property
+    def route(self) -> Optional[str]:
+        """ Returns the route template of the bucket """
+        return getattr(self, '_route', None)
+
+    @property
+    def limit(self) -> Optional[int]:
+        """ Returns the maximum amount of requests per window if known """
+        return getattr(self, '_limit', None)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """
+        Returns the remaining amount of requests in the current window. None
+        if the budget is unknown
+        """
+        return getattr(self, '_remaining', None)
+
+    @property
+    def reset_at(self) -> Optional[float]:
+        """ Returns the unix-timestamp when the budget will reset """
+        return getattr(self, '_reset_at', None)
+
+    @property
+    def queued(self) -> bool:
+        """ Returns whether requests are waiting for the bucket """
+        return self._lock is not None and self._lock.locked()
+
+    def _reset_if_expired(self) -> None:
+        """ Resets the budget if the reset timestamp was passed """
+        if self._reset_at is not None and time.time() >= self._reset_at:
+            self._remaining = self._limit
+            self._reset_at = None
+
+    async def acquire(self) -> None:
+        """
+        Waits until the bucket has budget left and consumes one request.
+        Waiting requests are processed one after another in the order they
+        called this method.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                self._reset_if_expired()
+                if self._remaining is None or self._remaining > 0:
+                    if self._remaining is not None:
+                        self._remaining -= 1
+                    return
+                elif self._reset_at is None:
+                    # Never waiting for a reset that is not known
+                    return
+
+                delay = self._reset_at - time.time()
+                logger.debug(
+                    f"[HTTP] Bucket '{self.route}' is exhausted! Delaying "
+                    f"request for {delay:.2f}s"
+                )
+                await asyncio.sleep(max(delay, 0))
+
+    def update(self, headers: Optional[Mapping[str, str]]) -> None:
+        """
+        Updates the budget based on the rate-limit headers of a response.
+        Responses without rate-limit headers are ignored.
+
+        :param headers: The headers of the response
+        """
+        if not headers:
+            return
+
+        limit = utils.safe_convert(
+            int, headers.get('X-RateLimit-Limit'), None
+        )
+        remaining = utils.safe_convert(
+            int, headers.get('X-RateLimit-Remaining'), None
+        )
+        reset_after = utils.safe_convert(
+            float, headers.get('X-RateLimit-Reset-After'), None
+        )
+        reset = utils.safe_convert(
+            float, headers.get('X-RateLimit-Reset'), None
+        )
+
+        if limit is not None:
+            self._limit = limit
+        if reset_after is not None:
+            self._reset_at = time.time() + reset_after
+        elif reset is not None:
+            self._reset_at = reset
+
+        if remaining is not None:
+            if remaining <= 0 and self._reset_at is None:
+                # Without a reset time the bucket could never be released
+                # again, so the budget is treated as unknown
+                logger.debug(
+                    f"[HTTP] Bucket '{self.route}' has no reset time! "
+                    f"Ignoring the remaining budget"
+                )
+                self._remaining = None
+            else:
+                self._remaining = remaining
+
+    def limit_until(self, reset_at: float) -> None:
+        """
+        Exhausts the bucket until the passed unix-timestamp. Used when a
+        rate-limit response (429) was received.
+
+        :param reset_at: The unix-timestamp when the budget will reset
+        """
+        self._remaining = 0
+        self._reset_at = reset_at
+
+
+class RateLimitManager(HivenObject):
+    """
+    Manager of the Rate-Limit buckets, which are stored per route template
+    """
+    def __init__(self):
+        self._buckets: Dict[str, RateLimitBucket] = {}
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        return f'<RateLimitManager buckets={len(self._buckets)}>'
+
+    @property
+    def buckets(self) -> Dict[str, RateLimitBucket]:
+        """ Returns all existing buckets with their route template as key """
+        return getattr(self, '_buckets', None)
+
+    def get_bucket(self, endpoint: str) -> RateLimitBucket:
+        """
+        Returns the bucket of the route of the passed endpoint and creates it
+        if it does not exist yet
+
+        :param endpoint: The endpoint of the request
+        :return: The RateLimitBucket of the route
+        """
+        route = get_route_template(endpoint)
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = self._buckets[route] = RateLimitBucket(route)
+        return bucket
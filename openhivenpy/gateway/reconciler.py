@@ -0,0 +1,272 @@
+"""
+Reconciler comparing the houses received after a restart of the WebSocket
+with the cached ones, so only the changed parts of the cache are updated
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+from ..base_types import HivenObject
+
+if TYPE_CHECKING:
+    from .. import HivenClient
+
+__all__ = ['HouseReconciler']
+
+logger = logging.getLogger(__name__)
+
+
+class HouseReconciler(HivenObject):
+    """
+    Reconciler of the houses received in the INIT_STATE of a new session.
+
+    Hiven does not support resuming a session, so every restart of the
+    WebSocket receives the HOUSE_JOIN events of all houses again. The
+    reconciler stores digests of the last received data of every house and
+    compares them with the new data. Unchanged houses are not passed to the
+    cache at all, while changed rooms and members are updated by dispatching
+    synthetic ROOM_UPDATE and HOUSE_MEMBER_* events, which also call the
+    listeners of these events. Changes of the house itself, its entities or
+    the list of its rooms are applied using a HOUSE_UPDATE event.
+
+    The digests of a house are dropped once an event modified the cached
+    house, since they would not represent the cached data anymore.
+    """
+    # Prefixes of the events modifying the cached data of a house
+    _HOUSE_EVENT_PREFIXES = ('HOUSE_', 'ROOM_')
+
+    def __init__(self, client: HivenClient):
+        self._client = client
+        self._digests: Dict[str, Dict[str, Any]] = {}
+        self._sessions = 0
+        self._previous_house_ids = set()
+        self._stats = {
+            'loaded': 0,
+            'unchanged': 0,
+            'reconciled': 0,
+            'synthetic_events': 0
+        }
+
+    def __repr__(self) -> str:
+        info = [
+            ('houses', len(self._digests)),
+            ('sessions', self.sessions)
+        ]
+        return '<HouseReconciler {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    @property
+    def client(self) -> Optional[HivenClient]:
+        """ Returns the client the reconciler updates the cache of """
+        return getattr(self, '_client', None)
+
+    @property
+    def sessions(self) -> int:
+        """ Returns the amount of received INIT_STATE events """
+        return getattr(self, '_sessions', 0)
+
+    @property
+    def reconnected(self) -> bool:
+        """
+        Returns whether the current session was created after a restart of
+        the WebSocket
+        """
+        return self.sessions > 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the reconciler:
+
+        - 'loaded': Houses added to the cache using the full HOUSE_JOIN data
+        - 'unchanged': Houses that were skipped, since they did not change
+        - 'reconciled': Houses that were updated using synthetic events
+        - 'synthetic_events': Dispatched synthetic events
+        """
+        return dict(self._stats)
+
+    def start_session(self) -> None:
+        """
+        Called when the INIT_STATE of a new session was received. Needs to be
+        called before the cache was updated with the INIT_STATE
+        """
+        self._sessions += 1
+        self._previous_house_ids = set(self.client.storage.get_house_ids())
+
+    def clear(self) -> None:
+        """ Removes all stored digests """
+        self._digests.clear()
+
+    def invalidate(self, house_id: str) -> None:
+        """
+        Removes the digests of the house, so it is loaded fully the next time
+        it is received
+        """
+        self._digests.pop(house_id, None)
+
+    def invalidate_for_event(self, event: str, data: Any) -> None:
+        """
+        Removes the digests of the houses modified by the passed event
+
+        :param event: The name of the dispatched event
+        :param data: The data of the event
+        """
+        if not self._digests or type(data) is not dict:
+            return
+
+        if event.startswith(self._HOUSE_EVENT_PREFIXES):
+            house_id = data.get('house_id') or data.get('id')
+            self.invalidate(house_id)
+        elif event == 'USER_UPDATE':
+            # The users are part of the member data of the houses
+            for house_id in self.client.storage.get_user_house_ids(
+                    data.get('id')
+            ):
+                self.invalidate(house_id)
+
+    def _digest(self, data: Any) -> int:
+        """ Returns the digest of the passed JSON data """
+        return hash(self.client.json_codec.dumps(data))
+
+    @staticmethod
+    def _get_member_id(member: dict) -> Optional[str]:
+        """ Returns the id of the passed member data """
+        if member.get('user_id'):
+            return member['user_id']
+        user = member.get('user')
+        return user.get('id') if type(user) is dict else user
+
+    def digest_house(self, data: dict) -> Dict[str, Any]:
+        """
+        Returns the digests of the passed HOUSE_JOIN data. Needs to be called
+        before the data is passed to the cache, which modifies it
+
+        :param data: The raw data of the house
+        :return: A dict containing the digest of the house itself and the
+         digests of its rooms and members per id
+        """
+        nested = ('rooms', 'members', 'entities')
+        return {
+            'house': self._digest(
+                {k: v for k, v in data.items() if k not in nested}
+            ),
+            'entities': self._digest(data.get('entities')),
+            'rooms': {
+                r.get('id'): self._digest(r) for r in data.get('rooms') or ()
+            },
+            'members': {
+                self._get_member_id(m): self._digest(m)
+                for m in data.get('members') or ()
+            }
+        }
+
+    async def _dispatch(self, event: str, data: dict) -> None:
+        """ Dispatches a synthetic event using the parsers of the client """
+        self._stats['synthetic_events'] += 1
+        await self.client.parsers.dispatch(event, data)
+
+    async def load_house(self, data: dict) -> None:
+        """
+        Adds the house of a HOUSE_JOIN event received on initialisation to
+        the cache or reconciles it with the already cached house
+
+        :param data: The raw data of the house. Owned by the reconciler
+         afterwards
+        """
+        house_id = data['id']
+        storage = self.client.storage
+        digest = self.digest_house(data)
+        previous = self._digests.pop(house_id, None)
+
+        if previous is None or storage.lookup_house(house_id) is None:
+            storage.add_or_update_house(data)
+            storage.commit()
+            self._stats['loaded'] += 1
+        elif previous == digest:
+            self._stats['unchanged'] += 1
+        elif any(previous[k] != digest[k] for k in ('house', 'entities')) \
+                or previous['rooms'].keys() != digest['rooms'].keys():
+            # The changes of the house itself require updating the entire
+            # house, since its rooms and entities are stored as a list
+            await self._dispatch('HOUSE_UPDATE', data)
+            self._stats['reconciled'] += 1
+        else:
+            await self._reconcile_house(house_id, data, previous, digest)
+            self._stats['reconciled'] += 1
+
+        self._digests[house_id] = digest
+        logger.debug(f"[RECONCILER] Loaded house {house_id} {self!r}")
+
+    async def _reconcile_house(
+            self, house_id: str, data: dict, previous: dict, digest: dict
+    ) -> None:
+        """
+        Updates the changed rooms and members of the cached house using
+        synthetic events
+        """
+        for room in data['rooms']:
+            if previous['rooms'][room['id']] != digest['rooms'][room['id']]:
+                room['house_id'] = house_id
+                await self._dispatch('ROOM_UPDATE', room)
+
+        for member in data['members']:
+            member_id = self._get_member_id(member)
+            old_digest = previous['members'].get(member_id)
+            if old_digest != digest['members'][member_id]:
+                member['house_id'] = house_id
+                await self._dispatch(
+                    'HOUSE_MEMBER_UPDATE' if old_digest is not None
+                    else 'HOUSE_MEMBER_JOIN',
+                    member
+                )
+
+        storage = self.client.storage
+        for member_id in previous['members'].keys() - digest['members'].keys():
+            # Members might not be cached due to the member cache policy
+            if storage.lookup_house_member(member_id, house_id) is not None:
+                await self._dispatch(
+                    'HOUSE_MEMBER_LEAVE',
+                    {'house_id': house_id, 'user': {'id': member_id}}
+                )
+
+    async def remove_missing_houses(self, house_ids: Iterable[str]) -> None:
+        """
+        Removes the houses of the previous session the client is not a member
+        of anymore using synthetic HOUSE_LEAVE events. Called after all houses
+        of the INIT_STATE were loaded
+
+        :param house_ids: Ids of the houses of the INIT_STATE
+        """
+        storage = self.client.storage
+        for house_id in self._previous_house_ids.difference(house_ids):
+            self.invalidate(house_id)
+            if storage.lookup_house(house_id) is not None:
+                await self._dispatch('HOUSE_LEAVE', {'house_id': house_id})
+        self._previous_house_ids = set()
@@ -0,0 +1,170 @@
+"""
+Policy deciding how long the Connection waits before restarting the WebSocket
+after it failed or was closed by Hiven
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+from ..base_types import HivenObject
+
+__all__ = ['ReconnectPolicy']
+
+
+class ReconnectPolicy(HivenObject):
+    """
+    Policy of the Connection deciding how long to wait before the WebSocket
+    is restarted.
+
+    The delay grows exponentially with the consecutive failed attempts, where
+    every attempt that ended without becoming ready counts as failed and an
+    attempt that became ready resets the counter. With jitter, a random delay between 0 and the
+    exponential delay is used, so many clients disconnected at the same time
+    do not reconnect at the same time.
+
+    After `max_failures` consecutive failed attempts the circuit breaker
+    opens and the Connection waits for `cooldown` seconds before every
+    further attempt until one succeeds. If `cooldown` is None, the Connection
+    gives up instead.
+    """
+    def __init__(
+            self,
+            *,
+            base_delay: float = 1.0,
+            max_delay: float = 60.0,
+            factor: float = 2.0,
+            jitter: bool = True,
+            max_failures: Optional[int] = 10,
+            cooldown: Optional[float] = 300.0
+    ):
+        """
+        :param base_delay: Seconds waited after the first failed attempt
+        :param max_delay: Maximum seconds waited between two attempts before
+         the circuit breaker opens
+        :param factor: Factor the delay is multiplied with for every further
+         failed attempt. Must be at least 1
+        :param jitter: If set to True, a random delay between 0 and the
+         exponential delay is used
+        :param max_failures: Consecutive failed attempts after which the
+         circuit breaker opens. None to never open it
+        :param cooldown: Seconds waited between the attempts while the
+         circuit breaker is open. None to give up once it opens
+        :raises ValueError: If one of the passed values is invalid
+        """
+        for name, value in (('base_delay', base_delay),
+                            ('max_delay', max_delay), ('cooldown', cooldown)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative")
+        if factor < 1:
+            raise ValueError("factor must be at least 1")
+        if max_failures is not None and max_failures <= 0:
+            raise ValueError("max_failures must be greater than 0 or None")
+
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._factor = factor
+        self._jitter = jitter
+        self._max_failures = max_failures
+        self._cooldown = cooldown
+
+    def __repr__(self) -> str:
+        info = [
+            ('base_delay', self.base_delay),
+            ('max_delay', self.max_delay),
+            ('factor', self.factor),
+            ('jitter', self.jitter),
+            ('max_failures', self.max_failures),
+            ('cooldown', self.cooldown)
+        ]
+        return '<ReconnectPolicy {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    @property
+    def base_delay(self) -> float:
+        """ Seconds waited after the first failed attempt """
+        return getattr(self, '_base_delay', 1.0)
+
+    @property
+    def max_delay(self) -> float:
+        """ Maximum seconds waited before the circuit breaker opens """
+        return getattr(self, '_max_delay', 60.0)
+
+    @property
+    def factor(self) -> float:
+        """ Factor the delay grows with per failed attempt """
+        return getattr(self, '_factor', 2.0)
+
+    @property
+    def jitter(self) -> bool:
+        """ Returns whether a random delay is used """
+        return getattr(self, '_jitter', True)
+
+    @property
+    def max_failures(self) -> Optional[int]:
+        """ Consecutive failed attempts after the circuit breaker opens """
+        return getattr(self, '_max_failures', None)
+
+    @property
+    def cooldown(self) -> Optional[float]:
+        """ Seconds waited while the circuit breaker is open """
+        return getattr(self, '_cooldown', None)
+
+    def circuit_open(self, failures: int) -> bool:
+        """
+        Returns whether the circuit breaker is open after the passed amount of
+        consecutive failed attempts
+        """
+        return self.max_failures is not None and failures >= self.max_failures
+
+    def get_delay(self, failures: int) -> Optional[float]:
+        """
+        Returns the seconds that should be waited before the next attempt
+
+        :param failures: The amount of consecutive failed attempts
+        :return: The delay in seconds or None if the circuit breaker is open
+         and no cooldown was set, meaning no further attempt should be made
+        """
+        if self.circuit_open(failures):
+            if self.cooldown is None:
+                return None
+            # Only using half of the cooldown as jitter, so the clients still
+            # wait for at least half of the cooldown
+            if self.jitter:
+                return self.cooldown / 2 + random.uniform(
+                    0, self.cooldown / 2
+                )
+            return self.cooldown
+
+        try:
+            delay = self.base_delay * self.factor ** max(failures - 1, 0)
+        except OverflowError:
+            delay = self.max_delay
+        delay = min(self.max_delay, delay)
+        return random.uniform(0, delay) if self.jitter else delay
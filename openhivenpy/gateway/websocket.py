@@ -29,24 +29,28 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import sys
 import time
 from enum import IntEnum
 # Only importing the Objects for the purpose of type hinting and not actual use
 from typing import TYPE_CHECKING
-from typing import Tuple, Optional, Callable, Any
+from typing import Tuple, Optional, Callable, Any, Union, Dict, List, Set
 
 import aiohttp
 from yarl import URL
 
+from .compression import TransportCompression, get_transport_compression
+from .latency import LatencyHistogram
 from .messagebroker import MessageBroker
+from .reconciler import HouseReconciler
 from .. import utils
 from ..base_types import HivenObject
 from ..exceptions import (RestartSessionError, SessionCreateError,
                           WebSocketClosedError,
                           WebSocketFailedError, KeepAliveError)
+from ..json_codec import JSONCodec, get_json_codec
+from ..validation import use_validation_policy
 
 if TYPE_CHECKING:
     from ..events import HivenParsers
@@ -68,12 +72,41 @@ def extract_event(msg: dict) -> Tuple[int, str, dict]:
 
 
 class KeepAlive(HivenObject):
-    """ Keep-Alive class managing the heartbeat """
-    def __init__(self, ws):
+    """
+    Keep-Alive class managing the heartbeat and measuring its round-trip time.
+
+    Every heartbeat is followed by a WebSocket ping, whose pong (or a
+    HEARTBEAT op-code sent back by Hiven) acknowledges the heartbeat. If the
+    configured amount of heartbeats in a row was not acknowledged or was
+    acknowledged slower than `max_latency`, the WebSocket is closed, which
+    restarts it
+    """
+    def __init__(
+            self,
+            ws,
+            *,
+            max_latency: Optional[float] = None,
+            max_missed_heartbeats: Optional[int] = None
+    ):
+        """
+        :param ws: The HivenWebSocket the heartbeat is sent over
+        :param max_latency: Seconds after which an acknowledged heartbeat
+         counts as missed. None to never count slow heartbeats as missed
+        :param max_missed_heartbeats: Amount of heartbeats in a row that were
+         missed after which the WebSocket is restarted. None to never restart
+         it
+        """
         self.ws: HivenWebSocket = ws
         self._heartbeat: int = ws.heartbeat
         self._task = None
         self._active = False
+        self._max_latency = max_latency
+        self._max_missed_heartbeats = max_missed_heartbeats
+        self._histogram = LatencyHistogram()
+        self._sequence = 0
+        # Time the not yet acknowledged heartbeat was sent
+        self._sent_at: Optional[float] = None
+        self._missed = 0
 
     @property
     def active(self) -> Optional[bool]:
@@ -89,9 +122,91 @@ class KeepAlive(HivenObject):
         """
         return getattr(self, '_task', None)
 
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        The round-trip time of the last acknowledged heartbeat in seconds.
+        None if no heartbeat was acknowledged yet
+        """
+        return self._histogram.latest
+
+    @property
+    def histogram(self) -> LatencyHistogram:
+        """ The rolling histogram of the heartbeat round-trip times """
+        return self._histogram
+
+    @property
+    def missed_heartbeats(self) -> int:
+        """ The amount of heartbeats in a row that were missed """
+        return getattr(self, '_missed', 0)
+
+    def _ping_payload(self) -> bytes:
+        """ Returns the payload of the ping of the current heartbeat """
+        return str(self._sequence).encode()
+
+    def received_ack(self, payload: Optional[bytes] = None) -> None:
+        """
+        Called when a pong or a heartbeat was received from Hiven, which
+        acknowledges the last sent heartbeat
+
+        :param payload: The payload of the pong. Pongs of older pings are
+         ignored. None if the acknowledgement has no payload
+        """
+        if self._sent_at is None:
+            return
+        if payload and payload != self._ping_payload():
+            return
+
+        rtt = time.perf_counter() - self._sent_at
+        self._sent_at = None
+        self._histogram.add(rtt)
+
+        if self._max_latency is not None and rtt > self._max_latency:
+            self._missed += 1
+            logger.warning(
+                f"[KEEP-ALIVE] Heartbeat took {rtt * 1000:.0f}ms, which "
+                f"exceeds the maximum latency"
+            )
+        else:
+            self._missed = 0
+
+    def should_restart(self) -> bool:
+        """
+        Returns whether the WebSocket should be restarted, since too many
+        heartbeats in a row were missed
+        """
+        return self._max_missed_heartbeats is not None \
+            and self._missed >= self._max_missed_heartbeats
+
+    async def _restart(self) -> None:
+        """ Closes the WebSocket, so the Connection restarts it """
+        logger.warning(
+            f"[KEEP-ALIVE] Missed {self._missed} heartbeats in a row! "
+            f"Restarting the WebSocket"
+        )
+        # Stopping the heartbeat loop before closing the socket, which makes
+        # the listening loop restart the WebSocket
+        self.ws._open = False
+        await self.ws.socket.close()
+
     async def _heartbeat_and_sleep(self) -> None:
-        """ Sends the heartbeat to Hiven and sleeps """
+        """
+        Sends the heartbeat to Hiven and sleeps. Restarts the WebSocket if too
+        many heartbeats were missed
+        """
+        if self._sent_at is not None:
+            # The previous heartbeat was never acknowledged
+            self._missed += 1
+            self._sent_at = None
+
+        if self.should_restart():
+            await self._restart()
+            return
+
+        self._sequence += 1
+        self._sent_at = time.perf_counter()
         await asyncio.wait_for(self.ws.send_heartbeat(), 30)
+        await asyncio.wait_for(self.ws.send_ping(self._ping_payload()), 30)
         await asyncio.sleep(self._heartbeat / 1000)
 
     async def run(self) -> None:
@@ -148,6 +263,16 @@ class HivenWebSocket(HivenObject):
         self._token = None
         self._heartbeat = None
         self._close_timeout = None
+        self._json_codec = None
+        self._compression: Optional[TransportCompression] = None
+
+        # Houses of the INIT_STATE that were not loaded yet and the events
+        # received for them in the meantime. Only used if early_ready is set
+        self._pending_houses: Dict[str, List[dict]] = {}
+        self._init_house_ids: Set[str] = set()
+        # Task calling the ready listeners, which does not block receiving
+        # the HOUSE_JOIN events. Only used if early_ready is set
+        self._ready_task: Optional[asyncio.Task] = None
 
         # Close code used to represent the status of the aiohttp websocket
         # after it closed
@@ -169,7 +294,7 @@ class HivenWebSocket(HivenObject):
         socket: aiohttp.ClientWebSocketResponse
         socket = await client.http.session.ws_connect(
             endpoint.human_repr(), timeout=close_timeout, heartbeat=heartbeat,
-            max_msg_size=0
+            max_msg_size=0, autoping=False
         )
         ws: HivenWebSocket = cls(socket, loop=loop, **kwargs)
         ws._endpoint = endpoint
@@ -178,9 +303,19 @@ class HivenWebSocket(HivenObject):
         ws._token = client.token
         ws._heartbeat = heartbeat
         ws._close_timeout = close_timeout
+        ws._json_codec = client.json_codec
+        # The compressed stream is bound to the socket, so every WebSocket
+        # needs a new decompressor
+        ws._compression = get_transport_compression(
+            endpoint.query.get('compression')
+        )
 
         ws._message_broker = MessageBroker(client=client)
-        ws._keep_alive = KeepAlive(ws)
+        ws._keep_alive = KeepAlive(
+            ws,
+            max_latency=client.max_latency,
+            max_missed_heartbeats=client.max_missed_heartbeats
+        )
 
         return ws
 
@@ -206,6 +341,16 @@ class HivenWebSocket(HivenObject):
         """ Returns the HivenClient used to initialise this instance """
         return getattr(self, '_client', None)
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        """
+        Returns the JSON codec used to decode and encode WebSocket messages.
+        Defaults to the stdlib codec if none was set
+        """
+        if getattr(self, '_json_codec', None) is None:
+            self._json_codec = get_json_codec(None)
+        return self._json_codec
+
     @property
     def parsers(self) -> HivenParsers:
         """
@@ -267,6 +412,39 @@ class HivenWebSocket(HivenObject):
         """ Returns whether the Web-Socket has initialised and is ready """
         return getattr(self, '_ready', None)
 
+    @property
+    def house_reconciler(self) -> HouseReconciler:
+        """ Returns the HouseReconciler of the connection of the client """
+        return self.client.connection.house_reconciler
+
+    @property
+    def pending_house_ids(self) -> List[str]:
+        """
+        Returns the ids of the houses of the INIT_STATE that were not loaded
+        yet
+        """
+        return list(getattr(self, '_pending_houses', {}))
+
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        The round-trip time of the last acknowledged heartbeat in seconds
+        """
+        return getattr(self.keep_alive, 'latency', None)
+
+    @property
+    def compression(self) -> Optional[TransportCompression]:
+        """
+        Returns the compression used to decompress the binary messages. None
+        if the messages are not compressed
+        """
+        return getattr(self, '_compression', None)
+
+    @property
+    def close_code(self) -> Optional[int]:
+        """ Returns the close code of the WebSocket after it was closed """
+        return getattr(self, '_close_code', None)
+
     @property
     def heartbeat(self) -> Optional[int]:
         """ Heartbeat in ms """
@@ -297,6 +475,15 @@ class HivenWebSocket(HivenObject):
         """
         msg = await self.socket.receive()
 
+        # Pings and pongs are not answered by aiohttp, so the pongs of the
+        # heartbeats can be measured
+        while msg.type in (aiohttp.WSMsgType.PING, aiohttp.WSMsgType.PONG):
+            if msg.type == aiohttp.WSMsgType.PING:
+                await self.socket.pong(msg.data)
+            elif self.keep_alive is not None:
+                self.keep_alive.received_ack(msg.data)
+            msg = await self.socket.receive()
+
         logger.debug(
             f"[WEBSOCKET] Received WebSocket Message Type '{msg.type.name}'"
         )
@@ -314,6 +501,8 @@ class HivenWebSocket(HivenObject):
         self._open = False
         self._ready = False
         self.client.connection._connection_status = "CLOSING"
+        self._close_code = msg.data if msg.type == aiohttp.WSMsgType.CLOSE \
+            else getattr(self.socket, 'close_code', None)
         if msg.type in (
                 aiohttp.WSMsgType.CLOSE,
                 aiohttp.WSMsgType.CLOSING,
@@ -342,12 +531,37 @@ class HivenWebSocket(HivenObject):
                 "[WEBSOCKET] Encountered an Exception in the Websocket"
             )
 
-    async def _received_message(self, msg: aiohttp.WSMessage) -> None:
-        """ Awaits a new incoming message and handles it """
-        if type(msg) is bytes:
-            msg = json.loads(msg.data.decode('utf8'))
-        else:
-            msg = msg.json()
+    def decode_message(self, msg: aiohttp.WSMessage) -> Optional[dict]:
+        """
+        Decodes the data of the passed text or binary WebSocket message using
+        the JSON codec of the WebSocket. Binary messages are decompressed
+        first if a transport compression is used
+
+        :param msg: The raw aiohttp WebSocket message
+        :return: The decoded message or None if the message was split and
+         continues in the next binary message
+        """
+        data = msg.data
+        if msg.type == aiohttp.WSMsgType.BINARY and \
+                self.compression is not None:
+            data = self.compression.decompress(data)
+            if data is None:
+                return None
+        return self.json_codec.loads(data)
+
+    async def _received_message(
+            self, msg: Union[aiohttp.WSMessage, dict]
+    ) -> None:
+        """
+        Awaits a new incoming message and handles it
+
+        :param msg: The raw aiohttp WebSocket message or an already decoded
+         message
+        """
+        if not isinstance(msg, dict):
+            msg = self.decode_message(msg)
+            if msg is None:
+                return
 
         opcode, event, data = extract_event(msg)
 
@@ -358,17 +572,14 @@ class HivenWebSocket(HivenObject):
         elif opcode == self.OPCode.EVENT:
             logger.debug(f"[WEBSOCKET] Received Websocket Event: {event}")
 
-            if event == 'INIT_STATE':
-                await self._received_init(msg)
-            else:
-                try:
-                    await self.parsers.dispatch(event, data)
-                except Exception:
-                    utils.log_traceback(
-                        level='error',
-                        brief=f"Failed to handle event: {event}",
-                        exc_info=sys.exc_info()
-                    )
+            # The data of the event is formatted using the policy of the
+            # client, which is also inherited by the tasks created here
+            with use_validation_policy(self.client.validation_policy):
+                await self._received_event(event, data, msg)
+
+        elif opcode == self.OPCode.HEARTBEAT:
+            if self.keep_alive is not None:
+                self.keep_alive.received_ack()
 
         else:
             logger.warning(
@@ -376,14 +587,53 @@ class HivenWebSocket(HivenObject):
                 f" {opcode}: {msg}"
             )
 
+    async def _received_event(self, event: str, data: Any, msg: dict) -> None:
+        """
+        Handles a received event
+
+        :param event: The name of the event
+        :param data: The data of the event
+        :param msg: The entire decoded message
+        """
+        if event == 'INIT_STATE':
+            await self._received_init(msg)
+            return
+
+        if self._pending_houses:
+            house_id = self._get_event_house_id(event, data)
+            if house_id in self._pending_houses:
+                await self._received_pending_house_event(
+                    house_id, event, data, msg
+                )
+                return
+
+        try:
+            await self.parsers.dispatch(event, data)
+        except Exception:
+            utils.log_traceback(
+                level='error',
+                brief=f"Failed to handle event: {event}",
+                exc_info=sys.exc_info()
+            )
+        else:
+            self.house_reconciler.invalidate_for_event(event, data)
+            if event == 'HOUSE_JOIN':
+                self.client._house_loaded(data.get('id'))
+
     async def _received_init(self, msg: dict) -> None:
         """
         Receives the init message from the host and updates the client cache.
         Will shield the normal message handler from receiving events until the
         initialisation succeeded.
 
-        :return: A List of all other events that were received during
-         initialisation that will now need to be called
+        If `early_ready` is set on the client, the ready event is called
+        directly after the primary data was updated and the houses are loaded
+        when their HOUSE_JOIN event is received. See
+        `_received_pending_house_event()`
+
+        The houses are passed to the HouseReconciler of the connection, which
+        only updates the changed parts of houses that are already cached after
+        a restart of the WebSocket
         """
         await self.client.call_listeners('init', (), {})
 
@@ -391,27 +641,61 @@ class HivenWebSocket(HivenObject):
 
         data = msg['d']
         house_memberships = data.get('house_memberships', {})
+        house_ids = set(data.get('house_ids') or ())
+        expected_houses = len(house_ids) if house_ids \
+            else len(house_memberships)
+        self.house_reconciler.start_session()
         self.client.storage.update_primary_data(data)
-
+        self.client.storage.commit()
+
+        if self.client.early_ready:
+            self._init_house_ids = house_ids or set(house_memberships)
+            self._pending_houses = {id_: [] for id_ in self._init_house_ids}
+            await self._set_ready(background=True)
+            if not self._pending_houses:
+                await self._loaded_init_houses()
+            return
+
+        # Counting the received houses instead of the cached ones, since the
+        # cache might already contain houses loaded from a snapshot
+        received_houses = set()
         additional_events = []
-        while len(self.client.storage['houses']) < len(house_memberships):
+        while len(received_houses) < expected_houses:
             ws_event = await self.wait_for_event(
                 handler=self._received_init_event
             )
+            if ws_event is None:
+                continue
 
-            op, event, d = extract_event(ws_event.json())
+            op, event, d = extract_event(ws_event)
             logger.debug(f"[WEBSOCKET] Received Websocket Event: {event}")
 
             if event == "HOUSE_JOIN":
-                self.client.storage.add_or_update_house(d)
+                received_houses.add(d.get('id'))
+                await self.house_reconciler.load_house(d)
+                self.client._house_loaded(d.get('id'))
             else:
                 additional_events.append(ws_event)
 
+        self._init_house_ids = received_houses
+        await self._loaded_init_houses()
+
         # Executing all additional events that were received during the
         # initialisation and were ignored
         for event in additional_events:
             await self._received_message(event)
 
+        await self._set_ready()
+
+    async def _set_ready(self, background: bool = False) -> None:
+        """
+        Calls the ready listeners after the initialisation
+
+        :param background: If set to True the listeners are called in a
+         separate task, so the receiving of messages is not blocked. Used in
+         the early_ready mode, where the listeners might wait for houses
+         that are only received afterwards
+        """
         self._startup_time = time.time() - self._connection_start
 
         logger.debug(
@@ -419,30 +703,108 @@ class HivenWebSocket(HivenObject):
             "initialised the Client Cache!"
         )
         logger.info(f"[CLIENT] Ready after {self.startup_time}s")
+        self.client.connection._on_ready()
+
+        if background:
+            self._ready = True
+            self._ready_task = asyncio.create_task(
+                self._call_ready_listeners()
+            )
+            return
 
         # Delaying the receiving process until all ready-state listeners
         # were called
         await self.client.call_listeners('ready', (), {})
         self._ready = True
 
+    async def _call_ready_listeners(self) -> None:
+        """ Calls the ready listeners in the background """
+        try:
+            await self.client.call_listeners('ready', (), {})
+        except Exception:
+            utils.log_traceback(
+                level='error',
+                brief="Failed to call the ready listeners",
+                exc_info=sys.exc_info()
+            )
+
+    async def _loaded_init_houses(self) -> None:
+        """ Called once all houses of the INIT_STATE were loaded """
+        # Removing the houses the client left while the WebSocket restarted
+        if self.house_reconciler.reconnected:
+            await self.house_reconciler.remove_missing_houses(
+                self._init_house_ids
+            )
+
+        # Removing the houses of a loaded snapshot, which the client is not a
+        # member of anymore
+        if self.client.storage.snapshot_loaded:
+            self.client.storage.reconcile_houses(self._init_house_ids)
+            self.client.storage.commit()
+
+        logger.debug(
+            f"[WEBSOCKET] Loaded all {len(self._init_house_ids)} houses"
+        )
+
+    @staticmethod
+    def _get_event_house_id(event: str, data: Any) -> Optional[str]:
+        """ Returns the id of the house the event belongs to if it exists """
+        if type(data) is not dict:
+            return None
+
+        house_id = data.get('house_id')
+        if house_id is None and event.startswith('HOUSE_'):
+            house_id = data.get('id')
+        return house_id
+
+    async def _received_pending_house_event(
+            self, house_id: str, event: str, data: dict, msg: dict
+    ) -> None:
+        """
+        Handles an event of a house of the INIT_STATE that was not loaded
+        yet. The HOUSE_JOIN event loads the house and afterwards releases the
+        events of the house that were received in the meantime. All other
+        events are delayed until then
+        """
+        if event != 'HOUSE_JOIN':
+            self._pending_houses[house_id].append(msg)
+            return
+
+        await self.house_reconciler.load_house(data)
+        delayed_events = self._pending_houses.pop(house_id)
+        self.client._house_loaded(house_id)
+        logger.debug(
+            f"[WEBSOCKET] Loaded house {house_id}. "
+            f"{len(self._pending_houses)} houses remaining"
+        )
+
+        for delayed_msg in delayed_events:
+            await self._received_message(delayed_msg)
+
+        if not self._pending_houses:
+            await self._loaded_init_houses()
+
     async def _received_init_event(
             self, msg: aiohttp.WSMessage
-    ) -> aiohttp.WSMessage:
+    ) -> Optional[dict]:
         """
         Only intended for the purpose of initialising the Client!
         Will be called by `received_init` on startup
+
+        :return: The decoded message, which is passed on to avoid decoding it
+         again. None if the message continues in the next message
         """
-        msg_dict = msg.json()
+        msg_dict = self.decode_message(msg)
+        if msg_dict is None:
+            return None
         opcode = msg_dict.get('op')
 
-        if opcode == self.OPCode.EVENT:
-            return msg
-        else:
+        if opcode != self.OPCode.EVENT:
             logger.warning(
                 f"[WEBSOCKET] Received unexpected websocket message: "
                 f"{opcode}: {msg}"
             )
-            return msg
+        return msg_dict
 
     async def send_heartbeat(self) -> None:
         """
@@ -450,19 +812,32 @@ class HivenWebSocket(HivenObject):
         connection alive
         """
         try:
-            await self.socket.send_str(str(json.dumps({
+            await self.socket.send_str(self.json_codec.dumps({
                 "op": self.OPCode.HEARTBEAT
-            })))
+            }))
         except Exception as e:
             raise RestartSessionError(
                 f"Failed to send heartbeat to WebSocket host!"
             ) from e
 
+    async def send_ping(self, payload: bytes = b'') -> None:
+        """
+        Sends a WebSocket ping, whose pong is used to measure the latency
+
+        :param payload: The payload that is sent back in the pong
+        """
+        try:
+            await self.socket.ping(payload)
+        except Exception as e:
+            raise RestartSessionError(
+                f"Failed to send ping to WebSocket host!"
+            ) from e
+
     async def send_auth(self) -> None:
         """ Sends the authentication header to the Hiven Endpoint"""
         try:
             await self.socket.send_str(
-                json.dumps({
+                self.json_codec.dumps({
                     "op": self.OPCode.AUTH,
                     "d": {
                         "token": self.token
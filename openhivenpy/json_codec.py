@@ -0,0 +1,193 @@
+"""
+JSON Codecs used for encoding and decoding data sent to or received from
+Hiven over the WebSocket and HTTP
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import importlib
+import json
+from abc import abstractmethod
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+from .base_types import HivenObject
+
+__all__ = [
+    'JSONCodec', 'StdlibJSONCodec', 'OrjsonCodec', 'UjsonCodec',
+    'get_json_codec', 'available_json_codecs'
+]
+
+logger = logging.getLogger(__name__)
+
+
+class JSONCodec(HivenObject):
+    """
+    Base class for a JSON Codec. A codec decodes the raw data received from
+    Hiven and encodes the data that will be sent to it.
+
+    Decoding errors are always raised as a subclass of ValueError, which
+    the stdlib `json.JSONDecodeError` as well as the errors of orjson and
+    ujson are.
+    """
+    name: str = None
+    module_name: str = None
+
+    def __repr__(self) -> str:
+        info = [
+            ('name', self.name)
+        ]
+        return '<{} {}>'.format(
+            self.__class__.__name__, ' '.join('%s=%s' % t for t in info)
+        )
+
+    @classmethod
+    def available(cls) -> bool:
+        """ Returns whether the module required by the codec is installed """
+        try:
+            importlib.import_module(cls.module_name)
+            return True
+        except ImportError:
+            return False
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """
+        Decodes the passed JSON data
+
+        :param data: The raw JSON data as str or bytes
+        :return: The decoded Python object
+        :raises ValueError: If the data is not valid JSON
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """
+        Encodes the passed object to a JSON string
+
+        :param obj: The object that should be encoded
+        :return: The JSON string
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """ JSON Codec using the Python built-in json module """
+    name = 'json'
+    module_name = 'json'
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """ JSON Codec using the orjson module (https://pypi.org/project/orjson/) """
+    name = 'orjson'
+    module_name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._loads: Callable = orjson.loads
+        self._dumps: Callable = orjson.dumps
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        # orjson returns bytes, which would not be accepted by the
+        # aiohttp.ClientWebSocketResponse.send_str() or as str-body
+        return self._dumps(obj).decode('utf-8')
+
+
+class UjsonCodec(JSONCodec):
+    """ JSON Codec using the ujson module (https://pypi.org/project/ujson/) """
+    name = 'ujson'
+    module_name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._loads: Callable = ujson.loads
+        self._dumps: Callable = ujson.dumps
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj, ensure_ascii=False)
+
+
+# Sorted by preference if the codec 'auto' is selected
+_CODECS: Dict[str, type] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    StdlibJSONCodec.name: StdlibJSONCodec
+}
+
+
+def available_json_codecs() -> list:
+    """ Returns the names of all JSON Codecs that can be used """
+    return [name for name, codec in _CODECS.items() if codec.available()]
+
+
+def get_json_codec(
+        codec: Optional[Union[str, JSONCodec]] = None
+) -> JSONCodec:
+    """
+    Returns the JSON Codec for the passed name or instance
+
+    :param codec: Name of the codec ('json', 'orjson', 'ujson' or 'auto') or
+     an already initialised JSONCodec instance. If None, the stdlib codec will
+     be used. 'auto' will use the fastest installed codec
+    :return: The JSONCodec instance
+    :raises ValueError: If the name of the codec is unknown
+    :raises ImportError: If the module required by the codec is not
+     installed
+    """
+    if codec is None:
+        return StdlibJSONCodec()
+    elif isinstance(codec, JSONCodec):
+        return codec
+
+    name = str(codec).lower()
+    if name == 'auto':
+        name = available_json_codecs()[0]
+        logger.debug(f"[JSON-CODEC] Automatically selected codec {name}")
+
+    codec_cls = _CODECS.get(name)
+    if codec_cls is None:
+        raise ValueError(
+            f"Unknown JSON codec '{codec}'! Expected one of: "
+            f"{', '.join(['auto', *_CODECS.keys()])}"
+        )
+    elif not codec_cls.available():
+        raise ImportError(
+            f"The JSON codec '{name}' requires the module "
+            f"'{codec_cls.module_name}' to be installed"
+        )
+    return codec_cls()
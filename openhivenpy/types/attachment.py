@@ -48,6 +48,7 @@ __all__ = ['Attachment']
 
 class Attachment(DataClassObject):
     """ Represents a Hiven Message Attachment containing a file """
+    __slots__ = ('_filename', '_media_url', '_raw')
     _json_schema: dict = AttachmentSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -56,6 +56,10 @@ class Context(DataClassObject):
     Represents a Command Context for a triggered command that was registered
     prior
     """
+    __slots__ = (
+        '_room', '_room_id', '_author', '_author_id', '_house', '_house_id',
+        '_timestamp'
+    )
     _json_schema: dict = ContextSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -52,6 +52,7 @@ class Embed(DataClassObject):
     This can represent an either customised embed or fetched embed from a
     website
     """
+    __slots__ = ('_url', '_type', '_title', '_image', '_description')
     _json_schema: dict = EmbedSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -49,6 +49,10 @@ __all__ = ['Entity']
 
 class Entity(DataClassObject):
     """ Represents a Hiven Entity inside a House which can contain Rooms """
+    __slots__ = (
+        '_type', '_position', '_resource_pointers', '_name', '_id',
+        '_house_id', '_house'
+    )
     _json_schema: dict = EntitySchema
     json_validator = get_compiled_validator(_json_schema)
 
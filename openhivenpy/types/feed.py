@@ -49,6 +49,8 @@ class Feed(DataClassObject):
     Represents the feed that is displayed on Hiven specifically for the user
     """
 
+    __slots__ = ()
+
     @log_type_exception('Feed')
     def __init__(self, data: dict, client: HivenClient):
         super().__init__()
@@ -1,12 +1,114 @@
 """ Schemas for the type classes """
+import hashlib
+import importlib.util
+import json
+import logging
+import marshal
+import os
+from types import CodeType
+from typing import Any, Callable, Optional
+
 import fastjsonschema
 
+logger = logging.getLogger(__name__)
+
+
+class LazyValidator:
+    """
+    Validator of a json-schema, which is only compiled on the first
+    validation, so importing the types does not compile all schemas.
+
+    If the env variable HIVEN_VALIDATOR_CACHE is set to a directory, the
+    compiled code of the validator is stored in it and re-used by later
+    processes instead of generating it again.
+    """
+    __slots__ = ('_schema', '_validator')
+
+    def __init__(self, schema: dict):
+        self._schema = schema
+        self._validator: Optional[Callable] = None
+
+    def __repr__(self) -> str:
+        return f"<LazyValidator compiled={self.compiled}>"
+
+    def __call__(self, data: Any, *args, **kwargs) -> Any:
+        validator = self._validator
+        if validator is None:
+            validator = self.compile()
+        return validator(data, *args, **kwargs)
+
+    @property
+    def compiled(self) -> bool:
+        """ Returns whether the validator was already compiled """
+        return self._validator is not None
+
+    def compile(self) -> Callable:
+        """ Compiles the validator if it was not compiled yet """
+        if self._validator is None:
+            self._validator = _compile_validator(self._schema)
+        return self._validator
+
+
+def _compile_validator(_json_schema: dict) -> Callable:
+    """
+    Compiles the validator of the passed schema. Uses the directory of the
+    env variable HIVEN_VALIDATOR_CACHE to cache the compiled code if set
+    """
+    cache_dir = os.getenv('HIVEN_VALIDATOR_CACHE')
+    if not cache_dir:
+        return fastjsonschema.compile(_json_schema)
+
+    # The compiled code depends on the schema, the fastjsonschema version and
+    # the Python bytecode version
+    key = hashlib.sha256(
+        json.dumps(_json_schema, sort_keys=True, default=str).encode()
+        + fastjsonschema.VERSION.encode()
+        + importlib.util.MAGIC_NUMBER
+    ).hexdigest()
+    path = os.path.join(cache_dir, f"{key}.bin")
+
+    code = None
+    try:
+        with open(path, 'rb') as file:
+            code = marshal.load(file)
+        if not isinstance(code, CodeType):
+            raise ValueError("The file does not contain compiled code")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        code = None
+        logger.warning(
+            f"[VALIDATOR] Ignoring invalid cached validator {path}: {e!r}"
+        )
+
+    if code is None:
+        source = fastjsonschema.compile_to_code(_json_schema)
+        code = compile(source, f"<validator {key[:12]}>", 'exec')
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Writing to a temporary file first, so other processes never
+            # read a partially written file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                marshal.dump(code, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(
+                f"[VALIDATOR] Failed to cache the validator in {cache_dir}: "
+                f"{e!r}"
+            )
+
+    namespace = {}
+    exec(code, namespace)
+    return namespace['validate']
+
 
-def get_compiled_validator(_json_schema: dict) -> dict:
+def get_compiled_validator(_json_schema: dict) -> LazyValidator:
     """
-    Gets the compiled validator for the passed schema
+    Gets the validator for the passed schema, which is compiled on the first
+    validation
     """
-    return fastjsonschema.compile(_json_schema)
+    return LazyValidator(_json_schema)
 
 
 AttachmentSchema: dict = {
@@ -30,7 +30,7 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Optional, List
+from typing import Optional, List, Mapping
 # Only importing the Objects for the purpose of type hinting and not actual use
 from typing import TYPE_CHECKING
 
@@ -59,6 +59,9 @@ class LazyHouse(DataClassObject):
     Consider fetching for more data the regular house object with
     HivenClient.get_house()
     """
+    __slots__ = (
+        '_id', '_name', '_icon', '_owner_id', '_owner', '_rooms', '_type'
+    )
     _json_schema: dict = LazyHouseSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -217,6 +220,10 @@ class LazyHouse(DataClassObject):
 
 class House(LazyHouse):
     """ Represents a Hiven House which can contain rooms and entities """
+    __slots__ = (
+        '_roles', '_roles_data', '_entities', '_default_permissions',
+        '_members', '_member_data', '_client_member', '_banner'
+    )
     _json_schema: dict = HouseSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -320,7 +327,7 @@ class House(LazyHouse):
     def members(self) -> Optional[List[Member]]:
         """ A list of members in this house """
 
-        if type(self._members) is dict and self._members:
+        if isinstance(self._members, Mapping) and self._members:
             members = []
             for d in dict(getattr(self, '_members')).values():
                 members.append(self._client.get_house_member(
@@ -417,7 +424,7 @@ class House(LazyHouse):
             resp = await self._client.http.post(
                 f"/houses/{self._id}/rooms", json=json
             )
-            raw_data = await resp.json()
+            raw_data = resp.json_data
 
             data = TextRoom.format_obj_data(raw_data.get('data'))
             return TextRoom(data, self._client)
@@ -441,7 +448,7 @@ class House(LazyHouse):
                 endpoint=f"/houses/{self.id}/entities",
                 json={'name': name, 'type': 1}
             )
-            raw_data = await resp.json()
+            raw_data = resp.json_data
             data = raw_data.get('data')
 
             # Fetching all existing ids
@@ -522,7 +529,7 @@ class House(LazyHouse):
                 endpoint=f"/houses/{self.id}/invites",
                 json={"max_uses": max_uses}
             )
-            raw_data = await resp.json()
+            raw_data = resp.json_data
 
             data = raw_data.get('data')
             data = Invite.format_obj_data(data)
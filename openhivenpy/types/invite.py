@@ -49,6 +49,10 @@ __all__ = ['Invite']
 
 class Invite(DataClassObject):
     """ Represents an Invite to a Hiven House """
+    __slots__ = (
+        '_code', '_url', '_created_at', '_house_id', '_max_age', '_max_uses',
+        '_type', '_house', '_house_members'
+    )
     _json_schema: dict = InviteSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -57,6 +57,7 @@ class Member(User):
     Represents a House Member on Hiven which contains the Hiven User, role-data
     and member-data
     """
+    __slots__ = ('_user_id', '_house_id', '_joined_at', '_roles', '_house')
     _json_schema: dict = MemberSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -51,6 +51,7 @@ __all__ = ['Mention']
 
 class Mention(DataClassObject):
     """ Represents an mention for a user in Hiven """
+    __slots__ = ('_timestamp', '_user', '_user_id', '_author', '_author_id')
     _json_schema: dict = MentionSchema
     json_validator = get_compiled_validator(_json_schema)
 
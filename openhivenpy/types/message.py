@@ -60,6 +60,7 @@ __all__ = ['DeletedMessage', 'Message']
 
 class DeletedMessage(DataClassObject):
     """ Represents a Deleted Message in a Room """
+    __slots__ = ('_message_id', '_house_id', '_room_id')
     _json_schema: dict = DeletedMessageSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -107,8 +108,28 @@ class DeletedMessage(DataClassObject):
 
 class Message(DataClassObject):
     """ Represents a standard Hiven message sent by a user """
+    __slots__ = (
+        '_id', '_author', '_author_id', '_attachment', '_content',
+        '_timestamp', '_edited_at', '_mentions', '_type', '_exploding',
+        '_house_id', '_house', '_room_id', '_room', '_embed', '_bucket',
+        '_device_id', '_exploding_age', '_recipient_ids'
+    )
     _json_schema: dict = MessageSchema
     json_validator = get_compiled_validator(_json_schema)
+    _lazy_fields = {
+        '_id': ('id', None),
+        '_author_id': ('author_id', None),
+        '_content': ('content', None),
+        '_timestamp': ('timestamp', int),
+        '_edited_at': ('edited_at', None),
+        '_type': ('type', int),
+        '_exploding': ('exploding', None),
+        '_house_id': ('house_id', None),
+        '_room_id': ('room_id', None),
+        '_bucket': ('bucket', int),
+        '_device_id': ('device_id', str),
+        '_exploding_age': ('exploding_age', int)
+    }
 
     @log_type_exception('Message')
     def __init__(self, data: dict, client: HivenClient):
@@ -51,6 +51,10 @@ __all__ = ['PrivateGroupRoom', 'PrivateRoom']
 
 class PrivateGroupRoom(BaseRoom):
     """ Represents a private group chat room with multiple users """
+    __slots__ = (
+        '_id', '_last_message_id', '_recipients', '_name', '_description',
+        '_emoji', '_type', '_client_user'
+    )
     _json_schema: dict = PrivateRoomSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -137,7 +141,7 @@ class PrivateGroupRoom(BaseRoom):
         if utils.convertible(int, self._recipients):
             recipients = []
             for id_ in self._recipients:
-                data = self._client.storage['users'].get(id_)
+                data = self._client.storage.lookup_user(id_)
                 if data:
                     user_data = User.format_obj_data(data)
                     recipients.append(User(user_data, self._client))
@@ -213,6 +217,10 @@ class PrivateGroupRoom(BaseRoom):
 
 class PrivateRoom(BaseRoom):
     """ Represents a private chat room with only one user """
+    __slots__ = (
+        '_id', '_last_message_id', '_recipient', '_recipient_id', '_name',
+        '_description', '_emoji', '_type', '_client_user'
+    )
     _json_schema: dict = PrivateRoomSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -326,7 +334,7 @@ class PrivateRoom(BaseRoom):
             recipient_id = None
 
         if type(self._recipient) is str:
-            data = self._client.storage['users'].get(recipient_id)
+            data = self._client.storage.lookup_user(recipient_id)
             if data:
                 self._recipient = User(data=data, client=self._client)
                 return self._recipient
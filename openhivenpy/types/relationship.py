@@ -68,6 +68,7 @@ class Relationship(DataClassObject):
 
             5 - Blocked User
     """
+    __slots__ = ('_user_id', '_user', '_type', '_last_updated_at')
     _json_schema: dict = RelationshipSchema
     json_validator = get_compiled_validator(_json_schema)
 
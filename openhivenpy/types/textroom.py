@@ -62,6 +62,10 @@ class TextRoom(DataClassObject):
 
             1 - Portal
     """
+    __slots__ = (
+        '_id', '_name', '_house_id', '_position', '_type', '_emoji',
+        '_description', '_last_message_id', '_house'
+    )
     _json_schema: dict = TextRoomSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -158,7 +162,7 @@ class TextRoom(DataClassObject):
             house_id = None
 
         if house_id:
-            data = self._client.storage['houses'].get(house_id)
+            data = self._client.storage.lookup_house(house_id)
             if data:
                 self._house = House(data=data, client=self._client)
                 return self._house
@@ -205,7 +209,7 @@ class TextRoom(DataClassObject):
                 f"/rooms/{self.id}/messages",
                 json={"content": content}
             )
-            raw_data = await resp.json()
+            raw_data = resp.json_data
 
             # Raw_data not in correct format => needs to access data field
             data = raw_data.get('data')
@@ -276,7 +280,7 @@ class TextRoom(DataClassObject):
             raw_data = await self._client.http.get(
                 f"/rooms/{self.id}/messages"
             )
-            raw_data = await raw_data.json()
+            raw_data = raw_data.json_data
 
             data = raw_data.get('data')
 
@@ -55,6 +55,10 @@ class LazyUser(BaseUser):
     Consider fetching for more data the regular user object with
     HivenClient.get_user()
     """
+    __slots__ = (
+        '_username', '_name', '_bio', '_id', '_email_verified', '_flags',
+        '_icon', '_header', '_bot'
+    )
     _json_schema: dict = LazyUserSchema
     json_validator = get_compiled_validator(_json_schema)
 
@@ -169,6 +173,10 @@ class LazyUser(BaseUser):
 
 class User(LazyUser):
     """ Represents the regular extended Hiven User """
+    __slots__ = (
+        '_location', '_website', '_blocked', '_presence', '_email',
+        '_mfa_enabled'
+    )
     _json_schema: dict = UserSchema
     json_validator = get_compiled_validator(_json_schema)
 
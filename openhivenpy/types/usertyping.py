@@ -49,6 +49,11 @@ __all__ = ['UserTyping']
 class UserTyping(DataClassObject):
     """ Represents a Hiven User typing in a room """
 
+    __slots__ = (
+        '_author', '_room', '_house', '_author_id', '_house_id', '_room_id',
+        '_timestamp'
+    )
+
     @log_type_exception('UserTyping')
     def __init__(self, data: dict, client: HivenClient):
         super().__init__()
@@ -119,7 +124,7 @@ class UserTyping(DataClassObject):
             house_id = None
 
         if house_id:
-            data = self._client.storage['houses'].get(self._house)
+            data = self._client.storage.lookup_house(house_id)
             if data:
                 self._house = House(data=data, client=self._client)
                 return self._house
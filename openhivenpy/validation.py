@@ -0,0 +1,227 @@
+"""
+Validation policy deciding whether the data received from Hiven is validated
+using the json-schemas of the types
+
+---
+
+Under MIT License
+
+Copyright © 2020 - 2021 Luna Klatzer
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+# Used for type hinting and not having to use annotations for the objects
+from __future__ import annotations
+
+import logging
+import os
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import deepcopy
+from typing import Any, Iterator, Optional, Union
+
+from .base_types import HivenObject
+
+__all__ = [
+    'ValidationPolicy', 'get_validation_policy', 'set_validation_policy',
+    'current_validation_policy', 'use_validation_policy'
+]
+
+logger = logging.getLogger(__name__)
+
+_current_policy: Optional[ValidationPolicy] = None
+
+# Policy of the client whose data is currently formatted. Overrides the
+# process-wide default policy
+_context_policy: ContextVar[Optional[ValidationPolicy]] = ContextVar(
+    'validation_policy', default=None
+)
+
+
+class ValidationPolicy(HivenObject):
+    """
+    Policy deciding whether the data passed to `format_obj_data()` of the
+    types is validated using their json-schema. If the validation is skipped,
+    only the defaults of the schema are applied to the data.
+
+    Modes:
+    - 'always': Validates all data. The default
+    - 'sample': Validates a random sample of the data, which is sized using
+      `sample_rate`
+    - 'never': Never validates the data
+    - 'on_error': Only validates the data if formatting it failed and retries
+      formatting it with the validated data
+    """
+    MODES = ('always', 'sample', 'never', 'on_error')
+
+    def __init__(self, mode: str = 'always', *, sample_rate: float = 0.1):
+        """
+        :param mode: The validation mode. Either 'always', 'sample', 'never'
+         or 'on_error'
+        :param sample_rate: The share of the data that is validated in the
+         'sample' mode. Must be greater than 0 and at most 1
+        :raises ValueError: If one of the passed values is invalid
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Invalid validation mode '{mode}'! Expected one of: "
+                f"{', '.join(self.MODES)}"
+            )
+        if not 0 < sample_rate <= 1:
+            raise ValueError(
+                "sample_rate must be greater than 0 and at most 1"
+            )
+
+        self._mode = mode
+        self._sample_rate = sample_rate
+
+    def __repr__(self) -> str:
+        info = [
+            ('mode', self.mode),
+            ('sample_rate', self.sample_rate)
+        ]
+        return '<ValidationPolicy {}>'.format(
+            ' '.join('%s=%s' % t for t in info)
+        )
+
+    @property
+    def mode(self) -> str:
+        """ The validation mode """
+        return getattr(self, '_mode', 'always')
+
+    @property
+    def sample_rate(self) -> float:
+        """ The share of the data that is validated in the 'sample' mode """
+        return getattr(self, '_sample_rate', 1.0)
+
+    @property
+    def validate_on_error(self) -> bool:
+        """
+        Returns whether data that failed to be formatted should be validated
+        and formatted again
+        """
+        return self._mode == 'on_error'
+
+    def should_validate(self) -> bool:
+        """ Returns whether the next passed data should be validated """
+        if self._mode == 'always':
+            return True
+        elif self._mode == 'sample':
+            return random.random() < self._sample_rate
+        return False
+
+
+def get_validation_policy(
+        policy: Optional[Union[str, ValidationPolicy]] = None
+) -> ValidationPolicy:
+    """
+    Returns the ValidationPolicy for the passed mode or instance
+
+    :param policy: The mode ('always', 'never', 'on_error', 'sample' or
+     'sample:<rate>', for example 'sample:0.05') or an already initialised
+     ValidationPolicy. If None, all data will be validated
+    :return: The ValidationPolicy instance
+    :raises ValueError: If the mode or the sample rate is invalid
+    """
+    if policy is None:
+        return ValidationPolicy()
+    elif isinstance(policy, ValidationPolicy):
+        return policy
+
+    mode, _, sample_rate = str(policy).lower().partition(':')
+    if sample_rate:
+        if mode != 'sample':
+            raise ValueError(
+                "A sample rate can only be passed for the 'sample' mode"
+            )
+        return ValidationPolicy(mode, sample_rate=float(sample_rate))
+    return ValidationPolicy(mode)
+
+
+def set_validation_policy(
+        policy: Optional[Union[str, ValidationPolicy]]
+) -> ValidationPolicy:
+    """
+    Sets the default ValidationPolicy used by all types. Clients created with
+    their own policy use it instead while formatting their data
+
+    :param policy: The mode or the ValidationPolicy. See
+     `get_validation_policy()`
+    :return: The now used ValidationPolicy instance
+    """
+    global _current_policy
+    _current_policy = get_validation_policy(policy)
+    logger.debug(f"[VALIDATION] Using {_current_policy!r}")
+    return _current_policy
+
+
+def current_validation_policy() -> ValidationPolicy:
+    """
+    Returns the ValidationPolicy used by the types in the current context.
+    This is the policy set using `use_validation_policy()` or otherwise the
+    default policy, which defaults to the policy set in the env variable
+    HIVEN_VALIDATION_POLICY
+    """
+    policy = _context_policy.get()
+    if policy is not None:
+        return policy
+    elif _current_policy is None:
+        return set_validation_policy(os.getenv('HIVEN_VALIDATION_POLICY'))
+    return _current_policy
+
+
+@contextmanager
+def use_validation_policy(
+        policy: Optional[ValidationPolicy]
+) -> Iterator[None]:
+    """
+    Context manager using the passed ValidationPolicy for all data formatted
+    in the current context. Used by the clients to format their data with
+    their own policy without changing the default policy
+
+    :param policy: The ValidationPolicy. If None, the default policy is used
+    """
+    token = _context_policy.set(policy)
+    try:
+        yield
+    finally:
+        _context_policy.reset(token)
+
+
+def apply_schema_defaults(schema: dict, data: Any) -> Any:
+    """
+    Applies the defaults of the json-schema to the passed data without
+    validating it, like the compiled validator does
+
+    :param schema: The json-schema
+    :param data: The data the defaults should be added to. Modified in-place
+    :return: The passed data
+    """
+    if type(data) is dict:
+        for key, sub_schema in schema.get('properties', {}).items():
+            if key not in data:
+                if 'default' not in sub_schema:
+                    continue
+                data[key] = deepcopy(sub_schema['default'])
+            apply_schema_defaults(sub_schema, data[key])
+    elif type(data) is list and type(schema.get('items')) is dict:
+        for item in data:
+            apply_schema_defaults(schema['items'], item)
+    return data
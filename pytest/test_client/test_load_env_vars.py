@@ -42,3 +42,38 @@ class TestENV:
 
         openhivenpy.env.load_env(path=self.CORRECT_PATH, search_other=True)  # <== correct.env
         assert '128' == openhivenpy.env.env_vars['BOT_TOKEN_LEN']
+
+    def test_max_depth(self, tmp_path, monkeypatch):
+        nested = tmp_path / 'a' / 'b'
+        nested.mkdir(parents=True)
+        (nested / 'nested.env').write_text("export BOT_TOKEN_LEN=1\n")
+        monkeypatch.chdir(tmp_path)
+
+        env = openhivenpy.HivenENV()
+        try:
+            env.load_env(search_other=True, max_depth=1)
+            assert '132' == env.env_vars['BOT_TOKEN_LEN']
+
+            env.load_env(search_other=True, max_depth=2)  # <== nested.env
+            assert '1' == env.env_vars['BOT_TOKEN_LEN']
+            # Variables missing in the file are set to the defaults
+            assert os.getenv('WS_HEARTBEAT') == default_env_vars['WS_HEARTBEAT']
+        finally:
+            openhivenpy.env.load_env(search_other=False)
+
+    def test_ensure_loaded(self, tmp_path, monkeypatch):
+        path = tmp_path / 'custom.env'
+        path.write_text("export BOT_TOKEN_LEN=7\n")
+        monkeypatch.setenv('HIVEN_ENV_FILE', str(path))
+
+        env = openhivenpy.HivenENV()
+        try:
+            assert not env.loaded
+            assert '7' == env.ensure_loaded()['BOT_TOKEN_LEN']
+            assert env.loaded
+
+            # Explicitly loaded environments are not overridden
+            env.load_env(search_other=False)
+            assert '132' == env.ensure_loaded()['BOT_TOKEN_LEN']
+        finally:
+            openhivenpy.env.load_env(search_other=False)
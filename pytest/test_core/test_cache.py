@@ -1,3 +1,8 @@
+import time
+from copy import deepcopy
+
+import pytest
+
 import openhivenpy
 
 
@@ -95,10 +100,11 @@ class TestCache:
         assert cache['users'][data['id']] == validated_data
 
     def test_add_house(self):
-        data = dict(self.test_house_args)
+        # The cache owns the passed data and modifies it
+        data = deepcopy(self.test_house_args)
         cache = openhivenpy.client.ClientCache(openhivenpy.HivenClient())
         client_user = cache.update_client_user(dict(data['members'][0]['user']))
-        return_data = cache.add_or_update_house(dict(data))
+        return_data = cache.add_or_update_house(deepcopy(data))
 
         # Regular format_obj_data won't add the client_user property!
         client_member = return_data.pop('client_member')
@@ -107,3 +113,160 @@ class TestCache:
         validated_data = openhivenpy.House.format_obj_data(data)
         assert return_data == validated_data
         assert cache['houses'][self.test_house_args['id']] == return_data
+
+    def test_house_indexes(self):
+        data = deepcopy(self.test_house_args)
+        client = openhivenpy.HivenClient()
+        cache = client.storage
+        cache.update_client_user(dict(data['members'][0]['user']))
+        house_id = data['id']
+
+        for room in data['rooms']:
+            cache.add_or_update_room(room)
+        for entity in data['entities']:
+            cache.add_or_update_entity(entity)
+
+        assert cache.get_house_room_ids(house_id) == ['212317516322568423']
+        assert sorted(cache.get_house_entity_ids(house_id)) == [
+            '212317516473562181', '212317521896798165'
+        ]
+        assert [r['id'] for r in client.find_house_rooms(house_id)] == [
+            '212317516322568423'
+        ]
+        assert len(client.find_house_entities(house_id)) == 2
+
+        cache.remove_room('212317516322568423')
+        cache.remove_entity('212317521896798165')
+        assert cache.get_house_room_ids(house_id) == []
+        assert cache.get_house_entity_ids(house_id) == ['212317516473562181']
+        assert cache.get_house_room_ids('unknown') == []
+
+    def test_user_house_index(self):
+        client = openhivenpy.HivenClient()
+        cache = client.storage
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        member = {'user_id': '1', 'house_id': '2'}
+        cache['houses']['2'] = {'id': '2', 'members': {'1': member}}
+        cache._add_to_index('user_houses', '1', '2')
+
+        assert cache.get_user_house_ids('1') == ['2']
+        assert client.find_user_house_members('1') == [member]
+        assert [h['id'] for h in client.find_user_houses('1')] == ['2']
+
+        cache.remove_house_member('1', '2')
+        assert cache.get_user_house_ids('1') == []
+        assert '1' not in cache['indexes']['user_houses']
+
+    def test_policy_validation(self):
+        with pytest.raises(ValueError):
+            openhivenpy.CachePolicy(member_cache='sometimes')
+        with pytest.raises(ValueError):
+            openhivenpy.CachePolicy(max_users=0)
+
+    def test_lru_users(self):
+        client = openhivenpy.HivenClient(
+            cache_policy=openhivenpy.CachePolicy(max_users=3)
+        )
+        cache = client.storage
+        client_user = deepcopy(self.test_house_args['members'][0]['user'])
+        cache.update_client_user(client_user)
+
+        def user(id_: str) -> dict:
+            return {'id': id_, 'username': f'user{id_}', 'name': f'User {id_}'}
+
+        cache.add_or_update_user(user('1'))
+        cache.add_or_update_user(user('2'))
+        # Accessing '1' so that '2' is the least recently used user
+        assert client.find_user('1') is not None
+        cache.add_or_update_user(user('3'))
+
+        assert '2' not in cache['users']
+        assert '1' in cache['users'] and '3' in cache['users']
+        # The client user is pinned
+        assert client_user['id'] in cache['users']
+        assert client.find_user('2') is None
+        assert cache.stats == {'hits': 1, 'misses': 1, 'evictions': 1}
+
+    def test_ttl(self):
+        client = openhivenpy.HivenClient(
+            cache_policy=openhivenpy.CachePolicy(ttl=0.05)
+        )
+        cache = client.storage
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        cache.add_or_update_user({'id': '1', 'username': 'a', 'name': 'A'})
+        time.sleep(0.06)
+        cache.evict_expired()
+        assert '1' not in cache['users']
+        assert cache['client_user']['id'] in cache['users']
+
+    def test_member_cache_online(self):
+        client = openhivenpy.HivenClient(
+            cache_policy=openhivenpy.CachePolicy(member_cache='online')
+        )
+        cache = client.storage
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        cache['houses']['2'] = {'id': '2', 'members': {}}
+
+        def member(id_: str, presence: str) -> dict:
+            return {
+                'user_id': id_,
+                'house_id': '2',
+                'joined_at': '2021-02-12T21:14:00.561Z',
+                'presence': presence,
+                'user': {'id': id_, 'username': f'u{id_}', 'name': f'U{id_}'}
+            }
+
+        cache.add_or_update_house_member(member('1', 'online'))
+        cache.add_or_update_house_member(member('3', 'offline'))
+        assert list(cache['houses']['2']['members'].keys()) == ['1']
+
+        cache.mark_house_member_offline('1', '2')
+        assert cache['houses']['2']['members'] == {}
+        assert cache.get_user_house_ids('1') == []
+
+    def test_snapshot(self, tmp_path):
+        client = openhivenpy.HivenClient(token='secret')
+        cache = client.storage
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        cache['token'] = 'secret'
+        data = deepcopy(self.test_house_args)
+        for room in data['rooms']:
+            cache.add_or_update_room(room)
+        cache.add_or_update_user({'id': '1', 'username': 'a', 'name': 'A'})
+
+        snapshot = cache.to_snapshot()
+        assert snapshot.startswith(b'OHCS')
+        assert b'secret' not in snapshot
+
+        path = str(tmp_path / 'cache.snapshot')
+        cache.save_snapshot(path)
+
+        new_client = openhivenpy.HivenClient(cache_snapshot=path)
+        new_cache = new_client.storage
+        assert new_cache.snapshot_loaded
+        assert new_cache['token'] != 'secret'
+        assert new_cache['users'] == cache['users']
+        assert new_cache['rooms'] == cache['rooms']
+        assert new_cache['indexes'] == cache['indexes']
+        assert new_client.get_user('1').name == 'A'
+        assert new_client.find_house_rooms(data['id'])[0]['name'] == 'General'
+
+        new_cache.reconcile_houses([])
+        assert not new_cache.snapshot_loaded
+
+    def test_invalid_snapshot(self, tmp_path):
+        path = tmp_path / 'cache.snapshot'
+        path.write_bytes(b'invalid')
+
+        cache = openhivenpy.HivenClient().storage
+        assert cache.load_snapshot(str(path)) is False
+        assert cache.load_snapshot(str(tmp_path / 'missing')) is False
+        assert not cache.snapshot_loaded
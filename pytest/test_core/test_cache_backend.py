@@ -0,0 +1,73 @@
+import functools
+from copy import deepcopy
+
+import pytest
+
+import openhivenpy
+from openhivenpy.client import CacheBackend, ClientCache, SQLiteClientCache
+import test_cache
+
+
+class RecordingCache(ClientCache):
+    """ ClientCache recording the lookups of the client """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = []
+
+    def lookup_house(self, house_id):
+        self.lookups.append(('house', house_id))
+        return super().lookup_house(house_id)
+
+
+class TestCacheBackend:
+    test_house_args = test_cache.TestCache.test_house_args
+
+    def test_interface(self):
+        # Backends not implementing all required methods can not be created
+        with pytest.raises(TypeError):
+            CacheBackend()
+
+        class IncompleteCache(CacheBackend):
+            def lookup_user(self, user_id):
+                return None
+
+        with pytest.raises(TypeError):
+            IncompleteCache()
+
+        # The optional methods have defaults
+        backend = ClientCache(openhivenpy.HivenClient())
+        assert backend.snapshot_loaded is False
+        backend.commit()
+        assert CacheBackend.stats.fget(backend) == {}
+        with pytest.raises(NotImplementedError):
+            CacheBackend.save_snapshot(backend, 'path')
+
+    def test_default_backend(self):
+        client = openhivenpy.HivenClient(token='token')
+        assert type(client.storage) is ClientCache
+        assert isinstance(client.storage, CacheBackend)
+        assert client.token == 'token'
+
+    def test_custom_backend(self):
+        client = openhivenpy.HivenClient(cache_backend=RecordingCache)
+        cache = client.storage
+        assert isinstance(cache, RecordingCache)
+
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        cache.add_or_update_house(deepcopy(self.test_house_args))
+        house_id = self.test_house_args['id']
+
+        assert client.get_house(house_id).name == 'A pretty good House'
+        assert client.house_ids == [house_id]
+        assert client.room_ids == ['212317516322568423']
+        assert client.find_room('212317516322568423')['name'] == 'General'
+        assert ('house', house_id) in cache.lookups
+
+    def test_backend_factory(self):
+        client = openhivenpy.HivenClient(
+            cache_backend=functools.partial(SQLiteClientCache, front_size=10)
+        )
+        assert isinstance(client.storage, SQLiteClientCache)
+        assert client.storage.front_size == 10
@@ -0,0 +1,128 @@
+import json
+import zlib
+
+import pytest
+
+from openhivenpy.gateway import (TransportCompression, ZlibStreamCompression,
+                                 ZstdStreamCompression,
+                                 get_transport_compression)
+from openhivenpy.gateway.compression import _JSONMessageScanner
+
+
+def record_zlib_frames(messages: list, split: int = 1) -> list:
+    """
+    Compresses the messages like the Swarm using a single zlib stream, where
+    every message is flushed using Z_SYNC_FLUSH and split into the passed
+    amount of frames
+    """
+    compressor = zlib.compressobj()
+    frames = []
+    for msg in messages:
+        data = compressor.compress(json.dumps(msg).encode())
+        data += compressor.flush(zlib.Z_SYNC_FLUSH)
+        size = -(-len(data) // split)
+        frames.extend(data[i:i + size] for i in range(0, len(data), size))
+    return frames
+
+
+def record_zstd_frames(messages: list, split: int = 1) -> list:
+    """
+    Compresses the messages like the Swarm using a single zstd stream, where
+    every message is flushed and split into the passed amount of frames
+    """
+    import zstandard
+    compressor = zstandard.ZstdCompressor().compressobj()
+    frames = []
+    for msg in messages:
+        data = compressor.compress(json.dumps(msg).encode())
+        data += compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        size = -(-len(data) // split)
+        frames.extend(data[i:i + size] for i in range(0, len(data), size))
+    return frames
+
+
+class TestTransportCompression:
+    messages = [{'op': 0, 'e': 'MESSAGE_CREATE', 'd': {'id': str(i)}}
+                for i in range(5)]
+
+    def test_zlib_stream(self):
+        compression = get_transport_compression('zlib_json')
+        assert isinstance(compression, ZlibStreamCompression)
+
+        decoded = [
+            json.loads(compression.decompress(frame))
+            for frame in record_zlib_frames(self.messages)
+        ]
+        assert decoded == self.messages
+
+    def test_zlib_split_frames(self):
+        compression = ZlibStreamCompression()
+        frames = record_zlib_frames(self.messages, split=3)
+        results = [compression.decompress(frame) for frame in frames]
+
+        decoded = [json.loads(r) for r in results if r is not None]
+        assert decoded == self.messages
+        assert results.count(None) == len(frames) - len(self.messages)
+
+    def test_zlib_invalid_data(self):
+        with pytest.raises(ValueError):
+            ZlibStreamCompression().decompress(
+                b'invalid' + ZlibStreamCompression.ZLIB_SUFFIX
+            )
+
+    def test_zstd_stream(self):
+        pytest.importorskip('zstandard')
+        compression = get_transport_compression('zstd_json')
+        assert isinstance(compression, ZstdStreamCompression)
+
+        decoded = [
+            json.loads(compression.decompress(frame))
+            for frame in record_zstd_frames(self.messages)
+        ]
+        assert decoded == self.messages
+
+    def test_zstd_split_frames(self):
+        pytest.importorskip('zstandard')
+        compression = ZstdStreamCompression()
+        messages = [
+            *self.messages,
+            {'op': 0, 'e': 'MESSAGE_CREATE',
+             'd': {'id': '5', 'content': '} ] "{'}}
+        ]
+        frames = record_zstd_frames(messages, split=3)
+        results = [compression.decompress(frame) for frame in frames]
+
+        decoded = [json.loads(r) for r in results if r is not None]
+        assert decoded == messages
+        assert results.count(None) == len(frames) - len(messages)
+
+    def test_zstd_message_scanner(self):
+        message = json.dumps(
+            {'d': {'content': '} ] "{ \\', 'ids': ['1', '2']}}
+        ).encode()
+        # Splitting the message at every position, including inside of
+        # strings and escapes
+        for i in range(1, len(message)):
+            scanner = _JSONMessageScanner()
+            assert not scanner.feed(message[:i])
+            assert scanner.feed(message[i:])
+            # The state is reset for the next message
+            assert scanner.feed(message)
+
+        scanner = _JSONMessageScanner()
+        assert not scanner.feed(b'')
+        assert not scanner.feed(b'{"d": "}')
+
+    def test_abstract(self):
+        with pytest.raises(TypeError):
+            TransportCompression()
+
+    def test_get_transport_compression(self):
+        assert get_transport_compression() is None
+        assert get_transport_compression('text_json') is None
+        with pytest.raises(ValueError):
+            get_transport_compression('unknown')
+
+        if not ZstdStreamCompression.available():
+            with pytest.raises(ImportError):
+                get_transport_compression('zstd_json')
@@ -1,5 +1,8 @@
 import asyncio
 import inspect
+import json
+import os
+from copy import deepcopy
 
 import pytest
 
@@ -205,3 +208,57 @@ class TestHivenEventHandler:
             assert len(client.active_listeners['ready']) == 0
 
         asyncio.run(run())
+
+
+class TestHivenParsers:
+    user_data = {
+        'username': 'kudo',
+        'flags': '0',
+        'name': 'The lovely Kudo',
+        'id': '175697072878514388',
+        'icon': '7b33d7197e7a7f4cdf5e8b0ec3e0a1fcd0620b06.png',
+        'header': '0aa06362a7ac3709d063c15df3b15055003e6bf8.png',
+        'bot': False
+    }
+
+    def test_no_listener_skips_objects(self):
+        _client = openhivenpy.HivenClient()
+        _client.storage.update_client_user(dict(self.user_data))
+
+        # Faulty data would fail the validation, but it is never validated
+        # without listeners
+        args, kwargs = asyncio.run(
+            _client.parsers.dispatch('message_create', {'id': 'test'})
+        )
+        assert args == () and kwargs == {}
+
+    def test_no_listener_updates_cache(self):
+        _client = openhivenpy.HivenClient()
+        _client.storage.update_client_user(dict(self.user_data))
+
+        new_data = {**self.user_data, 'id': '1', 'name': 'presence'}
+        args, kwargs = asyncio.run(
+            _client.parsers.dispatch('presence_update', new_data)
+        )
+        assert args == () and kwargs == {}
+        assert _client.storage['users']['1']['name'] == 'presence'
+
+    def test_house_entities_update(self):
+        path = os.path.join(os.path.dirname(__file__), '..', 'test_data.json')
+        with open(path, 'r', encoding='utf-8') as file:
+            house_data = json.load(file)['house_data']
+
+        _client = openhivenpy.HivenClient()
+        _client.storage.update_client_user(
+            deepcopy(house_data['members'][0]['user'])
+        )
+        _client.storage.add_or_update_house(deepcopy(house_data))
+
+        entity = {**house_data['entities'][0], 'name': 'Renamed'}
+        asyncio.run(_client.parsers.dispatch(
+            'house_entities_update',
+            {'house_id': house_data['id'], 'entities': [entity]}
+        ))
+        assert _client.storage['entities'][entity['id']]['name'] == 'Renamed'
+        assert _client.storage.get_house_entity_ids(house_data['id']) == \
+               [entity['id']]
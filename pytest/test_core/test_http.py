@@ -0,0 +1,86 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from openhivenpy.gateway import HTTP, HTTPResponse
+from openhivenpy.json_codec import get_json_codec
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.method = 'GET'
+        self.url = 'https://api.hiven.io/v1/users/@me'
+        self.headers = {}
+        self.body = body
+        self.reads = 0
+
+    async def read(self):
+        self.reads += 1
+        return self.body
+
+    async def json(self, **kwargs):
+        raise AssertionError("The response body should not be decoded again")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    def __init__(self, *responses: FakeResponse):
+        self.responses = list(responses)
+        self.requests = 0
+
+    def request(self, **kwargs):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+def create_http(*responses: FakeResponse) -> HTTP:
+    client = SimpleNamespace(token='token', json_codec=get_json_codec('json'))
+    http = HTTP(client, host='api.hiven.io', api_version='v1')
+    http._session = FakeSession(*responses)
+    http._ready = True
+    return http
+
+
+class TestHTTP:
+    def test_decoded_response(self):
+        fake = FakeResponse(
+            200, b'{"success": true, "data": {"id": "1", "name": "test"}}'
+        )
+        http = create_http(fake)
+
+        resp = asyncio.run(http.get('/users/@me'))
+        assert isinstance(resp, HTTPResponse)
+        assert resp.status == 200
+        assert resp.success is True
+        assert resp.data == {"id": "1", "name": "test"}
+        assert resp.raw == fake.body
+        assert resp.elapsed >= 0
+        assert asyncio.run(resp.json()) == resp.json_data
+        assert fake.reads == 1
+
+    def test_empty_response(self):
+        http = create_http(FakeResponse(204, b''))
+
+        resp = asyncio.run(http.get('/users/@me'))
+        assert resp.status == 204
+        assert resp.json_data is None
+        assert resp.data is None
+
+    def test_rate_limit_retry(self):
+        expires_at = time.time() + 0.2
+        http = create_http(
+            FakeResponse(429, f'{{"expires_at": {expires_at}}}'.encode()),
+            FakeResponse(200, b'{"success": true, "data": {}}')
+        )
+
+        resp = asyncio.run(http.post('/rooms/1/messages'))
+        assert resp.status == 200
+        assert resp.elapsed >= 0.15
+        assert http.session.requests == 2
+        assert '/rooms/{id}/messages' in http.rate_limits.buckets
@@ -0,0 +1,84 @@
+import gc
+from copy import deepcopy
+
+import openhivenpy
+from openhivenpy.client import IdentityMap
+import test_cache
+
+
+class TestIdentityMap:
+    test_house_args = test_cache.TestCache.test_house_args
+
+    def create_client(self) -> openhivenpy.HivenClient:
+        client = openhivenpy.HivenClient()
+        client.storage.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        return client
+
+    def test_shared_instances(self):
+        client = self.create_client()
+        client.storage.add_or_update_user(
+            {'id': '1', 'username': 'a', 'name': 'A'}
+        )
+
+        user = client.get_user('1')
+        assert user is client.get_user('1')
+        assert client.get_user('unknown') is None
+
+        client.storage.add_or_update_user(
+            {'id': '1', 'username': 'a', 'name': 'B'}
+        )
+        assert user.name == 'B'
+
+        client.storage.remove_user('1')
+        assert client.get_user('1') is None
+        assert user.name == 'B'
+
+    def test_house_instances(self):
+        client = self.create_client()
+        client.storage.add_or_update_house(deepcopy(self.test_house_args))
+        house_id = self.test_house_args['id']
+        room_id = self.test_house_args['rooms'][0]['id']
+
+        house = client.get_house(house_id)
+        room = client.get_room(room_id)
+        assert house is client.get_house(house_id)
+        assert client.get_house_rooms(house_id) == [room]
+
+        data = deepcopy(self.test_house_args)
+        data['name'] = 'Renamed'
+        data['rooms'][0]['name'] = 'Renamed'
+        client.storage.add_or_update_house(data)
+        assert house.name == 'Renamed'
+        assert room.name == 'Renamed'
+
+    def test_stale_instances(self):
+        client = self.create_client()
+        client.storage.add_or_update_user(
+            {'id': '1', 'username': 'a', 'name': 'A'}
+        )
+        user = client.get_user('1')
+
+        # The instance is only rebuilt once it is accessed again
+        for name in ('B', 'C'):
+            client.storage.add_or_update_user(
+                {'id': '1', 'username': 'a', 'name': name}
+            )
+        assert user._refresh_data['name'] == 'C'
+        assert user.name == 'C'
+        assert user._refresh_data is None
+        assert 'C' in repr(user)
+
+    def test_weak_references(self):
+        client = self.create_client()
+        user_id = client.storage.get_client_user()['id']
+        assert isinstance(client.identity_map, IdentityMap)
+
+        user = client.get_user(user_id)
+        assert client.identity_map.get('user', user_id) is user
+        assert len(client.identity_map) == 1
+
+        del user
+        gc.collect()
+        assert client.identity_map.get('user', user_id) is None
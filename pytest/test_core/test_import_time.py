@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Modules that should only be imported once they are used
+LAZY_MODULES = (
+    'aiohttp', 'openhivenpy.client', 'openhivenpy.events',
+    'openhivenpy.gateway', 'openhivenpy.types', 'fastjsonschema', 'dotenv'
+)
+
+
+def imported(name: str, modules: dict) -> bool:
+    """ Returns whether the module or one of its submodules was imported """
+    return any(m == name or m.startswith(f'{name}.') for m in modules)
+
+
+def import_time(code: str, tmp_path) -> dict:
+    """ Runs the code with -X importtime and returns the imported modules """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=str(tmp_path), env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestImportTime:
+    def test_lazy_submodules(self, tmp_path):
+        modules = import_time('import openhivenpy', tmp_path)
+        assert 'openhivenpy' in modules
+        for name in LAZY_MODULES:
+            assert not imported(name, modules), f"{name} imported eagerly"
+
+    def test_lazy_attributes(self, tmp_path):
+        modules = import_time(
+            'import openhivenpy; openhivenpy.User', tmp_path
+        )
+        assert imported('openhivenpy.types', modules)
+        assert not imported('aiohttp', modules)
+
+        modules = import_time('from openhivenpy import *', tmp_path)
+        assert imported('openhivenpy.client', modules)
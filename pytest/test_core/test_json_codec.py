@@ -0,0 +1,51 @@
+import pytest
+
+import openhivenpy
+from openhivenpy import json_codec
+
+test_msg = {
+    "op": 0,
+    "e": "MESSAGE_CREATE",
+    "d": {"id": "1", "content": "ünïcode", "mentions": [], "bucket": 0}
+}
+
+
+class TestJSONCodec:
+    def test_default(self):
+        codec = json_codec.get_json_codec(None)
+        assert codec.name == 'json'
+        assert json_codec.get_json_codec(codec) is codec
+
+    def test_auto(self):
+        codec = json_codec.get_json_codec('auto')
+        assert codec.name == json_codec.available_json_codecs()[0]
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            json_codec.get_json_codec('unknown')
+
+    def test_abstract(self):
+        class LoadsOnlyCodec(json_codec.JSONCodec):
+            def loads(self, data):
+                return None
+
+        with pytest.raises(TypeError):
+            LoadsOnlyCodec()
+
+    @pytest.mark.parametrize('name', ['json', 'orjson', 'ujson'])
+    def test_round_trip(self, name):
+        if name not in json_codec.available_json_codecs():
+            pytest.skip(f"{name} is not installed")
+
+        codec = json_codec.get_json_codec(name)
+        encoded = codec.dumps(test_msg)
+        assert type(encoded) is str
+        assert codec.loads(encoded) == test_msg
+        assert codec.loads(encoded.encode('utf-8')) == test_msg
+
+        with pytest.raises(ValueError):
+            codec.loads(b'')
+
+    def test_client_codec(self):
+        client = openhivenpy.HivenClient(json_codec='json')
+        assert client.json_codec.name == 'json'
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from openhivenpy.gateway import KeepAlive, LatencyHistogram
+
+
+class FakeSocket:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeWebSocket:
+    """ WebSocket recording the sent heartbeats and pings """
+    heartbeat = 1
+
+    def __init__(self):
+        self.socket = FakeSocket()
+        self.open = True
+        self._open = True
+        self.pings = []
+
+    async def send_heartbeat(self):
+        pass
+
+    async def send_ping(self, payload: bytes = b''):
+        self.pings.append(payload)
+
+
+class TestLatencyHistogram:
+    def test_samples(self):
+        histogram = LatencyHistogram(size=4)
+        assert histogram.latest is None
+        assert histogram.percentile(50) is None
+
+        for rtt in (0.01, 0.2, 0.04, 0.03, 6.0):
+            histogram.add(rtt)
+
+        # The first sample was replaced
+        assert len(histogram) == 4
+        assert histogram.latest == 6.0
+        assert histogram.average == pytest.approx(1.5675)
+        assert histogram.percentile(0) == 0.03
+        assert histogram.percentile(100) == 6.0
+
+        buckets = histogram.buckets()
+        assert buckets['<=50'] == 2
+        assert buckets['<=250'] == 1
+        assert buckets['>5000'] == 1
+        assert sum(buckets.values()) == 4
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(size=0)
+
+
+class TestKeepAlive:
+    def test_latency(self):
+        ws = FakeWebSocket()
+        keep_alive = KeepAlive(ws, max_missed_heartbeats=2)
+
+        async def run():
+            await keep_alive._heartbeat_and_sleep()
+            assert ws.pings == [b'1']
+
+            # Pongs of other pings are ignored
+            keep_alive.received_ack(b'0')
+            assert keep_alive.latency is None
+
+            keep_alive.received_ack(b'1')
+            assert keep_alive.latency >= 0
+            assert len(keep_alive.histogram) == 1
+            assert keep_alive.missed_heartbeats == 0
+
+        asyncio.run(run())
+
+    def test_missed_heartbeats(self):
+        ws = FakeWebSocket()
+        keep_alive = KeepAlive(ws, max_missed_heartbeats=2)
+
+        async def run():
+            for _ in range(3):
+                await keep_alive._heartbeat_and_sleep()
+
+            assert keep_alive.missed_heartbeats == 2
+            assert keep_alive.should_restart()
+            assert len(ws.pings) == 2
+            assert ws.socket.closed
+            assert ws._open is False
+
+        asyncio.run(run())
+
+    def test_max_latency(self):
+        ws = FakeWebSocket()
+        keep_alive = KeepAlive(ws, max_latency=0, max_missed_heartbeats=1)
+
+        async def run():
+            await keep_alive._heartbeat_and_sleep()
+            keep_alive.received_ack()
+            assert keep_alive.should_restart()
+
+        asyncio.run(run())
@@ -1,4 +1,5 @@
 import asyncio
+from types import SimpleNamespace
 
 import openhivenpy
 from openhivenpy.gateway import Connection
@@ -29,6 +30,26 @@ class TestDynamicEventBuffer:
         assert data['args'] == ()
         assert data['kwargs'] == {}
 
+    def test_fetch_next_event(self):
+        buffer = openhivenpy.gateway.DynamicEventBuffer("ready")
+
+        async def add_later():
+            await asyncio.sleep(.05)
+            buffer.add_new_event({'test': 1})
+            buffer.add_new_event({'test': 2})
+
+        async def run():
+            task = asyncio.create_task(add_later())
+            first = await asyncio.wait_for(buffer.fetch_next_event(), 1)
+            second = await asyncio.wait_for(buffer.fetch_next_event(), 1)
+            await task
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first['data'] == {'test': 1}
+        assert second['data'] == {'test': 2}
+        assert len(buffer) == 0
+
 
 class TestMessageBroker:
     async def call(self, *args, **kwargs):
@@ -66,6 +87,43 @@ class TestMessageBroker:
     def test_run(self):
         asyncio.run(self.run())
 
+    async def run_lazy_workers(self):
+        client = openhivenpy.HivenClient()
+        message_broker = openhivenpy.gateway.MessageBroker(client)
+        workers = message_broker.event_consumer.workers
+        received = []
+
+        async def on_message_create(*args, **kwargs):
+            received.append(args)
+
+        async def test():
+            await asyncio.sleep(.1)
+            # No listeners => no workers
+            assert workers == {}
+
+            listener = client.add_multi_listener(
+                'message_create', on_message_create
+            )
+            assert list(workers.keys()) == ['message_create']
+
+            client.dispatch_event('message_create', ('test',), {})
+            await asyncio.sleep(.1)
+            assert received == [('test',)]
+
+            client.remove_listener(listener)
+            await asyncio.sleep(.6)
+            assert workers == {}
+
+            client.connection._closing = True
+
+        client._connection = Connection(client=client)
+        client.connection._connection_status = "OPEN"
+        client.connection._ws = SimpleNamespace(message_broker=message_broker)
+        await asyncio.gather(message_broker.run(), asyncio.wait_for(test(), 3))
+
+    def test_lazy_workers(self):
+        asyncio.run(self.run_lazy_workers())
+
 
 class TestWorker:
     def test_init(self):
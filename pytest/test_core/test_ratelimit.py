@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+from openhivenpy.gateway import (RateLimitBucket, RateLimitManager,
+                                 get_route_template)
+
+
+class TestRateLimit:
+    def test_route_template(self):
+        assert get_route_template('/rooms/1234/messages') == \
+               '/rooms/{id}/messages'
+        assert get_route_template('/houses/12/rooms/34?limit=5') == \
+               '/houses/{id}/rooms/{id}'
+        assert get_route_template('/users/@me') == '/users/@me'
+
+    def test_shared_bucket(self):
+        manager = RateLimitManager()
+        bucket = manager.get_bucket('/rooms/1/messages')
+        assert manager.get_bucket('/rooms/2/messages') is bucket
+        assert manager.get_bucket('/rooms/1/typing') is not bucket
+
+    def test_update(self):
+        bucket = RateLimitBucket('/rooms/{id}/messages')
+        bucket.update({
+            'X-RateLimit-Limit': '5',
+            'X-RateLimit-Remaining': '3',
+            'X-RateLimit-Reset-After': '1.5'
+        })
+        assert bucket.limit == 5
+        assert bucket.remaining == 3
+        assert bucket.reset_at > time.time()
+
+        # Responses without headers do not change the budget
+        bucket.update({})
+        assert bucket.remaining == 3
+
+    def test_throttling(self):
+        async def run():
+            bucket = RateLimitBucket('/rooms/{id}/messages')
+            bucket.update({
+                'X-RateLimit-Limit': '2',
+                'X-RateLimit-Remaining': '2',
+                'X-RateLimit-Reset-After': '0.2'
+            })
+
+            start = time.time()
+            # Two requests fit into the budget, the third one is delayed
+            await bucket.acquire()
+            await bucket.acquire()
+            assert bucket.remaining == 0
+            assert time.time() - start < 0.1
+
+            await bucket.acquire()
+            assert time.time() - start >= 0.15
+            assert bucket.remaining == 1
+
+        asyncio.run(run())
+
+    def test_limit_until(self):
+        async def run():
+            bucket = RateLimitBucket('/rooms/{id}/messages')
+            bucket.limit_until(time.time() + 0.2)
+
+            start = time.time()
+            await asyncio.gather(bucket.acquire(), bucket.acquire())
+            assert time.time() - start >= 0.15
+            # The budget is unknown after the reset
+            assert bucket.remaining is None
+
+        asyncio.run(run())
+
+    def test_exhausted_without_reset(self):
+        async def run():
+            bucket = RateLimitBucket('/rooms/{id}/messages')
+            # Without a reset time the bucket cannot be released, so the
+            # budget is treated as unknown
+            bucket.update({'X-RateLimit-Remaining': '0'})
+            assert bucket.remaining is None
+            assert bucket.reset_at is None
+            await asyncio.wait_for(bucket.acquire(), timeout=1)
+
+        asyncio.run(run())
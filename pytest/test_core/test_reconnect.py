@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+
+import openhivenpy
+from openhivenpy.gateway import Connection, ReconnectPolicy
+
+
+class FakeWebSocket:
+    close_code = 4000
+
+
+class TestReconnectPolicy:
+    def test_exponential_delay(self):
+        policy = ReconnectPolicy(
+            base_delay=1, max_delay=10, jitter=False, max_failures=None
+        )
+        assert [policy.get_delay(i) for i in range(1, 6)] == [1, 2, 4, 8, 10]
+        assert policy.get_delay(10000) == 10
+        assert not policy.circuit_open(10000)
+
+    def test_jitter(self):
+        policy = ReconnectPolicy(base_delay=1, max_delay=10, cooldown=100,
+                                 max_failures=5)
+        for _ in range(100):
+            assert 0 <= policy.get_delay(3) <= 4
+            assert 50 <= policy.get_delay(5) <= 100
+
+    def test_circuit_breaker(self):
+        policy = ReconnectPolicy(jitter=False, max_failures=3, cooldown=30)
+        assert not policy.circuit_open(2)
+        assert policy.circuit_open(3)
+        assert policy.get_delay(3) == 30
+
+        policy = ReconnectPolicy(max_failures=3, cooldown=None)
+        assert policy.get_delay(3) is None
+
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            ReconnectPolicy(base_delay=-1)
+        with pytest.raises(ValueError):
+            ReconnectPolicy(factor=0.5)
+        with pytest.raises(ValueError):
+            ReconnectPolicy(max_failures=0)
+
+
+class TestConnectionStats:
+    def create_connection(self, **kwargs) -> Connection:
+        policy = ReconnectPolicy(base_delay=0.01, jitter=False, **kwargs)
+        client = openhivenpy.HivenClient(reconnect_policy=policy)
+        assert client.reconnect_policy is policy
+        return Connection(client)
+
+    def test_stats(self):
+        connection = self.create_connection()
+        assert connection.stats['attempts'] == 0
+
+        connection._start_attempt()
+        connection._on_ready()
+        stats = connection.stats
+        assert stats['attempts'] == 1
+        assert stats['reconnects'] == 0
+        assert len(stats['ready_times']) == 1
+        assert stats['uptime'] >= 0
+
+        connection._ws = FakeWebSocket()
+        connection._end_attempt()
+        connection._start_attempt()
+        stats = connection.stats
+        assert stats['reconnects'] == 1
+        # The ended session was ready, so it does not count as failed
+        assert stats['failures'] == 0
+        assert stats['uptime'] == 0.0
+        assert stats['last_close_code'] == 4000
+
+        connection._end_attempt()
+        assert connection.stats['failures'] == 1
+
+    def test_wait_before_reconnect(self):
+        connection = self.create_connection(max_failures=2, cooldown=None)
+        connection._connection_status = "OPENING"
+
+        async def run():
+            connection._end_attempt()
+            start = time.time()
+            await connection._wait_before_reconnect()
+            assert time.time() - start >= 0.01
+
+            connection._end_attempt()
+            assert connection.stats['circuit_open']
+            with pytest.raises(openhivenpy.SessionCreateError):
+                await connection._wait_before_reconnect()
+
+        asyncio.run(run())
+
+    def test_closing_stops_waiting(self):
+        connection = self.create_connection(max_failures=1, cooldown=60)
+        connection._connection_status = "CLOSING"
+        connection._end_attempt()
+
+        async def run():
+            await asyncio.wait_for(connection._wait_before_reconnect(), 1)
+
+        asyncio.run(run())
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from openhivenpy import MessageSendQueue
+
+
+class RecordingQueue(MessageSendQueue):
+    """ Queue that records the sent messages instead of using the HTTP """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = []
+        self.running = 0
+        self.max_running = 0
+
+    async def _send(self, room_id: str, content: str):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+
+        if content == 'fail':
+            raise ValueError("Failed to send message")
+        self.sent.append((room_id, content))
+        return f"{room_id}:{content}"
+
+
+class TestMessageSendQueue:
+    def test_order_and_concurrency(self):
+        async def run():
+            queue = RecordingQueue(None, concurrency=2)
+            futures = [
+                queue.put(str(room), str(i))
+                for i in range(3) for room in range(4)
+            ]
+            assert queue.pending == 12
+
+            results = await asyncio.gather(*futures)
+            assert results[0] == "0:0"
+            assert queue.pending == 0
+            assert queue.max_running == 2
+
+            for room in range(4):
+                contents = [c for r, c in queue.sent if r == str(room)]
+                assert contents == ['0', '1', '2']
+
+        asyncio.run(run())
+
+    def test_rooms_interleaved(self):
+        async def run():
+            queue = RecordingQueue(None, concurrency=1)
+            futures = [queue.put('1', str(i)) for i in range(5)]
+            futures.append(queue.put('2', '0'))
+            await asyncio.gather(*futures)
+
+            # The semaphore is released after every message, so the second
+            # room does not wait until the first one is empty
+            assert queue.sent.index(('2', '0')) < len(queue.sent) - 1
+
+        asyncio.run(run())
+
+    def test_force_close_waiting_rooms(self):
+        async def run():
+            queue = RecordingQueue(None, concurrency=1)
+            futures = [queue.put('1', '0'), queue.put('2', '0')]
+            await asyncio.sleep(0)
+            # The second room is still waiting for the semaphore
+            await asyncio.wait_for(queue.close(force=True), 1)
+
+            assert all(f.cancelled() for f in futures)
+            assert queue.pending == 0
+
+        asyncio.run(run())
+
+    def test_exception(self):
+        async def run():
+            queue = RecordingQueue(None)
+            failed = queue.put('1', 'fail')
+            sent = queue.put('1', 'test')
+
+            with pytest.raises(ValueError):
+                await failed
+            assert await sent == "1:test"
+
+        asyncio.run(run())
+
+    def test_force_close(self):
+        async def run():
+            queue = RecordingQueue(None, concurrency=1)
+            futures = [queue.put('1', str(i)) for i in range(5)]
+            await asyncio.sleep(0)
+            await queue.close(force=True)
+
+            assert all(f.cancelled() for f in futures)
+            assert queue.pending == 0
+
+        asyncio.run(run())
@@ -0,0 +1,88 @@
+from copy import deepcopy
+
+import openhivenpy
+from openhivenpy.client import SQLiteClientCache
+from openhivenpy.client.sqlite_cache import SQLiteTable
+import test_cache
+
+
+class TestSQLiteCache:
+    test_house_args = test_cache.TestCache.test_house_args
+
+    def test_init(self, tmp_path):
+        client = openhivenpy.HivenClient(
+            cache_database=str(tmp_path / 'cache.db')
+        )
+        cache = client.storage
+        assert isinstance(cache, SQLiteClientCache)
+        assert isinstance(cache['users'], SQLiteTable)
+        assert cache['users'] == {}
+        assert cache['houses'] == {}
+
+    def test_front_cache(self, tmp_path):
+        client = openhivenpy.HivenClient()
+        cache = SQLiteClientCache(
+            client, str(tmp_path / 'cache.db'), front_size=2
+        )
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        for i in range(5):
+            cache.add_or_update_user(
+                {'id': str(i), 'username': f'u{i}', 'name': f'U{i}'}
+            )
+        cache.commit()
+
+        users = cache['users']
+        assert len(users) == 6
+        assert len(users._front) == 2
+        assert users['0']['name'] == 'U0'
+
+        # Updates of entries loaded from the database are written back
+        users['1']['name'] = 'Changed'
+        for i in range(2, 5):
+            assert users[str(i)]
+        cache.commit()
+        assert cache.store.read('users', '1')['name'] == 'Changed'
+
+        del users['1']
+        assert '1' not in users
+        assert len(users) == 5
+
+    def test_add_house(self, tmp_path):
+        data = deepcopy(self.test_house_args)
+        client = openhivenpy.HivenClient(
+            cache_database=str(tmp_path / 'cache.db')
+        )
+        cache = client.storage
+        client_user = cache.update_client_user(
+            dict(data['members'][0]['user'])
+        )
+        cache.add_or_update_house(deepcopy(data))
+        cache.commit()
+
+        house = cache['houses'][data['id']]
+        assert isinstance(house['members'], SQLiteTable)
+        assert house['client_member'] is house['members'][client_user['id']]
+        assert cache.lookup_house_member(client_user['id'], data['id'])
+        assert cache.get_user_house_ids(client_user['id']) == [data['id']]
+
+        cache.remove_house(data['id'])
+        assert cache.store.count(f"members:{data['id']}") == 0
+        assert data['id'] not in cache['houses']
+
+    def test_snapshot(self, tmp_path):
+        client = openhivenpy.HivenClient(
+            cache_database=str(tmp_path / 'cache.db')
+        )
+        cache = client.storage
+        cache.update_client_user(
+            deepcopy(self.test_house_args['members'][0]['user'])
+        )
+        cache.add_or_update_user({'id': '1', 'username': 'a', 'name': 'A'})
+        snapshot = cache.to_snapshot()
+
+        new_client = openhivenpy.HivenClient(cache_database=':memory:')
+        new_client.storage.load_snapshot_data(snapshot)
+        assert isinstance(new_client.storage['users'], SQLiteTable)
+        assert new_client.get_user('1').name == 'A'
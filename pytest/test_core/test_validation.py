@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+import openhivenpy
+from openhivenpy import types
+from openhivenpy.validation import (ValidationPolicy, get_validation_policy,
+                                    set_validation_policy,
+                                    current_validation_policy,
+                                    use_validation_policy)
+
+user_data = {
+    "username": "username",
+    "name": "name",
+    "id": "323456789123456789",
+    "bot": False
+}
+
+message_data = {
+    "id": "184828177845489664",
+    "author_id": "323456789123456789",
+    "room_id": "213456789123456789",
+    "house_id": "123456789123456789",
+    "content": "Hello there! :)",
+    "timestamp": 1618250574000,
+    "mentions": [],
+    "bucket": 0,
+    "device_id": "178648219307229057"
+}
+
+
+class TestValidationPolicy:
+    def teardown_method(self):
+        set_validation_policy('always')
+
+    def test_get_validation_policy(self):
+        assert get_validation_policy().mode == 'always'
+        assert get_validation_policy('never').mode == 'never'
+        policy = get_validation_policy('sample:0.25')
+        assert policy.mode == 'sample'
+        assert policy.sample_rate == 0.25
+
+        policy = ValidationPolicy('on_error')
+        assert get_validation_policy(policy) is policy
+        assert policy.validate_on_error
+
+        for invalid in ('unknown', 'never:0.5', 'sample:0', 'sample:2'):
+            with pytest.raises(ValueError):
+                get_validation_policy(invalid)
+
+    def test_client_policy(self):
+        client = openhivenpy.HivenClient(validation_policy='never')
+        assert client.validation_policy.mode == 'never'
+        # The default policy of the process is not changed by the client
+        assert current_validation_policy().mode == 'always'
+        assert openhivenpy.HivenClient().validation_policy.mode == 'always'
+
+        with use_validation_policy(client.validation_policy):
+            assert current_validation_policy() is client.validation_policy
+            data = types.User.format_obj_data({**user_data, 'username': 1})
+            assert data['username'] == 1
+        assert current_validation_policy().mode == 'always'
+
+    def test_client_policy_dispatch(self):
+        async def run():
+            client = openhivenpy.HivenClient(validation_policy='never')
+            client.storage.update_client_user(dict(user_data))
+            # Invalid data is accepted, since the client does not validate
+            await client.parsers.dispatch(
+                'USER_UPDATE', {**user_data, 'bio': 1}
+            )
+            assert client.storage['users'][user_data['id']]['bio'] == 1
+
+        asyncio.run(run())
+
+    def test_never(self):
+        set_validation_policy('never')
+        data = types.User.format_obj_data({**user_data, 'username': 1})
+        assert data['username'] == 1
+        # The defaults of the schema are still applied
+        assert 'bio' in data and data['bio'] is None
+
+    def test_always(self):
+        with pytest.raises(Exception):
+            types.User.format_obj_data({**user_data, 'username': 1})
+
+        set_validation_policy(ValidationPolicy('sample', sample_rate=1))
+        with pytest.raises(Exception):
+            types.User.format_obj_data({**user_data, 'username': 1})
+
+    def test_on_error(self):
+        set_validation_policy('on_error')
+        data = types.Message.format_obj_data(dict(message_data))
+        assert data['author'] == message_data['author_id']
+
+        invalid = dict(message_data)
+        del invalid['author_id']
+        set_validation_policy('never')
+        with pytest.raises(KeyError):
+            types.Message.format_obj_data(dict(invalid))
+
+        # The data is validated after formatting failed, which raises the
+        # validation error instead
+        set_validation_policy('on_error')
+        with pytest.raises(Exception) as exc_info:
+            types.Message.format_obj_data(dict(invalid))
+        assert exc_info.type is not KeyError
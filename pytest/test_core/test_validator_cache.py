@@ -0,0 +1,53 @@
+import fastjsonschema
+import pytest
+
+from openhivenpy.types import hiven_type_schemas
+from openhivenpy.types.hiven_type_schemas import (LazyValidator,
+                                                   get_compiled_validator)
+
+schema = hiven_type_schemas.UserSchema
+user_data = {
+    "username": "username",
+    "name": "name",
+    "id": "323456789123456789",
+    "bot": False
+}
+
+
+class TestValidatorCache:
+    def test_lazy_compilation(self, monkeypatch):
+        monkeypatch.delenv('HIVEN_VALIDATOR_CACHE', raising=False)
+        validator = get_compiled_validator(schema)
+        assert isinstance(validator, LazyValidator)
+        assert not validator.compiled
+
+        data = validator(dict(user_data))
+        assert validator.compiled
+        assert data == fastjsonschema.compile(schema)(dict(user_data))
+
+        with pytest.raises(fastjsonschema.JsonSchemaException):
+            validator({**user_data, 'username': 1})
+
+    def test_disk_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('HIVEN_VALIDATOR_CACHE', str(tmp_path / 'cache'))
+        expected = LazyValidator(schema)(dict(user_data))
+        assert len(list((tmp_path / 'cache').iterdir())) == 1
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("The cached validator was not used")
+
+        monkeypatch.setattr(fastjsonschema, 'compile_to_code', _fail)
+        validator = LazyValidator(schema)
+        assert validator(dict(user_data)) == expected
+        with pytest.raises(fastjsonschema.JsonSchemaException):
+            validator({**user_data, 'username': 1})
+
+    def test_invalid_cache_file(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('HIVEN_VALIDATOR_CACHE', str(tmp_path))
+        LazyValidator(schema).compile()
+        path = next(tmp_path.iterdir())
+        path.write_bytes(b'invalid')
+
+        validator = LazyValidator(schema)
+        assert validator(dict(user_data))['username'] == 'username'
+        assert path.read_bytes() != b'invalid'
@@ -0,0 +1,334 @@
+import asyncio
+import json
+import time
+from copy import deepcopy
+
+import aiohttp
+import pytest
+
+import openhivenpy
+from openhivenpy.gateway import (Connection, HivenWebSocket, KeepAlive,
+                                 get_transport_compression)
+import test_cache
+import test_compression
+
+
+class FakeSocket:
+    """ Socket returning the passed messages """
+    def __init__(self, messages=()):
+        self.messages = list(messages)
+        self.pongs = []
+
+    async def receive(self) -> aiohttp.WSMessage:
+        return self.messages.pop(0)
+
+    async def pong(self, data: bytes) -> None:
+        self.pongs.append(data)
+
+
+def frame(event: str, data: dict) -> dict:
+    return {'op': HivenWebSocket.OPCode.EVENT, 'e': event, 'd': data}
+
+
+def text_message(msg: dict) -> aiohttp.WSMessage:
+    return aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, json.dumps(msg), None)
+
+
+class TestWebSocket:
+    house_data = test_cache.TestCache.test_house_args
+
+    def create_websocket(self, messages=(), forward=False, **kwargs):
+        """
+        Creates a client and a websocket using a fake socket. If forward is
+        set, the recorded events are passed on to the parsers
+        """
+        client = openhivenpy.HivenClient(**kwargs)
+        client._connection = Connection(client)
+        ws = self.restart_websocket(client, messages)
+
+        dispatched = []
+        parser_dispatch = client.parsers.dispatch
+
+        async def dispatch(event, data):
+            dispatched.append((event, deepcopy(data)))
+            if forward:
+                await parser_dispatch(event, data)
+
+        client.parsers.dispatch = dispatch
+        return client, ws, dispatched
+
+    @staticmethod
+    def restart_websocket(client, messages=()) -> HivenWebSocket:
+        """ Replaces the websocket of the connection like a restart """
+        ws = HivenWebSocket(FakeSocket(messages), loop=None)
+        ws._client = client
+        ws._parsers = client.parsers
+        ws._json_codec = client.json_codec
+        ws._connection_start = time.time()
+        client.connection._ws = ws
+        return ws
+
+    def init_state(self) -> dict:
+        return frame('INIT_STATE', {
+            'user': deepcopy(self.house_data['members'][0]['user']),
+            'house_ids': [self.house_data['id']],
+            'house_memberships': {self.house_data['id']: {}}
+        })
+
+    def test_blocking_init(self):
+        house_id = self.house_data['id']
+        room_update = frame('ROOM_UPDATE', {'house_id': house_id, 'id': '1'})
+
+        async def run():
+            client, ws, dispatched = self.create_websocket([
+                text_message(room_update),
+                text_message(frame('HOUSE_JOIN', deepcopy(self.house_data)))
+            ])
+            await ws._received_message(self.init_state())
+
+            assert ws.ready
+            assert client.find_house(house_id) is not None
+            assert dispatched == [('ROOM_UPDATE', room_update['d'])]
+            assert (await client.wait_house(house_id)).id == house_id
+
+        asyncio.run(run())
+
+    def test_early_ready(self):
+        house_id = self.house_data['id']
+        room_update = frame('ROOM_UPDATE', {'house_id': house_id, 'id': '1'})
+        private_msg = frame('MESSAGE_CREATE', {'house_id': None, 'id': '2'})
+
+        async def run():
+            client, ws, dispatched = self.create_websocket(early_ready=True)
+            await ws._received_message(self.init_state())
+
+            assert ws.ready
+            assert client.pending_house_ids == [house_id]
+            assert client.find_house(house_id) is None
+
+            waiter = asyncio.ensure_future(client.wait_house(house_id))
+            await ws._received_message(deepcopy(room_update))
+            await ws._received_message(deepcopy(private_msg))
+            # The events of the pending house are delayed
+            assert dispatched == [('MESSAGE_CREATE', private_msg['d'])]
+            assert not waiter.done()
+
+            await ws._received_message(
+                frame('HOUSE_JOIN', deepcopy(self.house_data))
+            )
+            house = await asyncio.wait_for(waiter, 1)
+            assert house.id == house_id
+            assert client.pending_house_ids == []
+            assert dispatched[1] == ('ROOM_UPDATE', room_update['d'])
+
+        asyncio.run(run())
+
+    def test_early_ready_listener_waits_house(self):
+        house_id = self.house_data['id']
+
+        async def run():
+            client, ws, _ = self.create_websocket(
+                [text_message(frame('HOUSE_JOIN', deepcopy(self.house_data)))],
+                forward=True, early_ready=True
+            )
+            loaded = []
+
+            @client.event()
+            async def on_ready():
+                loaded.append(await client.wait_house(house_id))
+
+            # The ready listener is called in the background, so the
+            # HOUSE_JOIN it waits for can still be received
+            await asyncio.wait_for(
+                ws._received_message(self.init_state()), 1
+            )
+            await asyncio.wait_for(ws.wait_for_event(), 1)
+            await asyncio.wait_for(ws._ready_task, 1)
+            assert [h.id for h in loaded] == [house_id]
+
+        asyncio.run(run())
+
+    def test_wait_house_timeout(self):
+        async def run():
+            client, ws, _ = self.create_websocket(early_ready=True)
+            await ws._received_message(self.init_state())
+            with pytest.raises(asyncio.TimeoutError):
+                await client.wait_house(self.house_data['id'], timeout=0.01)
+
+        asyncio.run(run())
+
+    def test_close_code(self):
+        close = aiohttp.WSMessage(aiohttp.WSMsgType.CLOSE, 4000, 'restart')
+
+        async def run():
+            client, ws, _ = self.create_websocket([close])
+            with pytest.raises(openhivenpy.RestartSessionError):
+                await ws.wait_for_event()
+            assert ws.close_code == 4000
+
+        asyncio.run(run())
+
+    def test_ping_pong(self):
+        msg = frame('MESSAGE_CREATE', {'house_id': None, 'id': '1'})
+
+        async def run():
+            client, ws, dispatched = self.create_websocket([
+                aiohttp.WSMessage(aiohttp.WSMsgType.PING, b'ping', None),
+                aiohttp.WSMessage(aiohttp.WSMsgType.PONG, b'1', None),
+                text_message(msg)
+            ])
+            ws._heartbeat = 1
+            ws._keep_alive = KeepAlive(ws)
+            ws._keep_alive._sequence = 1
+            ws._keep_alive._sent_at = time.perf_counter()
+
+            await ws.wait_for_event()
+            assert ws.socket.pongs == [b'ping']
+            assert dispatched == [('MESSAGE_CREATE', msg['d'])]
+            assert client.latency is not None
+
+        asyncio.run(run())
+
+    def test_compressed_init(self):
+        house_id = self.house_data['id']
+        private_msg = frame('MESSAGE_CREATE', {'house_id': None, 'id': '2'})
+        frames = test_compression.record_zlib_frames([
+            self.init_state(),
+            frame('HOUSE_JOIN', deepcopy(self.house_data)),
+            private_msg
+        ], split=2)
+
+        async def run():
+            client, ws, dispatched = self.create_websocket([
+                aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, data, None)
+                for data in frames
+            ])
+            ws._compression = get_transport_compression('zlib_json')
+
+            # The first message is split over two frames
+            await ws.wait_for_event()
+            assert not ws.ready
+            await ws.wait_for_event()
+            assert ws.ready
+            assert client.find_house(house_id) is not None
+
+            while ws.socket.messages:
+                await ws.wait_for_event()
+            assert dispatched == [('MESSAGE_CREATE', private_msg['d'])]
+
+        asyncio.run(run())
+
+    def house_with_members(self) -> dict:
+        house = deepcopy(self.house_data)
+        member = deepcopy(house['members'][0])
+        member['user_id'] = member['user']['id'] = '1'
+        member['user']['username'] = member['user']['name'] = 'other'
+        house['members'].append(member)
+        return house
+
+    def test_reconnect_unchanged(self):
+        house = self.house_with_members()
+
+        async def run():
+            client, ws, dispatched = self.create_websocket(
+                [text_message(frame('HOUSE_JOIN', deepcopy(house)))],
+                forward=True
+            )
+            await ws._received_message(self.init_state())
+            cached = client.get_house(house['id'])
+
+            ws = self.restart_websocket(
+                client, [text_message(frame('HOUSE_JOIN', deepcopy(house)))]
+            )
+            await ws._received_message(self.init_state())
+
+            assert ws.ready
+            assert dispatched == []
+            assert client.get_house(house['id']) is cached
+            assert client.connection.house_reconciler.stats == {
+                'loaded': 1, 'unchanged': 1, 'reconciled': 0,
+                'synthetic_events': 0
+            }
+
+        asyncio.run(run())
+
+    def test_reconnect_changes(self):
+        house = self.house_with_members()
+        room_id = house['rooms'][0]['id']
+        client_id = house['members'][0]['user_id']
+
+        changed = deepcopy(house)
+        changed['rooms'][0]['name'] = 'Renamed'
+        changed['members'][0]['user']['name'] = 'Renamed'
+        del changed['members'][1]
+
+        async def run():
+            client, ws, dispatched = self.create_websocket(
+                [text_message(frame('HOUSE_JOIN', deepcopy(house)))],
+                forward=True
+            )
+            await ws._received_message(self.init_state())
+            room = client.get_room(room_id)
+            assert client.get_house_member('1', house['id']) is not None
+
+            ws = self.restart_websocket(
+                client, [text_message(frame('HOUSE_JOIN', deepcopy(changed)))]
+            )
+            await ws._received_message(self.init_state())
+
+            assert [e for e, _ in dispatched] == [
+                'ROOM_UPDATE', 'HOUSE_MEMBER_UPDATE', 'HOUSE_MEMBER_LEAVE'
+            ]
+            assert room.name == 'Renamed'
+            assert client.get_user(client_id).name == 'Renamed'
+            assert client.get_house_member('1', house['id']) is None
+            assert client.connection.house_reconciler.stats['reconciled'] == 1
+
+        asyncio.run(run())
+
+    def test_reconnect_left_house(self):
+        house = self.house_with_members()
+
+        async def run():
+            client, ws, dispatched = self.create_websocket(
+                [text_message(frame('HOUSE_JOIN', deepcopy(house)))],
+                forward=True
+            )
+            await ws._received_message(self.init_state())
+
+            init_state = self.init_state()
+            init_state['d']['house_ids'] = []
+            init_state['d']['house_memberships'] = {}
+            ws = self.restart_websocket(client)
+            await ws._received_message(init_state)
+
+            assert ws.ready
+            assert dispatched == [('HOUSE_LEAVE', {'house_id': house['id']})]
+            assert client.find_house(house['id']) is None
+
+        asyncio.run(run())
+
+    def test_reconnect_after_event(self):
+        house = self.house_with_members()
+        room = deepcopy(house['rooms'][0])
+        room['name'] = 'Renamed'
+
+        async def run():
+            client, ws, dispatched = self.create_websocket(
+                [text_message(frame('HOUSE_JOIN', deepcopy(house)))],
+                forward=True
+            )
+            await ws._received_message(self.init_state())
+            await ws._received_message(frame('ROOM_UPDATE', room))
+
+            # The update was reverted while the websocket restarted, which
+            # can only be detected using the full data of the house
+            ws = self.restart_websocket(
+                client, [text_message(frame('HOUSE_JOIN', deepcopy(house)))]
+            )
+            await ws._received_message(self.init_state())
+
+            assert client.get_room(room['id']).name == house['rooms'][0]['name']
+            assert client.connection.house_reconciler.stats['loaded'] == 2
+
+        asyncio.run(run())
@@ -0,0 +1,70 @@
+from copy import deepcopy
+
+import pytest
+
+import openhivenpy
+from openhivenpy import types
+
+client = openhivenpy.HivenClient()
+
+message_data = {
+    "id": "184828177845489664",
+    "author_id": "323456789123456789",
+    "room_id": "213456789123456789",
+    "house_id": "123456789123456789",
+    "content": "Hello there! :)",
+    "timestamp": "1618250574000",
+    "mentions": [],
+    "attachment": None,
+    "embed": None,
+    "bucket": 0,
+    "device_id": 178648219307229057,
+    "exploding": None,
+    "exploding_age": None,
+    "author": {
+        "username": "username",
+        "name": "name",
+        "id": "323456789123456789"
+    }
+}
+
+
+class TestLazyObjects:
+    def test_lazy_fields(self):
+        msg = types.Message.lazy(deepcopy(message_data), client)
+        assert not msg.resolved
+        assert msg.id == message_data['id']
+        assert msg.content == message_data['content']
+        assert msg.room_id == message_data['room_id']
+        assert msg.device_id == str(message_data['device_id'])
+        assert msg.timestamp.year == 2021
+        assert not msg.resolved
+
+    def test_resolve_on_access(self):
+        msg = types.Message.lazy(deepcopy(message_data), client)
+        assert msg.mentions == []
+        assert msg.resolved
+        assert msg.id == message_data['id']
+        assert msg.content == message_data['content']
+
+        eager = types.Message(
+            types.Message.format_obj_data(deepcopy(message_data)), client
+        )
+        assert repr(msg) == repr(eager)
+
+    def test_validation_on_access(self):
+        data = deepcopy(message_data)
+        data['timestamp'] = "invalid"
+        msg = types.Message.lazy(data, client)
+        assert msg.id == message_data['id']
+        with pytest.raises(ValueError):
+            _ = msg.timestamp
+
+    def test_eager_instances(self):
+        msg = types.Message(
+            types.Message.format_obj_data(deepcopy(message_data)), client
+        )
+        assert msg.resolved
+        with pytest.raises(AttributeError):
+            _ = msg.unknown_attribute
+        assert getattr(msg, '_unknown', None) is None
@@ -0,0 +1,36 @@
+import inspect
+
+import pytest
+
+import openhivenpy
+from openhivenpy import types
+from openhivenpy.base_types import DataClassObject
+
+client = openhivenpy.HivenClient()
+
+
+class TestSlots:
+    def test_all_types_use_slots(self):
+        for name, cls in inspect.getmembers(types, inspect.isclass):
+            if issubclass(cls, DataClassObject):
+                for klass in cls.__mro__[:-1]:
+                    if klass.__module__.startswith('openhivenpy'):
+                        assert '__slots__' in klass.__dict__, klass
+
+    def test_no_instance_dict(self):
+        user = types.User({
+            "username": "username",
+            "name": "name",
+            "id": "323456789123456789",
+            "bot": False
+        }, client)
+        assert not hasattr(user, '__dict__')
+        with pytest.raises(AttributeError):
+            user.unknown_attribute = True
+
+        assert repr(user).startswith('<User username=username name=name')
+        assert DataClassObject.__repr__(user).startswith(
+            '<User username=username name=name'
+        )
+        assert 'client' not in DataClassObject.__repr__(user)
+        assert user.json_schema is types.User._json_schema